@@ -0,0 +1,175 @@
+from typing import Dict, Iterable, List, Optional, Sequence
+
+import numpy as np
+
+from models.vacancy import Vacancy
+from models.vacancy_table import MISSING, VacancyTable
+
+SALARY_FIELDS = ("from", "to", "mid")
+
+
+class SalaryArrays:
+    """
+    Зарплаты набора вакансий в виде массивов NumPy.
+
+    salary_from / salary_to — float64, отсутствующая граница хранится как NaN;
+    currency_codes — индексы в списке currencies (код 0 — валюта не указана);
+    missing — маска вакансий без зарплаты вовсе. Индексы элементов
+    совпадают с порядком исходной коллекции.
+    """
+
+    def __init__(self, salary_from: np.ndarray, salary_to: np.ndarray,
+                 currency_codes: np.ndarray, currencies: List[Optional[str]]):
+        self.salary_from = salary_from
+        self.salary_to = salary_to
+        self.currency_codes = currency_codes
+        self.currencies = currencies
+        self.missing = np.isnan(salary_from) & np.isnan(salary_to)
+
+    def __len__(self) -> int:
+        return len(self.salary_from)
+
+    @classmethod
+    def _build(cls, rows: Iterable[tuple]) -> "SalaryArrays":
+        currencies: List[Optional[str]] = [None]
+        index: Dict[Optional[str], int] = {None: 0}
+        lower, upper, codes = [], [], []
+        for salary_from, salary_to, currency in rows:
+            code = index.get(currency)
+            if code is None:
+                code = index[currency] = len(currencies)
+                currencies.append(currency)
+            lower.append(np.nan if salary_from is None else salary_from)
+            upper.append(np.nan if salary_to is None else salary_to)
+            codes.append(code)
+        return cls(
+            np.asarray(lower, dtype=np.float64),
+            np.asarray(upper, dtype=np.float64),
+            np.asarray(codes, dtype=np.int32),
+            currencies
+        )
+
+    @classmethod
+    def from_vacancies(cls, vacancies: Iterable[Vacancy]) -> "SalaryArrays":
+        return cls._build((v.salary_from, v.salary_to, v.currency) for v in vacancies)
+
+    @classmethod
+    def from_hh_items(cls, items: Iterable[Dict]) -> "SalaryArrays":
+        """Построить массивы прямо из сырых элементов ответа hh.ru."""
+        def rows():
+            for item in items:
+                salary = item.get("salary") or {}
+                yield salary.get("from"), salary.get("to"), salary.get("currency")
+        return cls._build(rows())
+
+    @classmethod
+    def from_table(cls, table: VacancyTable) -> "SalaryArrays":
+        """Построить массивы из VacancyTable без создания объектов Vacancy."""
+        lower = np.frombuffer(table.salary_from, dtype=np.int64).astype(np.float64)
+        upper = np.frombuffer(table.salary_to, dtype=np.int64).astype(np.float64)
+        lower[lower == MISSING] = np.nan
+        upper[upper == MISSING] = np.nan
+        codes = np.frombuffer(table.currency_codes, dtype=np.uint16).astype(np.int32)
+        return cls(lower, upper, codes, list(table.currencies))
+
+    def values(self, by: str = "from") -> np.ndarray:
+        """
+        Значение зарплаты для сравнения.
+
+        Args:
+            by: "from" — нижняя граница, "to" — верхняя,
+                "mid" — середина вилки (или единственная указанная граница)
+        """
+        if by == "from":
+            return self.salary_from
+        if by == "to":
+            return self.salary_to
+        if by == "mid":
+            lower, upper = self.salary_from, self.salary_to
+            return np.where(np.isnan(lower), upper, np.where(np.isnan(upper), lower, (lower + upper) / 2))
+        raise ValueError(f"Неизвестное поле зарплаты: {by}. Допустимо: {', '.join(SALARY_FIELDS)}")
+
+    def currency_mask(self, currency: Optional[str]) -> np.ndarray:
+        if currency not in self.currencies:
+            return np.zeros(len(self), dtype=bool)
+        return self.currency_codes == self.currencies.index(currency)
+
+
+def top_n(arrays: SalaryArrays, n: int, by: str = "from") -> np.ndarray:
+    """
+    Индексы n вакансий с наибольшей зарплатой (по убыванию).
+
+    Использует argpartition: O(N) на отбор и O(n log n) на сортировку отобранных.
+    """
+    values = arrays.values(by)
+    candidates = np.flatnonzero(~np.isnan(values))
+    if n <= 0 or not len(candidates):
+        return np.empty(0, dtype=np.intp)
+    if n < len(candidates):
+        part = np.argpartition(-values[candidates], n - 1)[:n]
+        candidates = candidates[part]
+    # stable-сортировка сохраняет исходный порядок при равных зарплатах
+    order = np.argsort(-values[candidates], kind="stable")
+    return candidates[order]
+
+
+def filter_range(arrays: SalaryArrays, salary_min: Optional[float] = None,
+                 salary_max: Optional[float] = None, by: str = "from",
+                 currency: Optional[str] = None) -> np.ndarray:
+    """Индексы вакансий с зарплатой в диапазоне [salary_min, salary_max]."""
+    values = arrays.values(by)
+    mask = ~np.isnan(values)
+    if salary_min is not None:
+        mask &= values >= salary_min
+    if salary_max is not None:
+        mask &= values <= salary_max
+    if currency is not None:
+        mask &= arrays.currency_mask(currency)
+    return np.flatnonzero(mask)
+
+
+def percentiles(arrays: SalaryArrays, q: Sequence[float] = (25, 50, 75, 90),
+                by: str = "from", currency: Optional[str] = None) -> Dict[float, float]:
+    """Процентили зарплаты (вакансии без зарплаты не учитываются)."""
+    values = arrays.values(by)
+    if currency is not None:
+        values = values[arrays.currency_mask(currency)]
+    values = values[~np.isnan(values)]
+    if not len(values):
+        return {p: float("nan") for p in q}
+    return dict(zip(q, np.percentile(values, q).tolist()))
+
+
+def histogram(arrays: SalaryArrays, bins=10, by: str = "from", currency: Optional[str] = None):
+    """Гистограмма зарплат: (количества, границы корзин), как у numpy.histogram."""
+    values = arrays.values(by)
+    if currency is not None:
+        values = values[arrays.currency_mask(currency)]
+    return np.histogram(values[~np.isnan(values)], bins=bins)
+
+
+def group_by_currency(arrays: SalaryArrays, by: str = "from") -> Dict[Optional[str], Dict[str, float]]:
+    """
+    Статистика по валютам: количество вакансий с зарплатой, среднее, медиана, минимум, максимум.
+
+    Среднее и количество считаются одним проходом через np.bincount.
+    """
+    values = arrays.values(by)
+    known = ~np.isnan(values)
+    codes = arrays.currency_codes[known]
+    values = values[known]
+    size = len(arrays.currencies)
+    counts = np.bincount(codes, minlength=size)
+    sums = np.bincount(codes, weights=values, minlength=size)
+
+    result = {}
+    for code in np.flatnonzero(counts):
+        group = values[codes == code]
+        result[arrays.currencies[code]] = {
+            "count": int(counts[code]),
+            "mean": float(sums[code] / counts[code]),
+            "median": float(np.median(group)),
+            "min": float(group.min()),
+            "max": float(group.max()),
+        }
+    return result
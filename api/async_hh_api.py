@@ -0,0 +1,169 @@
+import asyncio
+from abc import ABC, abstractmethod
+from typing import Dict, Iterable, List, Optional, Union
+from urllib.parse import urlsplit
+
+import httpx
+
+from api.health import CircuitBreaker
+from api.hh_api import MAX_PER_PAGE, MAX_RESULTS
+from api.rate_limit import TokenBucket
+
+
+class AsyncVacancyAPI(ABC):
+    """Абстрактный класс для асинхронной работы с API сервисов вакансий."""
+
+    @abstractmethod
+    async def connect(self) -> bool:
+        """Проверить доступность API."""
+        pass
+
+    @abstractmethod
+    async def get_vacancies(self, query: str, per_page: int = 10) -> List[Dict]:
+        """Получить вакансии по запросу."""
+        pass
+
+
+class AsyncHeadHunterAPI(AsyncVacancyAPI):
+    """
+    Асинхронный клиент hh.ru на httpx.AsyncClient.
+
+    Соединения переиспользуются (keep-alive) из общего пула, число
+    одновременных запросов к одному хосту ограничено per_host_limit.
+    Каждый запрос ограничен timeout секунд; отмена задачи asyncio
+    корректно прерывает запрос и освобождает соединение.
+    """
+
+    def __init__(self, base_url: str = "https://api.hh.ru", max_connections: int = 20,
+                 max_keepalive_connections: int = 10, per_host_limit: int = 6,
+                 timeout: float = 10.0, max_concurrent_queries: int = 10,
+                 client: Optional[httpx.AsyncClient] = None, rate_limiter: Optional[TokenBucket] = None):
+        self._base_url = base_url.rstrip("/")
+        self._timeout = timeout
+        self._client = client or httpx.AsyncClient(
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_keepalive_connections
+            ),
+            timeout=httpx.Timeout(timeout),
+            headers={"User-Agent": "Project_folder/0.1"}
+        )
+        self._per_host_limit = max(1, per_host_limit)
+        self._host_limits: Dict[str, asyncio.Semaphore] = {}
+        self._query_limit = max(1, max_concurrent_queries)
+        self._breaker = CircuitBreaker()
+        # Может быть общим с синхронным HeadHunterAPI (см. api.rate_limit.shared_bucket)
+        self._limiter = rate_limiter
+
+    async def __aenter__(self) -> "AsyncHeadHunterAPI":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        await self._client.aclose()
+
+    def _host_limit(self, url: str) -> asyncio.Semaphore:
+        host = urlsplit(url).netloc
+        semaphore = self._host_limits.get(host)
+        if semaphore is None:
+            semaphore = self._host_limits[host] = asyncio.Semaphore(self._per_host_limit)
+        return semaphore
+
+    async def _get_json(self, url: str, params: Dict) -> Dict:
+        if self._limiter is not None:
+            wait = self._limiter.reserve()
+            if wait > 0:
+                await asyncio.sleep(wait)
+        async with self._host_limit(url):
+            response = await asyncio.wait_for(self._client.get(url, params=params), self._timeout)
+        if self._limiter is not None:
+            if response.status_code == 429:
+                self._limiter.on_throttled()
+            elif response.status_code < 400:
+                self._limiter.on_success()
+        response.raise_for_status()
+        return response.json()
+
+    async def connect(self) -> bool:
+        try:
+            await self._get_json(f"{self._base_url}/vacancies", {"per_page": 1})
+        except (httpx.HTTPError, asyncio.TimeoutError):
+            self._breaker.record_failure()
+            return False
+        self._breaker.record_success()
+        return True
+
+    async def _fetch_page(self, query: str, per_page: int, page: int) -> Dict:
+        params = {"text": query, "per_page": per_page, "page": page}
+        try:
+            data = await self._get_json(f"{self._base_url}/vacancies", params)
+        except httpx.HTTPStatusError as e:
+            if e.response.status_code >= 500:
+                self._breaker.record_failure()
+            else:
+                self._breaker.record_success()
+            raise ConnectionError(f"Ошибка API: {e}")
+        except (httpx.HTTPError, asyncio.TimeoutError) as e:
+            self._breaker.record_failure()
+            raise ConnectionError(f"Ошибка API: {e!r}")
+        self._breaker.record_success()
+        return data
+
+    async def get_vacancies(self, query: str, per_page: int = 10, pages: Optional[int] = 1) -> List[Dict]:
+        """
+        Получить вакансии с hh.ru по поисковому запросу.
+
+        Args:
+            query: поисковый запрос
+            per_page: количество вакансий на странице (макс. 100)
+            pages: сколько страниц загрузить; None — все доступные (до 2000 вакансий)
+
+        Returns:
+            Список словарей с данными вакансий в порядке страниц
+        """
+        if not self._breaker.allow_request():
+            raise ConnectionError("Не удалось подключиться к API hh.ru: сервис временно недоступен")
+
+        per_page = max(1, min(per_page, MAX_PER_PAGE))
+        first = await self._fetch_page(query, per_page, 0)
+        items = list(first.get("items", []))
+        total_pages = min(first.get("pages", 1), MAX_RESULTS // per_page)
+        if pages is not None:
+            total_pages = min(total_pages, pages)
+
+        tasks = [asyncio.ensure_future(self._fetch_page(query, per_page, page)) for page in range(1, total_pages)]
+        try:
+            # gather возвращает результаты в порядке задач, а не завершения
+            rest = await asyncio.gather(*tasks)
+        except BaseException:
+            # Ошибка одной страницы (или отмена) отменяет остальные: иначе они
+            # продолжат занимать слоты per_host_limit, а их ошибки никто не прочитает
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            raise
+        for data in rest:
+            items.extend(data.get("items", []))
+        return items
+
+    async def gather_queries(self, queries: Iterable[str], per_page: int = 10,
+                             pages: Optional[int] = 1) -> List[Union[List[Dict], Exception]]:
+        """
+        Выполнить много поисковых запросов одновременно.
+
+        Одновременно выполняется не больше max_concurrent_queries запросов.
+        Ошибка одного запроса не прерывает остальные: на её месте
+        в результате будет объект исключения.
+
+        Returns:
+            Результаты в порядке запросов
+        """
+        limit = asyncio.Semaphore(self._query_limit)
+
+        async def run(query: str):
+            async with limit:
+                return await self.get_vacancies(query, per_page=per_page, pages=pages)
+
+        return await asyncio.gather(*(run(query) for query in queries), return_exceptions=True)
@@ -0,0 +1,201 @@
+import re
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Mapping, NamedTuple, Optional, Tuple
+from urllib.parse import urlencode
+
+_MAX_AGE_RE = re.compile(r"max-age=(\d+)")
+
+
+class CacheEntry(NamedTuple):
+    """Сохранённый ответ API."""
+    body: bytes
+    etag: Optional[str]
+    expires_at: float
+
+    def is_fresh(self, now: Optional[float] = None) -> bool:
+        return (now if now is not None else time.time()) < self.expires_at
+
+
+class MemoryCache:
+    """LRU-кэш в памяти с ограничением по суммарному размеру тел ответов."""
+
+    def __init__(self, max_bytes: int = 32 * 1024 * 1024):
+        self._max_bytes = max_bytes
+        self._entries: "OrderedDict[str, CacheEntry]" = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+        self.evictions = 0
+
+    @property
+    def size(self) -> int:
+        return self._size
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: str) -> Optional[CacheEntry]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+    def set(self, key: str, entry: CacheEntry) -> None:
+        if len(entry.body) > self._max_bytes:
+            return
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self._size -= len(old.body)
+            self._entries[key] = entry
+            self._size += len(entry.body)
+            while self._size > self._max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self._size -= len(evicted.body)
+                self.evictions += 1
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self._size -= len(old.body)
+
+
+class SQLiteCache:
+    """
+    Дисковый уровень кэша на SQLite.
+
+    Файл можно разделять между несколькими процессами-воркерами:
+    база открывается в режиме WAL, записи идут через INSERT OR REPLACE.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False, timeout=30)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS responses ("
+            "key TEXT PRIMARY KEY, body BLOB NOT NULL, etag TEXT, expires_at REAL NOT NULL)"
+        )
+        self._conn.commit()
+
+    def get(self, key: str) -> Optional[CacheEntry]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT body, etag, expires_at FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+        return CacheEntry(bytes(row[0]), row[1], row[2]) if row else None
+
+    def set(self, key: str, entry: CacheEntry) -> None:
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses (key, body, etag, expires_at) VALUES (?, ?, ?, ?)",
+                (key, entry.body, entry.etag, entry.expires_at)
+            )
+            self._conn.commit()
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+            self._conn.commit()
+
+    def purge_expired(self, now: Optional[float] = None) -> int:
+        """Удалить устаревшие записи без ETag (их нельзя перепроверить)."""
+        with self._lock:
+            cursor = self._conn.execute(
+                "DELETE FROM responses WHERE etag IS NULL AND expires_at < ?",
+                (now if now is not None else time.time(),)
+            )
+            self._conn.commit()
+            return cursor.rowcount
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+class ResponseCache:
+    """
+    Двухуровневый кэш ответов API: LRU в памяти и необязательный SQLite на диске.
+
+    Ключ — нормализованная пара (endpoint, params). Свежие записи отдаются
+    без обращения к сети, устаревшие с ETag перепроверяются запросом
+    с If-None-Match.
+    """
+
+    def __init__(self, ttl: float = 300.0, max_bytes: int = 32 * 1024 * 1024,
+                 disk_path: Optional[str] = None):
+        self.ttl = ttl
+        self.memory = MemoryCache(max_bytes)
+        self.disk = SQLiteCache(disk_path) if disk_path else None
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.revalidations = 0
+
+    @staticmethod
+    def make_key(endpoint: str, params: Optional[Mapping] = None) -> str:
+        """Нормализовать endpoint и параметры: порядок параметров не важен."""
+        items = sorted((str(k), str(v)) for k, v in (params or {}).items() if v is not None)
+        query = urlencode(items)
+        return f"{endpoint.rstrip('/')}?{query}" if query else endpoint.rstrip('/')
+
+    def ttl_from_headers(self, headers: Mapping) -> float:
+        """TTL из Cache-Control: max-age, иначе значение по умолчанию."""
+        cache_control = headers.get("Cache-Control", "") if headers else ""
+        if "no-store" in cache_control or "no-cache" in cache_control:
+            return 0.0
+        match = _MAX_AGE_RE.search(cache_control)
+        return float(match.group(1)) if match else self.ttl
+
+    def _count(self, name: str) -> None:
+        with self._lock:
+            setattr(self, name, getattr(self, name) + 1)
+
+    def lookup(self, key: str) -> Tuple[Optional[CacheEntry], bool]:
+        """
+        Найти запись в кэше.
+
+        Returns:
+            Пара (запись или None, свежая ли она). Свежая запись считается
+            попаданием, всё остальное — промахом.
+        """
+        entry = self.memory.get(key)
+        if (entry is None or not entry.is_fresh()) and self.disk is not None:
+            # Другой процесс мог уже обновить запись в общем файле
+            shared = self.disk.get(key)
+            if shared is not None and (entry is None or shared.expires_at > entry.expires_at):
+                entry = shared
+                self.memory.set(key, entry)
+        fresh = entry is not None and entry.is_fresh()
+        self._count("hits" if fresh else "misses")
+        return entry, fresh
+
+    def store(self, key: str, body: bytes, etag: Optional[str], ttl: Optional[float] = None) -> None:
+        ttl = self.ttl if ttl is None else ttl
+        if ttl <= 0 and not etag:
+            return
+        entry = CacheEntry(body, etag, time.time() + ttl)
+        self.memory.set(key, entry)
+        if self.disk is not None:
+            self.disk.set(key, entry)
+
+    def revalidated(self, key: str, entry: CacheEntry, ttl: Optional[float] = None) -> None:
+        """Сервер ответил 304 Not Modified — продлить срок жизни записи."""
+        self._count("revalidations")
+        self.store(key, entry.body, entry.etag, ttl)
+
+    def stats(self) -> Dict[str, int]:
+        """Счётчики для настройки кэша."""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "revalidations": self.revalidations,
+            "evictions": self.memory.evictions,
+            "entries": len(self.memory),
+            "bytes": self.memory.size,
+        }
@@ -0,0 +1,122 @@
+import threading
+import time
+from typing import Callable, Optional
+
+
+class CircuitBreaker:
+    """
+    Автомат «предохранитель» для обращений к внешнему API.
+
+    После failure_threshold ошибок подряд размыкается (OPEN) и отклоняет
+    запросы; через reset_timeout секунд переходит в HALF_OPEN и пропускает
+    один пробный запрос: успех замыкает цепь, ошибка снова размыкает.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, failure_threshold: int = 3, reset_timeout: float = 30.0,
+                 clock: Callable[[], float] = time.monotonic):
+        self._failure_threshold = max(1, failure_threshold)
+        self._reset_timeout = reset_timeout
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._state = self.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._trial_in_flight = False
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            return self._current_state()
+
+    def _current_state(self) -> str:
+        if self._state == self.OPEN and self._clock() - self._opened_at >= self._reset_timeout:
+            self._state = self.HALF_OPEN
+            self._trial_in_flight = False
+        return self._state
+
+    def allow_request(self) -> bool:
+        """Можно ли сейчас отправить запрос."""
+        with self._lock:
+            state = self._current_state()
+            if state == self.CLOSED:
+                return True
+            if state == self.HALF_OPEN and not self._trial_in_flight:
+                self._trial_in_flight = True
+                return True
+            return False
+
+    def record_success(self) -> None:
+        with self._lock:
+            self._state = self.CLOSED
+            self._failures = 0
+            self._trial_in_flight = False
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self._failures += 1
+            if self._state == self.HALF_OPEN or self._failures >= self._failure_threshold:
+                self._state = self.OPEN
+                self._opened_at = self._clock()
+            self._trial_in_flight = False
+
+
+class HealthMonitor:
+    """
+    Кэшируемое состояние доступности API.
+
+    Результат пробного запроса (probe) хранится ttl секунд; успешные и
+    неуспешные рабочие запросы тоже обновляют состояние, поэтому при
+    нормальной работе отдельная проверка почти никогда не нужна.
+    """
+
+    def __init__(self, probe: Callable[[], bool], ttl: float = 60.0,
+                 breaker: Optional[CircuitBreaker] = None,
+                 clock: Callable[[], float] = time.monotonic):
+        self._probe = probe
+        self._ttl = ttl
+        self._clock = clock
+        self.breaker = breaker or CircuitBreaker(clock=clock)
+        self._lock = threading.Lock()
+        self._healthy: Optional[bool] = None
+        self._checked_at = 0.0
+
+    def _store(self, healthy: bool) -> None:
+        with self._lock:
+            self._healthy = healthy
+            self._checked_at = self._clock()
+
+    def is_healthy(self, force: bool = False) -> bool:
+        """
+        Вернуть состояние API, при необходимости выполнив пробный запрос.
+
+        Args:
+            force: игнорировать кэш и проверить доступность заново
+        """
+        with self._lock:
+            fresh = self._healthy is not None and self._clock() - self._checked_at < self._ttl
+            cached = self._healthy
+        if fresh and not force:
+            return bool(cached)
+        if not self.breaker.allow_request():
+            return False
+
+        healthy = self._probe()
+        if healthy:
+            self.mark_healthy()
+        else:
+            self.mark_unhealthy()
+        return healthy
+
+    def mark_healthy(self) -> None:
+        """Отметить успешное обращение к API."""
+        self.breaker.record_success()
+        self._store(True)
+
+    def mark_unhealthy(self) -> None:
+        """Отметить неудачное обращение к API."""
+        self.breaker.record_failure()
+        self._store(False)
@@ -1,6 +1,21 @@
+import json
+import time
 from abc import ABC, abstractmethod
-from typing import Dict, List
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, Iterator, List, Optional, Tuple, Union
 import requests
+from requests.adapters import DEFAULT_POOLSIZE, HTTPAdapter
+
+from api.cache import ResponseCache
+from api.health import CircuitBreaker, HealthMonitor
+from api.hh_converter import vacancies_from_hh_items
+from api.rate_limit import RetryPolicy, TokenBucket, shared_bucket
+from metrics.registry import METRICS
+from models.vacancy import Vacancy
+
+# hh.ru не отдаёт больше 2000 вакансий по одному поисковому запросу
+MAX_RESULTS = 2000
+MAX_PER_PAGE = 100
 
 
 class VacancyAPI(ABC):
@@ -18,49 +33,296 @@ class VacancyAPI(ABC):
 
 
 class HeadHunterAPI(VacancyAPI):
-    """Реализация API для hh.ru."""
+    """
+    Реализация API для hh.ru.
 
-    def __init__(self, base_url: str = "https://api.hh.ru"):
+    Все запросы клиента проходят через общий TokenBucket (rate_limit
+    запросов в секунду; при shared_rate_limit=True — один на процесс для
+    данного base_url). Ответы 429/5xx и сетевые сбои повторяются по
+    RetryPolicy с экспоненциальной задержкой и учётом Retry-After.
+    """
+
+    def __init__(self, base_url: str = "https://api.hh.ru", max_workers: int = 4,
+                 health_ttl: float = 60.0, failure_threshold: int = 3, reset_timeout: float = 30.0,
+                 cache: Optional[ResponseCache] = None,
+                 rate_limit: float = 10.0, shared_rate_limit: bool = False,
+                 rate_limiter: Optional[TokenBucket] = None, retry: Optional[RetryPolicy] = None,
+                 timeout: Union[float, Tuple[float, float]] = (3.05, 15.0),
+                 pool_maxsize: Optional[int] = None):
         self._base_url = base_url
         self._session = requests.Session()
+        # Потоки get_vacancies плюс поток упреждающей загрузки iter_pages на каждый
+        self._pool_maxsize = 0
+        self.ensure_pool_size(pool_maxsize or max(DEFAULT_POOLSIZE, 2 * max(1, max_workers)))
+        self._cache = cache
+        if rate_limiter is None:
+            rate_limiter = shared_bucket(base_url, rate=rate_limit) if shared_rate_limit else TokenBucket(rate_limit)
+        self._limiter = rate_limiter
+        self._retry = retry or RetryPolicy()
+        self._timeout = timeout
+        self._sleep = time.sleep
+        self._max_workers = max(1, max_workers)
+        self._health = HealthMonitor(
+            probe=self._connect,
+            ttl=health_ttl,
+            breaker=CircuitBreaker(failure_threshold=failure_threshold, reset_timeout=reset_timeout)
+        )
 
     def _connect(self) -> bool:
-        """Приватный метод подключения к API."""
+        """Приватный метод подключения к API: лёгкий запрос на одну вакансию."""
         try:
-            response = self._session.get(f"{self._base_url}/vacancies")
+            self._limiter.acquire(sleep=self._sleep)
+            METRICS.incr("hh.connect_probes")
+            response = self._session.get(f"{self._base_url}/vacancies", params={"per_page": 1},
+                                         timeout=self._timeout)
             return response.status_code == 200
         except requests.RequestException:
             return False
 
-    def connect(self) -> bool:
-        return self._connect()
+    def connect(self, force: bool = False) -> bool:
+        """Проверить доступность API (результат кэшируется на health_ttl секунд)."""
+        return self._health.is_healthy(force=force)
 
-    def get_vacancies(self, query: str, per_page: int = 10) -> List[Dict]:
+    @property
+    def cache(self) -> Optional[ResponseCache]:
+        return self._cache
+
+    @property
+    def rate_limiter(self) -> TokenBucket:
+        return self._limiter
+
+    def ensure_pool_size(self, size: int) -> None:
         """
-        Получить вакансии с hh.ru по поисковому запросу.
+        Держать в пуле keep-alive не меньше size соединений.
 
-        Args:
-            query: поисковый запрос (например, "Python developer")
-            per_page: количество вакансий в ответе (макс. 100)
+        Если одновременных запросов больше, чем соединений в пуле, urllib3
+        закрывает лишние соединения после ответа («Connection pool is full»),
+        и keep-alive перестаёт работать.
+        """
+        if size <= self._pool_maxsize:
+            return
+        adapter = HTTPAdapter(pool_connections=DEFAULT_POOLSIZE, pool_maxsize=size)
+        self._session.mount("https://", adapter)
+        self._session.mount("http://", adapter)
+        self._pool_maxsize = size
 
-        Returns:
-            Список словарей с данными вакансий
+    def add_response_hook(self, hook: Callable) -> None:
+        """Вызывать hook(response, *args, **kwargs) для каждого HTTP-ответа (хук requests)."""
+        self._session.hooks["response"].append(hook)
+
+    def remove_response_hook(self, hook: Callable) -> None:
+        self._session.hooks["response"].remove(hook)
+
+    def _send(self, url: str, params: Dict, headers: Optional[Dict] = None) -> requests.Response:
         """
-        if not self.connect():
-            raise ConnectionError("Не удалось подключиться к API hh.ru")
+        Отправить GET-запрос с ограничением частоты и повторами.
 
+        Повторяются ответы из RetryPolicy.retry_statuses, обрывы соединения
+        и таймауты. Ответ 429 дополнительно снижает скорость TokenBucket.
+        """
+        kwargs = {"params": params, "timeout": self._timeout}
+        if headers:
+            kwargs["headers"] = headers
+        attempt = 0
+        while True:
+            self._limiter.acquire(sleep=self._sleep)
+            try:
+                with METRICS.timer("hh.request"):
+                    response = self._session.get(url, **kwargs)
+            except (requests.ConnectionError, requests.Timeout):
+                METRICS.incr("hh.network_errors")
+                if attempt >= self._retry.max_retries:
+                    raise
+                delay = self._retry.backoff(attempt)
+            else:
+                status = response.status_code
+                if METRICS.enabled:
+                    METRICS.incr("hh.requests")
+                    METRICS.incr("hh.response_bytes", len(response.content))
+                    if status >= 400:
+                        METRICS.incr("hh.http_errors")
+                if status == 429:
+                    METRICS.incr("hh.throttled")
+                    self._limiter.on_throttled()
+                if not self._retry.should_retry(status) or attempt >= self._retry.max_retries:
+                    if status < 400:
+                        self._limiter.on_success()
+                    return response
+                delay = self._retry.backoff(attempt, response.headers.get("Retry-After"))
+            attempt += 1
+            METRICS.incr("hh.retries")
+            self._sleep(delay)
+
+    def _get_json(self, url: str, params: Dict) -> Dict:
+        """GET-запрос с разбором JSON; при наличии кэша — через него."""
+        if self._cache is None:
+            response = self._send(url, params)
+            response.raise_for_status()
+            with METRICS.timer("hh.decode"):
+                return response.json()
+
+        key = self._cache.make_key(url, params)
+        entry, fresh = self._cache.lookup(key)
+        if fresh:
+            METRICS.incr("hh.cache_hits")
+            with METRICS.timer("hh.decode"):
+                return json.loads(entry.body)
+
+        headers = {"If-None-Match": entry.etag} if entry is not None and entry.etag else {}
+        response = self._send(url, params, headers)
+        ttl = self._cache.ttl_from_headers(response.headers)
+        if response.status_code == 304 and entry is not None:
+            METRICS.incr("hh.cache_revalidated")
+            self._cache.revalidated(key, entry, ttl)
+            with METRICS.timer("hh.decode"):
+                return json.loads(entry.body)
+
+        METRICS.incr("hh.cache_misses")
+        response.raise_for_status()
+        self._cache.store(key, response.content, response.headers.get("ETag"), ttl)
+        with METRICS.timer("hh.decode"):
+            return response.json()
+
+    def _fetch_page(self, query: str, per_page: int, page: int, filters: Optional[Dict] = None) -> Dict:
+        """Загрузить одну страницу результатов поиска."""
         params = {
             "text": query,
             "per_page": per_page,
-            "page": 0
+            "page": page
         }
+        if filters:
+            params.update(filters)
+        try:
+            data = self._get_json(f"{self._base_url}/vacancies", params)
+        except requests.HTTPError as e:
+            # 4xx — API доступен, ошибка в самом запросе
+            status = e.response.status_code if e.response is not None else 500
+            if status < 500:
+                self._health.mark_healthy()
+            else:
+                self._health.mark_unhealthy()
+            raise ConnectionError(f"Ошибка API: {e}")
+        except requests.RequestException as e:
+            self._health.mark_unhealthy()
+            raise ConnectionError(f"Ошибка API: {e}")
+        self._health.mark_healthy()
+        return data
+
+    def get_vacancies(self, query: str, per_page: int = 10, pages: Optional[int] = 1) -> List[Dict]:
+        """
+        Получить вакансии с hh.ru по поисковому запросу.
+
+        Первая страница запрашивается сразу, остальные — параллельно
+        через пул потоков не более чем из max_workers соединений.
+        Отдельной проверки соединения перед поиском нет: если API
+        недавно не отвечал, запрос отклоняется размыкателем цепи.
+
+        Args:
+            query: поисковый запрос (например, "Python developer")
+            per_page: количество вакансий на странице (макс. 100)
+            pages: сколько страниц загрузить; None — все доступные
+                (но не более 2000 вакансий — ограничение hh.ru)
+
+        Returns:
+            Список словарей с данными вакансий в порядке страниц
+        """
+        if not self._health.breaker.allow_request():
+            raise ConnectionError("Не удалось подключиться к API hh.ru: сервис временно недоступен")
+
+        per_page = max(1, min(per_page, MAX_PER_PAGE))
+        first = self._fetch_page(query, per_page, 0)
+        items = list(first.get("items", []))
+
+        # Сколько страниц реально доступно: по ответу API и по лимиту глубины
+        available = first.get("pages", 1)
+        limit = MAX_RESULTS // per_page
+        total_pages = min(available, limit)
+        if pages is not None:
+            total_pages = min(total_pages, pages)
+        if total_pages <= 1:
+            return items
+
+        remaining = range(1, total_pages)
+        workers = min(self._max_workers, len(remaining))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            # map сохраняет порядок страниц независимо от порядка ответов
+            for page in executor.map(lambda p: self._fetch_page(query, per_page, p), remaining):
+                items.extend(page.get("items", []))
+        return items
+
+    def get_vacancy(self, vacancy_id: str) -> Optional[Dict]:
+        """
+        Получить полную информацию о вакансии по id.
+
+        Returns:
+            Данные вакансии или None, если вакансия удалена (404)
+        """
         try:
-            response = self._session.get(
-                f"{self._base_url}/vacancies",
-                params=params
-            )
+            response = self._send(f"{self._base_url}/vacancies/{vacancy_id}", {})
+            if response.status_code == 404:
+                self._health.mark_healthy()
+                return None
             response.raise_for_status()
             data = response.json()
-            return data.get("items", [])
         except requests.RequestException as e:
+            self._health.mark_unhealthy()
             raise ConnectionError(f"Ошибка API: {e}")
+        self._health.mark_healthy()
+        return data
+
+    def iter_pages(self, query: str, per_page: int = MAX_PER_PAGE,
+                   max_pages: Optional[int] = None, filters: Optional[Dict] = None) -> Iterator[List[Dict]]:
+        """
+        Постранично выдавать элементы результатов поиска по мере загрузки.
+
+        Пока вызывающий код обрабатывает текущую страницу, следующая уже
+        загружается в фоне, поэтому в памяти находится не больше двух страниц.
+
+        Args:
+            filters: дополнительные параметры поиска hh.ru
+                (например, {"date_from": ..., "order_by": "publication_time"})
+        """
+        if not self._health.breaker.allow_request():
+            raise ConnectionError("Не удалось подключиться к API hh.ru: сервис временно недоступен")
+
+        per_page = max(1, min(per_page, MAX_PER_PAGE))
+        first = self._fetch_page(query, per_page, 0, filters)
+        total_pages = min(first.get("pages", 1), MAX_RESULTS // per_page)
+        if max_pages is not None:
+            total_pages = min(total_pages, max_pages)
+
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            pending = executor.submit(self._fetch_page, query, per_page, 1, filters) if total_pages > 1 else None
+            yield first.get("items", [])
+            del first
+            for page in range(1, total_pages):
+                data = pending.result()
+                pending = (
+                    executor.submit(self._fetch_page, query, per_page, page + 1, filters)
+                    if page + 1 < total_pages else None
+                )
+                yield data.get("items", [])
+
+    def iter_vacancies(self, query: str, max_items: Optional[int] = None, per_page: int = MAX_PER_PAGE,
+                       on_error: Optional[Callable[[Dict, Exception], None]] = None) -> Iterator[Vacancy]:
+        """
+        Выдавать готовые объекты Vacancy по мере получения страниц.
+
+        Args:
+            query: поисковый запрос
+            max_items: максимальное число вакансий (None — все доступные, до 2000)
+            per_page: размер страницы запроса к API
+            on_error: обработчик элементов, которые не удалось преобразовать
+        """
+        if max_items is not None:
+            if max_items <= 0:
+                return
+            per_page = min(per_page, max_items)
+        max_pages = -(-max_items // per_page) if max_items is not None else None
+        produced = 0
+        for items in self.iter_pages(query, per_page=per_page, max_pages=max_pages):
+            for vacancy in vacancies_from_hh_items(items, on_error):
+                yield vacancy
+                produced += 1
+                if max_items is not None and produced >= max_items:
+                    return
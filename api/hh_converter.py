@@ -0,0 +1,178 @@
+import os
+import re
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from itertools import chain
+from typing import Callable, Deque, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+from metrics.registry import METRICS
+from models.vacancy import Vacancy
+
+HH_VACANCY_URL = "https://hh.ru/vacancy/{}"
+
+_TAG_RE = re.compile(r"<[^>]+>")
+_SPACES_RE = re.compile(r"\s+")
+
+
+def format_salary(salary: Optional[Dict]) -> Optional[str]:
+    """
+    Преобразовать блок salary из ответа hh.ru в строку.
+
+    Отсутствующие границы не попадают в строку: {"from": None, "to": 150000}
+    даёт "до 150000 RUR", а не "None–150000 RUR".
+    """
+    if not salary:
+        return None
+    lower = salary.get("from")
+    upper = salary.get("to")
+    currency = salary.get("currency") or ""
+    if lower and upper:
+        text = f"{lower}–{upper}"
+    elif lower:
+        text = f"от {lower}"
+    elif upper:
+        text = f"до {upper}"
+    else:
+        return None
+    return f"{text} {currency}".strip()
+
+
+def clean_snippet(text: Optional[str]) -> str:
+    """Убрать HTML-разметку подсветки (<highlighttext>) и лишние пробелы."""
+    if not text:
+        return ""
+    return _SPACES_RE.sub(" ", _TAG_RE.sub("", text)).strip()
+
+
+def vacancy_from_hh_item(item: Dict) -> Vacancy:
+    """
+    Создать Vacancy из элемента ответа hh.ru /vacancies.
+
+    Raises:
+        KeyError: в элементе нет id
+        ValueError: данные не прошли проверку Vacancy
+    """
+    return Vacancy(
+        title=item.get("name", ""),
+        url=HH_VACANCY_URL.format(item["id"]),
+        salary=format_salary(item.get("salary")),
+        description=clean_snippet((item.get("snippet") or {}).get("requirement"))
+    )
+
+
+def vacancies_from_hh_items(items: Iterable[Dict],
+                            on_error: Optional[Callable[[Dict, Exception], None]] = None) -> Iterator[Vacancy]:
+    """
+    Лениво преобразовать элементы hh.ru в Vacancy, пропуская некорректные.
+
+    Args:
+        items: элементы ответа API
+        on_error: вызывается для каждого пропущенного элемента с возникшей ошибкой
+    """
+    for item in items:
+        try:
+            yield vacancy_from_hh_item(item)
+        except (ValueError, KeyError) as e:
+            METRICS.incr("hh.parse_errors")
+            if on_error is not None:
+                on_error(item, e)
+
+
+# Нормализованная вакансия: (title, url, salary, description) — компактно и дёшево передаётся между процессами
+VacancyRow = Tuple[str, str, str, str]
+
+
+def _normalize_chunk(items: Sequence[Dict]) -> Tuple[List[VacancyRow], List[Tuple[int, Exception]]]:
+    """Нормализовать пачку элементов (выполняется в процессе пула)."""
+    rows = []
+    errors = []
+    for index, item in enumerate(items):
+        try:
+            vacancy = vacancy_from_hh_item(item)
+        except (ValueError, KeyError) as e:
+            errors.append((index, e))
+            continue
+        rows.append((vacancy.title, vacancy.url, vacancy.salary, vacancy.description))
+    return rows, errors
+
+
+def _chunked(items: Iterable[Dict], size: int) -> Iterator[List[Dict]]:
+    chunk = []
+    for item in items:
+        chunk.append(item)
+        if len(chunk) >= size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def _report(chunk: List[Dict], rows: List[VacancyRow], errors: List[Tuple[int, Exception]],
+            on_error: Optional[Callable[[Dict, Exception], None]]) -> List[VacancyRow]:
+    """Сообщить об ошибках пачки с исходными элементами и вернуть её строки."""
+    for index, error in errors:
+        METRICS.incr("hh.parse_errors")
+        if on_error is not None:
+            on_error(chunk[index], error)
+    return rows
+
+
+def iter_normalized_chunks(items: Iterable[Dict], workers: Optional[int] = None, chunk_size: int = 5000,
+                           on_error: Optional[Callable[[Dict, Exception], None]] = None,
+                           max_pending: Optional[int] = None) -> Iterator[List[VacancyRow]]:
+    """
+    Нормализовать поток элементов hh.ru параллельно в нескольких процессах.
+
+    Элементы читаются из items лениво и делятся на пачки по chunk_size;
+    в пуле ProcessPoolExecutor одновременно находится не больше max_pending
+    пачек, поэтому память не растёт с объёмом входных данных. Результаты —
+    кортежи VacancyRow, а не объекты Vacancy, и выдаются по пачкам
+    в исходном порядке. Если пачка одна или workers == 1, пул не создаётся.
+
+    Args:
+        items: элементы ответов hh.ru /vacancies (любой итерируемый поток)
+        workers: число процессов (по умолчанию — число ядер)
+        chunk_size: размер пачки на одну задачу пула
+        on_error: вызывается для каждого пропущенного элемента с возникшей ошибкой
+        max_pending: сколько пачек держать в работе (по умолчанию 2 * workers)
+
+    Yields:
+        Нормализованные вакансии очередной пачки (некорректные пропущены)
+    """
+    workers = workers or os.cpu_count() or 1
+    chunks = _chunked(items, max(1, chunk_size))
+    if workers == 1:
+        for chunk in chunks:
+            yield _report(chunk, *_normalize_chunk(chunk), on_error)
+        return
+
+    first = next(chunks, None)
+    second = next(chunks, None)
+    if second is None:
+        if first is not None:
+            yield _report(first, *_normalize_chunk(first), on_error)
+        return
+
+    max_pending = max(1, max_pending or 2 * workers)
+    pending: Deque[Tuple[List[Dict], Future]] = deque()
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        for chunk in chain((first, second), chunks):
+            pending.append((chunk, executor.submit(_normalize_chunk, chunk)))
+            if len(pending) >= max_pending:
+                done, future = pending.popleft()
+                yield _report(done, *future.result(), on_error)
+        while pending:
+            done, future = pending.popleft()
+            yield _report(done, *future.result(), on_error)
+
+
+def normalize_hh_items(items: Iterable[Dict], workers: Optional[int] = None, chunk_size: int = 5000,
+                       on_error: Optional[Callable[[Dict, Exception], None]] = None) -> List[VacancyRow]:
+    """Нормализовать элементы hh.ru в пуле процессов и вернуть все строки списком (см. iter_normalized_chunks)."""
+    return [row for rows in iter_normalized_chunks(items, workers, chunk_size, on_error) for row in rows]
+
+
+def vacancies_from_rows(rows: Iterable[VacancyRow]) -> List[Vacancy]:
+    """Собрать Vacancy из нормализованных строк без повторной проверки."""
+    trusted = Vacancy._trusted
+    return [trusted(title, url, salary, description) for title, url, salary, description in rows]
@@ -0,0 +1,139 @@
+import random
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from typing import Callable, Dict, Iterable, Optional
+
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+
+class TokenBucket:
+    """
+    Потокобезопасный «ведро жетонов» для ограничения частоты запросов.
+
+    Жетоны пополняются со скоростью rate в секунду до capacity. Скорость
+    адаптивна: ответ 429 уменьшает её в decrease_factor раз, каждый
+    успешный ответ увеличивает на increase_step (но не выше max_rate).
+    """
+
+    def __init__(self, rate: float = 10.0, capacity: Optional[float] = None,
+                 min_rate: float = 0.5, max_rate: Optional[float] = None,
+                 decrease_factor: float = 0.5, increase_step: float = 0.1,
+                 clock: Callable[[], float] = time.monotonic):
+        self._rate = rate
+        self.capacity = capacity if capacity is not None else max(1.0, rate)
+        self.min_rate = min_rate
+        self.max_rate = max_rate if max_rate is not None else rate
+        self._decrease_factor = decrease_factor
+        self._increase_step = increase_step
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._tokens = self.capacity
+        self._updated = clock()
+
+    @property
+    def rate(self) -> float:
+        return self._rate
+
+    def _refill(self) -> None:
+        now = self._clock()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self._rate)
+        self._updated = now
+
+    def reserve(self, tokens: float = 1.0) -> float:
+        """
+        Зарезервировать жетоны и вернуть, сколько секунд нужно подождать.
+
+        Резерв делается сразу (баланс может уйти в минус), поэтому
+        конкурирующие потоки выстраиваются в очередь, а не «толпятся».
+        Подходит и для asyncio: await asyncio.sleep(bucket.reserve()).
+        """
+        with self._lock:
+            self._refill()
+            self._tokens -= tokens
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / self._rate
+
+    def acquire(self, tokens: float = 1.0, sleep: Callable[[float], None] = time.sleep) -> None:
+        """Дождаться разрешения на запрос."""
+        wait = self.reserve(tokens)
+        if wait > 0:
+            sleep(wait)
+
+    def on_throttled(self) -> None:
+        """Сервер ответил 429: мультипликативно снизить скорость."""
+        with self._lock:
+            self._refill()
+            self._rate = max(self.min_rate, self._rate * self._decrease_factor)
+
+    def on_success(self) -> None:
+        """Успешный ответ: аддитивно повысить скорость до max_rate."""
+        with self._lock:
+            if self._rate < self.max_rate:
+                self._refill()
+                self._rate = min(self.max_rate, self._rate + self._increase_step)
+
+
+_shared_buckets: Dict[str, TokenBucket] = {}
+_shared_lock = threading.Lock()
+
+
+def shared_bucket(name: str, rate: float = 10.0, **kwargs) -> TokenBucket:
+    """
+    Вернуть общий для процесса TokenBucket с данным именем (например, хостом API).
+
+    Параметры учитываются только при первом создании ведра.
+    """
+    with _shared_lock:
+        bucket = _shared_buckets.get(name)
+        if bucket is None:
+            bucket = _shared_buckets[name] = TokenBucket(rate=rate, **kwargs)
+        return bucket
+
+
+def parse_retry_after(value: Optional[str], now: Optional[float] = None) -> Optional[float]:
+    """Разобрать заголовок Retry-After: число секунд или HTTP-дата."""
+    if not value or not isinstance(value, str):
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        moment = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if moment is None:
+        return None
+    return max(0.0, moment.timestamp() - (now if now is not None else time.time()))
+
+
+class RetryPolicy:
+    """
+    Политика повторов: экспоненциальная задержка с «полным» джиттером.
+
+    Задержка перед попыткой n — случайная величина от 0 до
+    min(backoff_max, backoff_base * 2**n); заголовок Retry-After,
+    если он есть, имеет приоритет.
+    """
+
+    def __init__(self, max_retries: int = 3, backoff_base: float = 0.5, backoff_max: float = 30.0,
+                 retry_statuses: Iterable[int] = RETRY_STATUSES, jitter: bool = True,
+                 rng: Callable[[], float] = random.random):
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.retry_statuses = frozenset(retry_statuses)
+        self.jitter = jitter
+        self._rng = rng
+
+    def should_retry(self, status_code: int) -> bool:
+        return status_code in self.retry_statuses
+
+    def backoff(self, attempt: int, retry_after: Optional[str] = None) -> float:
+        """Задержка в секундах перед повтором номер attempt (с нуля)."""
+        server_delay = parse_retry_after(retry_after)
+        if server_delay is not None:
+            return min(server_delay, self.backoff_max)
+        delay = min(self.backoff_max, self.backoff_base * (2 ** attempt))
+        return delay * self._rng() if self.jitter else delay
@@ -0,0 +1,254 @@
+"""
+Неинтерактивный пакетный режим: поиск по списку запросов из файла.
+
+Пример:
+    python -m crawler.batch queries.txt --concurrency 8 --storage sqlite --output vacancies.db
+
+Формат файла запросов — по одному запросу в строке, через « | » можно
+указать слова для фильтрации описания и лимит вакансий:
+    Python разработчик | django git | 200
+Пустые строки и строки, начинающиеся с #, пропускаются.
+
+Архивы сырых ответов hh.ru загружаются без обращения к API, нормализация
+идёт параллельно в нескольких процессах:
+    python -m crawler.batch --import-raw dump1.json dump2.jsonl --workers 8 --output vacancies.json
+
+Метрики (--metrics в лог, --metrics-file для Prometheus) и профилирование
+(--profile [FILE], --profile-memory) включаются флагами.
+"""
+import argparse
+import logging
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import nullcontext
+from typing import Dict, Iterable, List, NamedTuple, Optional, Sequence
+
+from api.hh_api import HeadHunterAPI
+from metrics import registry
+from metrics.exporters import LogExporter, PrometheusTextfileExporter
+from metrics.profiling import profile
+from models import query
+from models.vacancy import Vacancy
+from storage.importer import import_raw_files
+from storage.json_saver import ConcreteJSONSaver, JSONSaver
+from storage.jsonl_saver import JSONLinesSaver
+from storage.sqlite_saver import SQLiteSaver
+
+STORAGE_BACKENDS = {
+    "json": ConcreteJSONSaver,
+    "jsonl": JSONLinesSaver,
+    "sqlite": SQLiteSaver,
+}
+
+
+class QuerySpec(NamedTuple):
+    query: str
+    filter_words: List[str]
+    max_items: Optional[int]
+
+
+def parse_query_file(lines: Iterable[str], default_max_items: Optional[int] = None) -> List[QuerySpec]:
+    """Разобрать строки файла запросов."""
+    specs = []
+    for line in lines:
+        line = line.strip()
+        if not line or line.startswith("#"):
+            continue
+        parts = [part.strip() for part in line.split("|")]
+        filter_words = parts[1].split() if len(parts) > 1 else []
+        max_items = int(parts[2]) if len(parts) > 2 and parts[2].isdigit() else default_max_items
+        specs.append(QuerySpec(parts[0], filter_words, max_items))
+    return specs
+
+
+class CrawlStats:
+    """Потокобезопасные счётчики пакетного обхода."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.started = time.perf_counter()
+        self.requests = 0
+        self.bytes = 0
+        self.queries = 0
+        self.vacancies = 0
+        self.saved = 0
+        self.errors = 0
+
+    def on_response(self, response, *args, **kwargs):
+        """Хук requests: учитывает каждый HTTP-ответ."""
+        with self._lock:
+            self.requests += 1
+            self.bytes += len(response.content or b"")
+
+    def add(self, **counters: int) -> None:
+        with self._lock:
+            for name, value in counters.items():
+                setattr(self, name, getattr(self, name) + value)
+
+    def summary(self) -> Dict[str, float]:
+        elapsed = max(time.perf_counter() - self.started, 1e-9)
+        return {
+            "elapsed": elapsed,
+            "queries": self.queries,
+            "requests": self.requests,
+            "requests_per_sec": self.requests / elapsed,
+            "vacancies": self.vacancies,
+            "vacancies_per_sec": self.vacancies / elapsed,
+            "saved": self.saved,
+            "bytes": self.bytes,
+            "errors": self.errors,
+        }
+
+
+def fetch_query(api: HeadHunterAPI, spec: QuerySpec) -> List[Vacancy]:
+    """Выполнить один запрос и отфильтровать результаты по словам."""
+    vacancies = api.iter_vacancies(spec.query, max_items=spec.max_items)
+    return list(query.filter_vacancies(vacancies, spec.filter_words))
+
+
+def run_batch(specs: Sequence[QuerySpec], api: HeadHunterAPI, saver: JSONSaver,
+              concurrency: int = 4, stats: Optional[CrawlStats] = None,
+              log=print, flush_every: int = 50) -> CrawlStats:
+    """
+    Выполнить запросы параллельно и сохранить результаты.
+
+    Поиск идёт в пуле из concurrency потоков, а сохранение — в вызывающем
+    потоке, поэтому хранилищу не нужна потокобезопасность. Результаты
+    копятся и сохраняются одним upsert_vacancies на каждые flush_every
+    запросов и в конце: ConcreteJSONSaver переписывает файл целиком
+    при каждом сохранении.
+    """
+    stats = stats or CrawlStats()
+    pending: List[Vacancy] = []
+
+    def flush() -> None:
+        if pending:
+            saved = saver.upsert_vacancies(pending)
+            stats.add(saved=saved)
+            pending.clear()
+
+    # Каждый поток поиска плюс его поток упреждающей загрузки страниц
+    api.ensure_pool_size(2 * max(1, concurrency))
+    api.add_response_hook(stats.on_response)
+    try:
+        with ThreadPoolExecutor(max_workers=max(1, concurrency)) as executor:
+            futures = {executor.submit(fetch_query, api, spec): spec for spec in specs}
+            for done, future in enumerate(as_completed(futures), 1):
+                spec = futures[future]
+                try:
+                    vacancies = future.result()
+                except (ConnectionError, ValueError) as e:
+                    stats.add(queries=1, errors=1)
+                    log(f"Ошибка запроса '{spec.query}': {e}")
+                    continue
+                pending.extend(vacancies)
+                stats.add(queries=1, vacancies=len(vacancies))
+                if done % max(1, flush_every) == 0:
+                    flush()
+    finally:
+        api.remove_response_hook(stats.on_response)
+        # Уже загруженное сохраняется и при прерывании обхода
+        flush()
+    return stats
+
+
+def format_summary(summary: Dict[str, float]) -> str:
+    return (
+        f"Запросов поиска: {summary['queries']}, HTTP-запросов: {summary['requests']} "
+        f"({summary['requests_per_sec']:.1f}/с)\n"
+        f"Вакансий: {summary['vacancies']} ({summary['vacancies_per_sec']:.1f}/с), "
+        f"сохранено: {summary['saved']}\n"
+        f"Получено байт: {summary['bytes']}, ошибок: {summary['errors']}, "
+        f"время: {summary['elapsed']:.2f} с"
+    )
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="Пакетный поиск вакансий на hh.ru")
+    parser.add_argument("queries", nargs="?", help="файл со списком запросов")
+    parser.add_argument("--import-raw", nargs="+", metavar="FILE",
+                        help="вместо поиска загрузить в хранилище архивы сырых ответов hh.ru")
+    parser.add_argument("--workers", type=int, default=None,
+                        help="процессов для нормализации при --import-raw (по умолчанию — число ядер)")
+    parser.add_argument("--concurrency", type=int, default=4, help="число одновременных запросов")
+    parser.add_argument("--storage", choices=sorted(STORAGE_BACKENDS), default="json", help="формат хранилища")
+    parser.add_argument("--output", default="vacancies.json", help="путь к файлу хранилища")
+    parser.add_argument("--flush-every", type=int, default=50,
+                        help="сохранять результаты каждые N запросов (json переписывает файл целиком)")
+    parser.add_argument("--max-items", type=int, default=None, help="лимит вакансий на запрос по умолчанию")
+    parser.add_argument("--rate-limit", type=float, default=10.0, help="запросов к API в секунду")
+    parser.add_argument("--metrics", action="store_true", help="собрать метрики и вывести их в лог")
+    parser.add_argument("--metrics-file", help="записать метрики в файл для textfile-коллектора Prometheus")
+    parser.add_argument("--profile", nargs="?", const="", default=None, metavar="FILE",
+                        help="профилировать через cProfile (отчёт в stderr или в FILE)")
+    parser.add_argument("--profile-memory", action="store_true", help="при --profile отслеживать память (tracemalloc)")
+    parser.add_argument("--base-url", default="https://api.hh.ru", help=argparse.SUPPRESS)
+    return parser
+
+
+def import_raw(paths: Sequence[str], saver: JSONSaver, workers: Optional[int] = None,
+               log=print) -> int:
+    """Загрузить архивы сырых ответов в хранилище, нормализуя элементы в пуле процессов."""
+    skipped = []
+    started = time.perf_counter()
+    saved = import_raw_files(paths, saver, workers=workers, on_error=lambda item, e: skipped.append(e))
+    elapsed = time.perf_counter() - started
+    log(f"Сохранено вакансий: {saved}, пропущено некорректных: {len(skipped)}, время: {elapsed:.2f} с")
+    return saved
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    if args.import_raw:
+        saver = STORAGE_BACKENDS[args.storage](args.output)
+        try:
+            import_raw(args.import_raw, saver, workers=args.workers)
+        finally:
+            if isinstance(saver, SQLiteSaver):
+                saver.close()
+        return 0
+    if not args.queries:
+        parser.error("укажите файл запросов или --import-raw")
+
+    with open(args.queries, "r", encoding="utf-8") as f:
+        specs = parse_query_file(f, default_max_items=args.max_items)
+    if not specs:
+        print("Файл запросов пуст.")
+        return 1
+
+    exporters = []
+    if args.metrics:
+        logging.basicConfig(level=logging.INFO, format="%(message)s")
+        exporters.append(LogExporter())
+    if args.metrics_file:
+        exporters.append(PrometheusTextfileExporter(args.metrics_file))
+    if exporters:
+        registry.enable(*exporters)
+
+    api = HeadHunterAPI(base_url=args.base_url, rate_limit=args.rate_limit,
+                        pool_maxsize=2 * max(1, args.concurrency))
+    saver = STORAGE_BACKENDS[args.storage](args.output)
+    profiler = (
+        profile(output=args.profile or None, memory=args.profile_memory)
+        if args.profile is not None else nullcontext()
+    )
+    try:
+        with profiler:
+            stats = run_batch(specs, api, saver, concurrency=args.concurrency, flush_every=args.flush_every)
+    finally:
+        if isinstance(saver, SQLiteSaver):
+            saver.close()
+        if exporters:
+            registry.METRICS.export()
+            registry.disable()
+            for exporter in exporters:
+                registry.METRICS.remove_exporter(exporter)
+    print(format_summary(stats.summary()))
+    return 0 if stats.errors == 0 else 2
+
+
+if __name__ == "__main__":
+    sys.exit(main())
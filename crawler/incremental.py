@@ -0,0 +1,195 @@
+import hashlib
+import json
+import time
+from collections import ChainMap
+from datetime import datetime, timedelta
+from typing import Callable, Dict, List, MutableMapping, Optional
+
+from api.hh_api import MAX_PER_PAGE, MAX_RESULTS, HeadHunterAPI
+from api.hh_converter import HH_VACANCY_URL, vacancy_from_hh_item
+from storage.file_utils import atomic_write
+from storage.json_saver import JSONSaver
+
+HH_DATE_FORMAT = "%Y-%m-%dT%H:%M:%S%z"
+
+
+def _parse(value: str) -> datetime:
+    return datetime.strptime(value, HH_DATE_FORMAT)
+
+
+def content_hash(record: Dict) -> str:
+    """Хэш содержимого вакансии для обнаружения изменений."""
+    payload = json.dumps(record, ensure_ascii=False, sort_keys=True).encode("utf-8")
+    return hashlib.sha1(payload).hexdigest()
+
+
+class SyncState:
+    """
+    Состояние инкрементальной синхронизации, сохраняемое между запусками.
+
+    Для каждого запроса хранится водяной знак (максимальный published_at),
+    хэши содержимого уже сохранённых вакансий и время их последней проверки.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                self._data = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            self._data = {}
+
+    def query(self, query: str) -> Dict:
+        return self._data.setdefault(query, {"watermark": None, "seen": {}, "checked": {}})
+
+    def save(self) -> None:
+        atomic_write(self.path, json.dumps(self._data, ensure_ascii=False).encode("utf-8"))
+
+
+class IncrementalCrawler:
+    """
+    Инкрементальный обход hh.ru: загружаются и сохраняются только новые
+    и изменившиеся вакансии.
+
+    Поиск идёт с сортировкой по времени публикации и date_from, равным
+    водяному знаку прошлого запуска минус overlap (запас на задержку
+    индексации hh.ru). Если новых публикаций больше, чем hh.ru отдаёт
+    на один запрос (2000), период дочитывается окнами по date_to.
+    Изменения определяются по хэшу содержимого,
+    в хранилище попадают только изменённые записи. Удалённые и архивные
+    вакансии выявляются лениво: за запуск перепроверяется не больше
+    recheck_limit давно не встречавшихся вакансий.
+    """
+
+    def __init__(self, api: HeadHunterAPI, saver: JSONSaver, state_path: str,
+                 overlap: timedelta = timedelta(minutes=10), recheck_limit: int = 20,
+                 clock: Callable[[], float] = time.time):
+        self._api = api
+        self._saver = saver
+        self.state = SyncState(state_path)
+        self._overlap = overlap
+        self._recheck_limit = recheck_limit
+        self._clock = clock
+
+    def _date_from(self, watermark: Optional[str]) -> Optional[str]:
+        if not watermark:
+            return None
+        moment = datetime.strptime(watermark, HH_DATE_FORMAT) - self._overlap
+        return moment.strftime(HH_DATE_FORMAT)
+
+    def sync(self, query: str, per_page: int = MAX_PER_PAGE) -> Dict[str, int]:
+        """
+        Синхронизировать один поисковый запрос.
+
+        Returns:
+            Счётчики: fetched, new, changed, unchanged, removed, skipped
+        """
+        state = self.state.query(query)
+        seen: Dict[str, str] = state["seen"]
+        checked: Dict[str, float] = state["checked"]
+        # Новые хэши и отметки проверки копятся отдельно (ChainMap пишет в первый
+        # словарь) и попадают в состояние только после успешного сохранения:
+        # иначе при сбое посреди выдачи следующий save() записал бы хэши
+        # вакансий, которые так и не были сохранены
+        pending_seen = ChainMap({}, seen)
+        pending_checked = ChainMap({}, checked)
+        now = self._clock()
+        stats = {"fetched": 0, "new": 0, "changed": 0, "unchanged": 0, "removed": 0, "skipped": 0}
+
+        filters = {"order_by": "publication_time"}
+        date_from = self._date_from(state["watermark"])
+        if date_from:
+            filters["date_from"] = date_from
+
+        watermark = state["watermark"]
+        to_save = []
+        archived: List[str] = []
+        # hh.ru отдаёт не больше MAX_RESULTS результатов на запрос: если окно
+        # упёрлось в этот предел, более старая часть дочитывается следующим окном
+        # с date_to, равным самой старой полученной публикации
+        per_page = max(1, min(per_page, MAX_PER_PAGE))
+        window_limit = (MAX_RESULTS // per_page) * per_page
+        date_to = None
+        while True:
+            window = dict(filters, date_to=date_to) if date_to else filters
+            fetched = 0
+            oldest = None
+            for items in self._api.iter_pages(query, per_page=per_page, filters=window):
+                for item in items:
+                    fetched += 1
+                    published_at = item.get("published_at")
+                    if published_at:
+                        if watermark is None or _parse(published_at) > _parse(watermark):
+                            watermark = published_at
+                        if oldest is None or _parse(published_at) < _parse(oldest):
+                            oldest = published_at
+                    self._consume(item, stats, pending_seen, pending_checked, now, to_save, archived)
+            stats["fetched"] += fetched
+            if fetched < window_limit or oldest is None:
+                break
+            if oldest == date_to:
+                # Больше MAX_RESULTS публикаций в одну секунду: дочитать их нельзя,
+                # сдвигаемся на секунду раньше, чтобы не зациклиться
+                oldest = (_parse(oldest) - timedelta(seconds=1)).strftime(HH_DATE_FORMAT)
+            date_to = oldest
+
+        if to_save:
+            self._saver.upsert_vacancies(to_save)
+        seen.update(pending_seen.maps[0])
+        checked.update(pending_checked.maps[0])
+        stats["removed"] = self._remove(archived, seen, checked) + self._recheck(seen, checked, now)
+        state["watermark"] = watermark
+        self.state.save()
+        return stats
+
+    @staticmethod
+    def _consume(item: Dict, stats: Dict[str, int], seen: MutableMapping[str, str],
+                 checked: MutableMapping[str, float],
+                 now: float, to_save: List, archived: List[str]) -> None:
+        """Учесть один элемент выдачи: новую или изменившуюся вакансию — к сохранению."""
+        if item.get("archived"):
+            archived.append(str(item.get("id")))
+            return
+        try:
+            vacancy = vacancy_from_hh_item(item)
+        except (ValueError, KeyError):
+            stats["skipped"] += 1
+            return
+        vacancy_id = str(item["id"])
+        digest = content_hash(vacancy.to_dict())
+        checked[vacancy_id] = now
+        previous = seen.get(vacancy_id)
+        if previous == digest:
+            stats["unchanged"] += 1
+            return
+        stats["new" if previous is None else "changed"] += 1
+        seen[vacancy_id] = digest
+        to_save.append(vacancy)
+
+    def _remove(self, vacancy_ids: List[str], seen: Dict, checked: Dict) -> int:
+        known = [vacancy_id for vacancy_id in vacancy_ids if vacancy_id in seen]
+        if known:
+            self._saver.delete_vacancies(HH_VACANCY_URL.format(vacancy_id) for vacancy_id in known)
+        for vacancy_id in known:
+            seen.pop(vacancy_id, None)
+            checked.pop(vacancy_id, None)
+        return len(known)
+
+    def _recheck(self, seen: Dict, checked: Dict, now: float) -> int:
+        """Проверить несколько давно не встречавшихся вакансий на удаление или архивацию."""
+        stale = sorted(
+            (vacancy_id for vacancy_id in seen if checked.get(vacancy_id, 0) < now),
+            key=lambda vacancy_id: checked.get(vacancy_id, 0)
+        )[:self._recheck_limit]
+        gone = []
+        for vacancy_id in stale:
+            try:
+                data = self._api.get_vacancy(vacancy_id)
+            except ConnectionError:
+                # Остальные проверим в следующий раз
+                break
+            if data is None or data.get("archived"):
+                gone.append(vacancy_id)
+            else:
+                checked[vacancy_id] = now
+        return self._remove(gone, seen, checked)
@@ -2,6 +2,8 @@ import sys
 from typing import List
 
 from api.hh_api import HeadHunterAPI
+from crawler import batch
+from models import query
 from models.vacancy import Vacancy
 from storage.json_saver import ConcreteJSONSaver  # Исправлено!
 
@@ -31,53 +33,37 @@ def user_interaction():
             "Введите ключевые слова для фильтрации описания (через пробел, например, 'опыт git'): "
         ).strip().split()
 
-        # Шаг 2. Получение вакансий с hh.ru
+        # Шаг 2-3. Получение вакансий с hh.ru и преобразование в объекты Vacancy
         print(f"\nИщем вакансии по запросу '{search_query}'...")
-        raw_vacancies = hh_api.get_vacancies(query=search_query, per_page=20)
+        skipped = []
 
-        if not raw_vacancies:
+        def report_skipped(item, error):
+            skipped.append(item)
+            print(f"Пропущена некорректная вакансия: {error}")
+
+        vacancies: List[Vacancy] = list(
+            hh_api.iter_vacancies(query=search_query, max_items=20, on_error=report_skipped)
+        )
+
+        if not vacancies and not skipped:
             print("По вашему запросу вакансии не найдены.")
             return
 
-        # Шаг 3. Преобразование в объекты Vacancy
-        vacancies: List[Vacancy] = []
-        for item in raw_vacancies:
-            try:
-                title = item.get("name", "")
-                url = f"https://hh.ru/vacancy/{item['id']}"  # Исправлено!
-                salary = item.get("salary")
-                if salary:
-                    salary_str = f"{salary.get('from', '')}–{salary.get('to', '')} {salary.get('currency', '')}"
-                else:
-                    salary_str = None
-                description = item.get("snippet", {}).get("requirement", "") or ""
-
-                vacancy = Vacancy(title=title, url=url, salary=salary_str, description=description)
-                vacancies.append(vacancy)
-            except (ValueError, KeyError) as e:
-                print(f"Пропущена некорректная вакансия: {e}")
-
         if not vacancies:
             print("Не удалось преобразовать ни одну вакансию.")
             return
 
         print(f"\nНайдено {len(vacancies)} вакансий.\n")
 
-        # Шаг 4. Фильтрация по ключевым словам в описании
+        # Шаг 4. Фильтрация по ключевым словам в описании (слова компилируются в одно выражение)
         if filter_words:
-            filtered = [
-                v for v in vacancies
-                if any(word.lower() in v.description.lower() for word in filter_words)
-            ]
+            filtered = list(query.filter_vacancies(vacancies, filter_words))
             print(f"После фильтрации по ключевым словам осталось {len(filtered)} вакансий.")
         else:
             filtered = vacancies
 
-        # Шаг 5. Сортировка по зарплате (убывание)
-        sorted_vacancies = sorted(filtered, key=lambda v: v.get_salary_value() or 0, reverse=True)
-
-        # Шаг 6. Топ N по зарплате
-        top_vacancies = sorted_vacancies[:top_n]
+        # Шаг 5-6. Топ N по зарплате через ограниченную кучу, без сортировки всего списка
+        top_vacancies = query.top_n(filtered, top_n)
 
         # Шаг 7. Вывод результатов
         print(f"\nТоп {len(top_vacancies)} вакансий по зарплате:\n")
@@ -89,11 +75,10 @@ def user_interaction():
                 print(f"   Описание: {vacancy.description[:150]}...")  # обрезка для компактности
             print("-! * 80")
 
-            # Шаг 8. Сохранение в JSON
-            save_choice = input("\nСохранить найденные вакансии в файл vacancies.json? (да/нет): ").strip().lower()
-            if save_choice in ("да", "y", "yes"):
-                for vacancy in sorted_vacancies:
-                    json_saver.add_vacancy(vacancy.to_dict())
+        # Шаг 8. Сохранение в JSON (одно чтение и одна запись файла на всю пачку)
+        save_choice = input("\nСохранить найденные вакансии в файл vacancies.json? (да/нет): ").strip().lower()
+        if save_choice in ("да", "y", "yes"):
+            json_saver.upsert_vacancies(filtered)
             print("Вакансии сохранены в файл vacancies.json.")
 
     except ValueError as e:
@@ -107,8 +92,11 @@ def user_interaction():
 def main():
     """
     Точка входа в программу.
-    Запускает интерактивное взаимодействие с пользователем.
+    Запускает интерактивное взаимодействие с пользователем, а с ключом
+    --batch — пакетный режим (python main.py --batch queries.txt [опции]).
     """
+    if len(sys.argv) > 1 and sys.argv[1] == "--batch":
+        sys.exit(batch.main(sys.argv[2:]))
     try:
         user_interaction()
     except KeyboardInterrupt:
@@ -118,5 +106,6 @@ def main():
         print(f"Критическая ошибка: {e}")
         sys.exit(1)
 
-        if __name__ == "__main__":
-            main()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+import logging
+import re
+from typing import Dict, Optional
+
+from storage.file_utils import atomic_write
+
+_PROMETHEUS_NAME_RE = re.compile(r"[^a-zA-Z0-9_]")
+
+
+class LogExporter:
+    """Записывает каждую метрику отдельной строкой в лог."""
+
+    def __init__(self, logger: Optional[logging.Logger] = None, level: int = logging.INFO):
+        self._logger = logger or logging.getLogger("metrics")
+        self._level = level
+
+    def export(self, snapshot: Dict[str, Dict]) -> None:
+        for name, value in sorted(snapshot["counters"].items()):
+            self._logger.log(self._level, "metric %s=%s", name, value)
+        for name, timer in sorted(snapshot["timers"].items()):
+            self._logger.log(
+                self._level, "metric %s count=%d total=%.6fs max=%.6fs",
+                name, timer["count"], timer["total"], timer["max"]
+            )
+
+
+def _prometheus_name(prefix: str, name: str) -> str:
+    return _PROMETHEUS_NAME_RE.sub("_", f"{prefix}_{name}" if prefix else name)
+
+
+def format_prometheus(snapshot: Dict[str, Dict], prefix: str = "") -> str:
+    """Снимок метрик в текстовом формате Prometheus."""
+    lines = []
+    for name, value in sorted(snapshot["counters"].items()):
+        metric = _prometheus_name(prefix, name) + "_total"
+        lines.append(f"# TYPE {metric} counter")
+        lines.append(f"{metric} {value}")
+    for name, timer in sorted(snapshot["timers"].items()):
+        metric = _prometheus_name(prefix, name) + "_seconds"
+        lines.append(f"# TYPE {metric} summary")
+        lines.append(f"{metric}_count {timer['count']}")
+        lines.append(f"{metric}_sum {timer['total']:.6f}")
+        lines.append(f"# TYPE {metric}_max gauge")
+        lines.append(f"{metric}_max {timer['max']:.6f}")
+    return "\n".join(lines) + "\n"
+
+
+class PrometheusTextfileExporter:
+    """
+    Пишет метрики в файл для textfile-коллектора node_exporter.
+
+    Файл заменяется атомарно, поэтому коллектор никогда не прочитает
+    его наполовину записанным.
+    """
+
+    def __init__(self, path: str, prefix: str = ""):
+        self.path = path
+        self.prefix = prefix
+
+    def export(self, snapshot: Dict[str, Dict]) -> None:
+        atomic_write(self.path, format_prometheus(snapshot, self.prefix).encode('utf-8'), durable=False)
+
+
+class SnapshotExporter:
+    """Хранит последний экспортированный снимок в памяти процесса (для тестов и панелей)."""
+
+    def __init__(self):
+        self.last: Optional[Dict[str, Dict]] = None
+
+    def export(self, snapshot: Dict[str, Dict]) -> None:
+        self.last = snapshot
@@ -0,0 +1,46 @@
+import cProfile
+import io
+import pstats
+import sys
+import tracemalloc
+from contextlib import contextmanager
+from typing import Iterator, Optional, TextIO
+
+
+@contextmanager
+def profile(output: Optional[str] = None, memory: bool = False, top: int = 20,
+            stream: Optional[TextIO] = None) -> Iterator[None]:
+    """
+    Профилировать блок кода через cProfile и, по желанию, tracemalloc.
+
+    Args:
+        output: файл для pstats (открывается snakeviz, pstats и т. п.);
+            если не задан, top самых затратных функций печатается в stream
+        memory: дополнительно отслеживать выделения памяти и напечатать
+            пиковый объём и top мест, где выделено больше всего
+        top: сколько строк печатать
+        stream: куда печатать отчёт (по умолчанию sys.stderr)
+    """
+    stream = stream or sys.stderr
+    profiler = cProfile.Profile()
+    if memory:
+        tracemalloc.start()
+    profiler.enable()
+    try:
+        yield
+    finally:
+        profiler.disable()
+        if output:
+            profiler.dump_stats(output)
+            print(f"Профиль сохранён в {output}", file=stream)
+        else:
+            buffer = io.StringIO()
+            pstats.Stats(profiler, stream=buffer).sort_stats("cumulative").print_stats(top)
+            stream.write(buffer.getvalue())
+        if memory:
+            snapshot = tracemalloc.take_snapshot()
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            print(f"Пик памяти: {peak / 1024 / 1024:.1f} МиБ", file=stream)
+            for stat in snapshot.statistics("lineno")[:top]:
+                print(stat, file=stream)
@@ -0,0 +1,147 @@
+import threading
+import time
+from functools import wraps
+from typing import Callable, Dict, List, Optional
+
+
+class _Timer:
+    """Контекстный менеджер замера времени блока."""
+
+    __slots__ = ("_registry", "_name", "_start")
+
+    def __init__(self, registry: "Metrics", name: str):
+        self._registry = registry
+        self._name = name
+
+    def __enter__(self) -> "_Timer":
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self._registry.observe(self._name, time.perf_counter() - self._start)
+
+
+class _NullTimer:
+    """Заглушка для выключенных метрик: ничего не измеряет."""
+
+    __slots__ = ()
+
+    def __enter__(self) -> "_NullTimer":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        pass
+
+
+_NULL_TIMER = _NullTimer()
+
+
+class Metrics:
+    """
+    Реестр счётчиков и таймеров.
+
+    По умолчанию выключен: в горячих местах код проверяет только
+    атрибут enabled, а timer() возвращает общую заглушку, поэтому
+    выключенные метрики почти ничего не стоят. Включённый реестр
+    потокобезопасен.
+
+    Имена метрик — через точку: "hh.requests", "storage.save".
+    Таймер хранит число замеров, сумму и максимум (в секундах).
+    """
+
+    def __init__(self, enabled: bool = False):
+        self.enabled = enabled
+        self._lock = threading.Lock()
+        self._counters: Dict[str, float] = {}
+        self._timers: Dict[str, List[float]] = {}
+        self._exporters: list = []
+
+    def incr(self, name: str, value: float = 1) -> None:
+        """Увеличить счётчик name на value."""
+        if not self.enabled:
+            return
+        with self._lock:
+            self._counters[name] = self._counters.get(name, 0) + value
+
+    def observe(self, name: str, seconds: float) -> None:
+        """Добавить замер длительности в таймер name."""
+        if not self.enabled:
+            return
+        with self._lock:
+            timer = self._timers.get(name)
+            if timer is None:
+                self._timers[name] = [1, seconds, seconds]
+            else:
+                timer[0] += 1
+                timer[1] += seconds
+                if seconds > timer[2]:
+                    timer[2] = seconds
+
+    def timer(self, name: str):
+        """Замерить время блока: with metrics.timer("storage.save"): ..."""
+        return _Timer(self, name) if self.enabled else _NULL_TIMER
+
+    def timed(self, name: str) -> Callable:
+        """Декоратор: замерять каждый вызов функции таймером name."""
+        def decorator(func: Callable) -> Callable:
+            @wraps(func)
+            def wrapper(*args, **kwargs):
+                if not self.enabled:
+                    return func(*args, **kwargs)
+                with _Timer(self, name):
+                    return func(*args, **kwargs)
+            return wrapper
+        return decorator
+
+    def snapshot(self) -> Dict[str, Dict]:
+        """
+        Текущие значения метрик.
+
+        Returns:
+            {"counters": {имя: значение},
+             "timers": {имя: {"count": ..., "total": ..., "max": ...}}}
+        """
+        with self._lock:
+            return {
+                "counters": dict(self._counters),
+                "timers": {
+                    name: {"count": count, "total": total, "max": maximum}
+                    for name, (count, total, maximum) in self._timers.items()
+                },
+            }
+
+    def reset(self) -> None:
+        with self._lock:
+            self._counters.clear()
+            self._timers.clear()
+
+    def add_exporter(self, exporter) -> None:
+        """Подключить экспортёр — объект с методом export(snapshot)."""
+        self._exporters.append(exporter)
+
+    def remove_exporter(self, exporter) -> None:
+        self._exporters.remove(exporter)
+
+    def export(self) -> Dict[str, Dict]:
+        """Передать текущий снимок всем экспортёрам и вернуть его."""
+        snapshot = self.snapshot()
+        for exporter in list(self._exporters):
+            exporter.export(snapshot)
+        return snapshot
+
+
+# Общий реестр процесса: его используют HeadHunterAPI, Vacancy и ConcreteJSONSaver
+METRICS = Metrics()
+
+
+def enable(*exporters, registry: Optional[Metrics] = None) -> Metrics:
+    """Включить сбор метрик и подключить экспортёры."""
+    registry = registry or METRICS
+    for exporter in exporters:
+        registry.add_exporter(exporter)
+    registry.enabled = True
+    return registry
+
+
+def disable(registry: Optional[Metrics] = None) -> None:
+    (registry or METRICS).enabled = False
@@ -0,0 +1,69 @@
+import heapq
+import re
+from typing import Callable, Iterable, Iterator, List, Optional
+
+from models.vacancy import Vacancy
+
+
+class KeywordMatcher:
+    """
+    Проверка «текст содержит хотя бы одно из слов» без учёта регистра.
+
+    Все слова компилируются в одно регулярное выражение, поэтому текст
+    просматривается один раз и не приводится к нижнему регистру заново
+    для каждого слова.
+    """
+
+    def __init__(self, words: Iterable[str]):
+        # lower(), а не casefold(): IGNORECASE сравнивает посимвольно, и «ß»,
+        # превращённое casefold() в «ss», перестало бы находить само себя
+        unique = {word.lower() for word in words if word and word.strip()}
+        self.words = sorted(unique)
+        # Длинные слова первыми: альтернатива находит самое длинное совпадение
+        alternatives = sorted((re.escape(word) for word in unique), key=len, reverse=True)
+        self._pattern = re.compile("|".join(alternatives), re.IGNORECASE) if alternatives else None
+
+    def __bool__(self) -> bool:
+        return self._pattern is not None
+
+    def __call__(self, text: str) -> bool:
+        if self._pattern is None:
+            return True
+        return self._pattern.search(text) is not None
+
+
+def salary_key(vacancy: Vacancy) -> int:
+    """Ключ сортировки по зарплате: вакансии без зарплаты — в конце."""
+    return vacancy.get_salary_value() or 0
+
+
+def filter_vacancies(vacancies: Iterable[Vacancy], words: Iterable[str],
+                     field: Callable[[Vacancy], str] = lambda v: v.description) -> Iterator[Vacancy]:
+    """Лениво отобрать вакансии, в тексте которых (по умолчанию — описании) есть одно из слов."""
+    matcher = KeywordMatcher(words)
+    if not matcher:
+        return iter(vacancies)
+    return (vacancy for vacancy in vacancies if matcher(field(vacancy)))
+
+
+def top_n(vacancies: Iterable[Vacancy], n: int,
+          key: Callable[[Vacancy], int] = salary_key) -> List[Vacancy]:
+    """
+    n вакансий с наибольшим ключом, по убыванию.
+
+    Работает на потоке через ограниченную кучу из n элементов:
+    O(N log n) по времени и O(n) по памяти. При равных ключах
+    сохраняется исходный порядок, как у sorted(..., reverse=True)[:n].
+    """
+    if n <= 0:
+        return []
+    return heapq.nlargest(n, vacancies, key=key)
+
+
+def search(vacancies: Iterable[Vacancy], words: Iterable[str] = (), n: Optional[int] = None,
+           key: Callable[[Vacancy], int] = salary_key) -> List[Vacancy]:
+    """Отфильтровать поток вакансий по словам и вернуть топ-n (или все, отсортированные)."""
+    filtered = filter_vacancies(vacancies, words)
+    if n is None:
+        return sorted(filtered, key=key, reverse=True)
+    return top_n(filtered, n, key=key)
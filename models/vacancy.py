@@ -1,15 +1,60 @@
 import re
-from functools import total_ordering
-from typing import Dict, Optional
+from functools import lru_cache, total_ordering
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from metrics.registry import METRICS
+
+NO_SALARY = "Зарплата не указана"
+
+_URL_RE = re.compile(r"^https?://")
+_SALARY_SPACES_RE = re.compile(r"(\d)\s+(\d)")
+_NUMBER_RE = re.compile(r"\d+")
+# Валюта — последнее слово строки зарплаты: "руб.", "RUR", "USD"
+_CURRENCY_RE = re.compile(r"([^\W\d_]+\.?)\s*$")
+# Открытая вилка: "от 100000 RUR" (только нижняя граница), "до 150000 RUR" (только верхняя)
+_FROM_RE = re.compile(r"^от\b", re.IGNORECASE)
+_TO_RE = re.compile(r"^до\b", re.IGNORECASE)
+
+
+@lru_cache(maxsize=4096)
+def parse_salary(value: str) -> Tuple[Optional[int], Optional[int], Optional[str]]:
+    """
+    Разобрать нормализованную строку зарплаты.
+
+    Returns:
+        (нижняя граница, верхняя граница, валюта). "от N" — только нижняя
+        граница, "до N" — только верхняя; если указано одно число без
+        пометки, обе границы равны ему. Строки зарплат сильно повторяются,
+        поэтому результаты кэшируются.
+    """
+    if value == NO_SALARY:
+        return None, None, None
+    numbers = _NUMBER_RE.findall(value)
+    match = _CURRENCY_RE.search(value)
+    currency = match.group(1) if match else None
+    if not numbers:
+        return None, None, currency
+    if len(numbers) > 1:
+        return int(numbers[0]), int(numbers[1]), currency
+    amount = int(numbers[0])
+    if _TO_RE.match(value):
+        return None, amount, currency
+    if _FROM_RE.match(value):
+        return amount, None, currency
+    return amount, amount, currency
 
 
 @total_ordering
 class Vacancy:
+    __slots__ = ("_title", "_url", "_salary", "_description", "_salary_from", "_salary_to", "_currency")
+
     def __init__(self, title: str, url: str, salary: Optional[str] = None, description: str = ""):
         self._title = self._validate_title(title)
         self._url = self._validate_url(url)
-        self._salary = self._validate_salary(salary)
+        self.salary = salary
         self._description = description.strip()
+        if METRICS.enabled:
+            METRICS.incr("vacancy.created")
 
     def to_dict(self) -> dict:
         """Преобразовать объект Vacancy в словарь для JSON-сериализации."""
@@ -35,15 +80,15 @@ class Vacancy:
     def _validate_url(self, value: str) -> str:
         if not value:
             raise ValueError("URL вакансии не может быть пустым")
-        if not re.match(r"^https?://", value):
+        if not _URL_RE.match(value):
             raise ValueError("Некорректный формат URL")
         return value
 
     def _validate_salary(self, value: Optional[str]) -> str:
         if value is None or not value.strip():
-            return "Зарплата не указана"
+            return NO_SALARY
         # Нормализуем: убираем пробелы в числах
-        normalized = re.sub(r"(\d)\s+(\d)", r"\1\2", value.strip())
+        normalized = _SALARY_SPACES_RE.sub(r"\1\2", value.strip())
         return normalized
 
     @property
@@ -69,6 +114,22 @@ class Vacancy:
     @salary.setter
     def salary(self, value: Optional[str]):
         self._salary = self._validate_salary(value)
+        # Разбираем один раз: сравнения и сортировка работают с готовыми числами
+        self._salary_from, self._salary_to, self._currency = parse_salary(self._salary)
+
+    @property
+    def salary_from(self) -> Optional[int]:
+        """Нижняя граница зарплаты."""
+        return self._salary_from
+
+    @property
+    def salary_to(self) -> Optional[int]:
+        """Верхняя граница зарплаты."""
+        return self._salary_to
+
+    @property
+    def currency(self) -> Optional[str]:
+        return self._currency
 
     @property
     def description(self) -> str:
@@ -79,11 +140,12 @@ class Vacancy:
         self._description = value.strip()
 
     def get_salary_value(self) -> Optional[int]:
-        """Извлечь числовое значение зарплаты (нижняя граница)."""
-        if self._salary == "Зарплата не указана":
-            return None
-        numbers = re.findall(r"\d+", self._salary)
-        return int(numbers[0]) if numbers else None
+        """
+        Извлечь числовое значение зарплаты для сравнения и сортировки.
+
+        Это нижняя граница, а для «до N» (нижней границы нет) — верхняя.
+        """
+        return self._salary_from if self._salary_from is not None else self._salary_to
 
     def __eq__(self, other) -> bool:
         if not isinstance(other, Vacancy):
@@ -125,5 +187,59 @@ class Vacancy:
             description=data.get("description", "")
         )
 
+    @classmethod
+    def _trusted(cls, title: str, url: str, salary: Optional[str], description: str) -> 'Vacancy':
+        """
+        Создать вакансию из уже проверенных и нормализованных данных без валидации.
+
+        Только для данных, которые ранее прошли через конструктор Vacancy
+        (например, прочитанных из нашего же хранилища).
+        """
+        vacancy = cls.__new__(cls)
+        vacancy._title = title
+        vacancy._url = url
+        vacancy._salary = salary or NO_SALARY
+        vacancy._description = description or ""
+        vacancy._salary_from, vacancy._salary_to, vacancy._currency = parse_salary(vacancy._salary)
+        return vacancy
+
+    @classmethod
+    def from_dicts(cls, records: Iterable[Dict], validate: bool = True) -> List['Vacancy']:
+        """
+        Создать список вакансий из словарей.
+
+        Args:
+            records: словари в формате to_dict()
+            validate: False — доверенные данные из собственного хранилища,
+                проверки и нормализация пропускаются
+        """
+        if validate:
+            return [cls.from_dict(data) for data in records]
+        trusted = cls._trusted
+        return [
+            trusted(data["title"], data["url"], data.get("salary"), data.get("description", ""))
+            for data in records
+        ]
+
+    @classmethod
+    def validate_records(cls, records: Iterable[Dict]) -> Tuple[List['Vacancy'], List[Tuple[int, str]]]:
+        """
+        Проверить пачку словарей, не останавливаясь на первой ошибке.
+
+        Returns:
+            (корректные вакансии, список ошибок в виде (номер записи, сообщение))
+        """
+        vacancies = []
+        errors = []
+        for index, data in enumerate(records):
+            try:
+                vacancies.append(cls.from_dict(data))
+            except KeyError as e:
+                errors.append((index, f"Отсутствует поле {e}"))
+            except (ValueError, TypeError, AttributeError) as e:
+                errors.append((index, str(e)))
+        METRICS.incr("vacancy.invalid", len(errors))
+        return vacancies, errors
+
     def __str__(self) -> str:
         return f"{self._title} — {self._salary} ({self._url})"
@@ -0,0 +1,146 @@
+import sys
+from array import array
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+from models.vacancy import Vacancy
+
+# Отсутствующая граница зарплаты в колонках array('q')
+MISSING = -1
+
+
+class PackedStrings:
+    """Последовательность строк в одном буфере UTF-8 со смещениями."""
+
+    __slots__ = ("_buffer", "_offsets")
+
+    def __init__(self):
+        self._buffer = bytearray()
+        self._offsets = array('Q', [0])
+
+    def __len__(self) -> int:
+        return len(self._offsets) - 1
+
+    def append(self, value: str) -> None:
+        self._buffer += value.encode('utf-8')
+        self._offsets.append(len(self._buffer))
+
+    def __getitem__(self, index: int) -> str:
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("PackedStrings index out of range")
+        return self._buffer[self._offsets[index]:self._offsets[index + 1]].decode('utf-8')
+
+    @property
+    def nbytes(self) -> int:
+        return len(self._buffer) + self._offsets.itemsize * len(self._offsets)
+
+
+class VacancyTable:
+    """
+    Компактное колоночное хранилище большого числа вакансий.
+
+    Названия, строки зарплат и валюты хранятся словарным кодированием
+    (каждая уникальная строка — один раз, в строке таблицы — только её код),
+    границы зарплат лежат в массивах array('q'), а URL и описания —
+    в упакованных буферах. Объекты Vacancy создаются только
+    по запросу (table[i], итерация).
+    """
+
+    def __init__(self, vacancies: Iterable[Vacancy] = ()):
+        self._title_codes = array('I')
+        self._titles: List[str] = []
+        self._title_index: Dict[str, int] = {}
+        self._salary_codes = array('I')
+        self._salaries: List[str] = []
+        self._salary_index: Dict[str, int] = {}
+        self._currency_codes = array('H')
+        self._currencies: List[Optional[str]] = [None]
+        self._currency_index: Dict[Optional[str], int] = {None: 0}
+        self.salary_from = array('q')
+        self.salary_to = array('q')
+        self._urls = PackedStrings()
+        self._descriptions = PackedStrings()
+        self.extend(vacancies)
+
+    def __len__(self) -> int:
+        return len(self._title_codes)
+
+    @staticmethod
+    def _encode(value, values: list, index: dict) -> int:
+        code = index.get(value)
+        if code is None:
+            code = index[value] = len(values)
+            values.append(sys.intern(value) if isinstance(value, str) else value)
+        return code
+
+    def append(self, vacancy: Vacancy) -> None:
+        self._title_codes.append(self._encode(vacancy.title, self._titles, self._title_index))
+        self._currency_codes.append(self._encode(vacancy.currency, self._currencies, self._currency_index))
+        self.salary_from.append(MISSING if vacancy.salary_from is None else vacancy.salary_from)
+        self.salary_to.append(MISSING if vacancy.salary_to is None else vacancy.salary_to)
+        self._urls.append(vacancy.url)
+        self._salary_codes.append(self._encode(vacancy.salary, self._salaries, self._salary_index))
+        self._descriptions.append(vacancy.description)
+
+    def extend(self, vacancies: Iterable[Vacancy]) -> None:
+        for vacancy in vacancies:
+            self.append(vacancy)
+
+    def title(self, index: int) -> str:
+        return self._titles[self._title_codes[index]]
+
+    def url(self, index: int) -> str:
+        return self._urls[index]
+
+    def currency(self, index: int) -> Optional[str]:
+        return self._currencies[self._currency_codes[index]]
+
+    @property
+    def currency_codes(self) -> memoryview:
+        """
+        Коды валют по строкам (uint16, индексы в currencies) — только для чтения, без копии.
+
+        Пока представление существует, добавлять строки в таблицу нельзя (BufferError).
+        """
+        return memoryview(self._currency_codes).toreadonly()
+
+    @property
+    def currencies(self) -> Tuple[Optional[str], ...]:
+        """Словарь валют: код → валюта (код 0 — валюта не указана)."""
+        return tuple(self._currencies)
+
+    def __getitem__(self, index: int) -> Vacancy:
+        """Собрать объект Vacancy для строки таблицы."""
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("VacancyTable index out of range")
+        # Данные попали в таблицу из объектов Vacancy и уже проверены
+        return Vacancy._trusted(
+            self._titles[self._title_codes[index]],
+            self._urls[index],
+            self._salaries[self._salary_codes[index]],
+            self._descriptions[index]
+        )
+
+    def __iter__(self) -> Iterator[Vacancy]:
+        for index in range(len(self)):
+            yield self[index]
+
+    def to_dicts(self) -> List[dict]:
+        return [vacancy.to_dict() for vacancy in self]
+
+    @property
+    def nbytes(self) -> int:
+        """Приблизительный объём памяти таблицы в байтах (с уникальными строками)."""
+        return (
+            self._title_codes.itemsize * len(self._title_codes)
+            + sum(sys.getsizeof(title) for title in self._titles)
+            + self._salary_codes.itemsize * len(self._salary_codes)
+            + sum(sys.getsizeof(salary) for salary in self._salaries)
+            + self._currency_codes.itemsize * len(self._currency_codes)
+            + self.salary_from.itemsize * len(self.salary_from)
+            + self.salary_to.itemsize * len(self.salary_to)
+            + self._urls.nbytes + self._descriptions.nbytes
+        )
@@ -0,0 +1,347 @@
+"""
+Компактный двоичный архив вакансий с доступом через mmap.
+
+Структура файла:
+    заголовок   MAGIC, версия, кодек сжатия
+    блоки       по block_size записей, каждый сжат отдельно (zstd, gzip или без сжатия);
+                внутри блока — таблица записей фиксированной ширины
+                (границы зарплаты и смещения строк) и «куча» строк UTF-8
+    таблица блоков   смещение, длина, число записей, min/max нижней границы зарплаты
+    индекс URL  отсортированные пары (хэш URL, номер блока, номер записи)
+    трейлер     смещения таблицы блоков и индекса URL
+
+Поиск по URL — двоичный поиск по индексу и распаковка одного блока,
+поиск по диапазону зарплат распаковывает только блоки, чей min/max
+пересекается с диапазоном.
+"""
+import gzip
+import hashlib
+import mmap
+import struct
+from collections import OrderedDict
+from typing import Iterable, Iterator, List, Optional, Tuple
+
+from models.vacancy import NO_SALARY, Vacancy, parse_salary
+from storage.file_utils import atomic_open
+from storage.json_saver import ConcreteJSONSaver
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+MAGIC = b"HHVA"
+TRAILER_MAGIC = b"HHVE"
+VERSION = 1
+
+CODEC_NONE = "none"
+CODEC_GZIP = "gzip"
+CODEC_ZSTD = "zstd"
+_CODEC_IDS = {CODEC_NONE: 0, CODEC_GZIP: 1, CODEC_ZSTD: 2}
+
+_FIELDS = ("title", "url", "salary", "description")
+# Отсутствующая граница зарплаты и отсутствующая строка (None)
+MISSING = -1
+_NONE_LENGTH = 0xFFFFFFFF
+
+_HEADER = struct.Struct("<4sHBx")
+# salary_from, salary_to и (смещение, длина) для каждого из _FIELDS
+_RECORD = struct.Struct("<qq8I")
+_BLOCK_COUNT = struct.Struct("<I")
+# смещение в файле, длина сжатого блока, число записей, min и max зарплаты (_salary_value)
+_BLOCK_ENTRY = struct.Struct("<QIIqq")
+# хэш URL, номер блока, номер записи в блоке
+_URL_ENTRY = struct.Struct("<QII")
+_TRAILER = struct.Struct("<QIQI4s")
+
+
+def default_codec() -> str:
+    """zstd, если установлен пакет zstandard, иначе gzip."""
+    return CODEC_ZSTD if zstandard is not None else CODEC_GZIP
+
+
+def _url_hash(url: str) -> int:
+    return int.from_bytes(hashlib.blake2b(url.encode('utf-8'), digest_size=8).digest(), "little")
+
+
+def _compress(codec: str, data: bytes) -> bytes:
+    if codec == CODEC_ZSTD:
+        return zstandard.ZstdCompressor(level=3).compress(data)
+    if codec == CODEC_GZIP:
+        return gzip.compress(data, compresslevel=6, mtime=0)
+    return data
+
+
+def _decompress(codec: str, data: bytes) -> bytes:
+    if codec == CODEC_ZSTD:
+        if zstandard is None:
+            raise RuntimeError("Архив сжат zstd: установите пакет zstandard")
+        return zstandard.ZstdDecompressor().decompress(data)
+    if codec == CODEC_GZIP:
+        return gzip.decompress(data)
+    return data
+
+
+def _salary_value(salary_from: Optional[int], salary_to: Optional[int]) -> int:
+    """Зарплата для поиска по диапазону, как Vacancy.get_salary_value: «до N» даёт N."""
+    if salary_from is not None and salary_from != MISSING:
+        return salary_from
+    return MISSING if salary_to is None else salary_to
+
+
+def _encode_block(records: List[dict]) -> Tuple[bytes, int, int]:
+    """Упаковать записи блока. Возвращает (данные, min и max зарплаты, см. _salary_value)."""
+    table = bytearray(_BLOCK_COUNT.pack(len(records)))
+    heap = bytearray()
+    salary_min = salary_max = MISSING
+    for record in records:
+        salary_from, salary_to, _ = parse_salary(record.get("salary") or NO_SALARY)
+        value = _salary_value(salary_from, salary_to)
+        if value != MISSING:
+            salary_min = value if salary_min == MISSING else min(salary_min, value)
+            salary_max = max(salary_max, value)
+        spans = []
+        for field in _FIELDS:
+            value = record.get(field)
+            if value is None:
+                spans.extend((0, _NONE_LENGTH))
+            else:
+                encoded = value.encode('utf-8')
+                spans.extend((len(heap), len(encoded)))
+                heap += encoded
+        table += _RECORD.pack(
+            MISSING if salary_from is None else salary_from,
+            MISSING if salary_to is None else salary_to,
+            *spans
+        )
+    return bytes(table + heap), salary_min, salary_max
+
+
+def _decode_block(data: bytes) -> Tuple[List[dict], List[int]]:
+    """Распаковать записи блока. Возвращает (записи, зарплаты по _salary_value или MISSING)."""
+    (count,) = _BLOCK_COUNT.unpack_from(data)
+    heap_start = _BLOCK_COUNT.size + count * _RECORD.size
+    table = memoryview(data)[_BLOCK_COUNT.size:heap_start]
+    records = []
+    salaries = []
+    for values in _RECORD.iter_unpack(table):
+        salaries.append(_salary_value(values[0], values[1]))
+        record = {}
+        for i, field in enumerate(_FIELDS):
+            start, length = values[2 + 2 * i], values[3 + 2 * i]
+            if length == _NONE_LENGTH:
+                record[field] = None
+            else:
+                start += heap_start
+                record[field] = data[start:start + length].decode('utf-8')
+        records.append(record)
+    return records, salaries
+
+
+def write_archive(path: str, records: Iterable[dict], codec: Optional[str] = None,
+                  block_size: int = 1024) -> int:
+    """
+    Записать вакансии в архив (атомарно, потоково — без сборки файла в памяти).
+
+    Args:
+        path: путь к файлу архива
+        records: словари в формате Vacancy.to_dict(); повторы URL отбрасываются,
+            остаётся первая запись (как в ConcreteJSONSaver)
+        codec: "zstd", "gzip" или "none"; по умолчанию — default_codec()
+        block_size: число записей в блоке; больше — лучше сжатие,
+            меньше — меньше распаковывать при точечном поиске
+
+    Returns:
+        Количество записанных вакансий
+    """
+    codec = codec or default_codec()
+    if codec not in _CODEC_IDS:
+        raise ValueError(f"Неизвестный кодек: {codec}")
+    if codec == CODEC_ZSTD and zstandard is None:
+        raise RuntimeError("Для кодека zstd установите пакет zstandard")
+
+    blocks: List[bytes] = []
+    url_entries: List[Tuple[int, int, int]] = []
+    seen = set()
+
+    with atomic_open(path) as f:
+        f.write(_HEADER.pack(MAGIC, VERSION, _CODEC_IDS[codec]))
+        position = _HEADER.size
+
+        def flush(batch: List[dict]) -> None:
+            nonlocal position
+            data, salary_min, salary_max = _encode_block(batch)
+            compressed = _compress(codec, data)
+            f.write(compressed)
+            blocks.append(_BLOCK_ENTRY.pack(position, len(compressed), len(batch), salary_min, salary_max))
+            position += len(compressed)
+
+        batch: List[dict] = []
+        for record in records:
+            url = record["url"]
+            if url in seen:
+                continue
+            seen.add(url)
+            url_entries.append((_url_hash(url), len(blocks), len(batch)))
+            batch.append(record)
+            if len(batch) >= block_size:
+                flush(batch)
+                batch = []
+        if batch:
+            flush(batch)
+
+        blocks_offset = position
+        f.write(b"".join(blocks))
+        urls_offset = blocks_offset + _BLOCK_ENTRY.size * len(blocks)
+        url_entries.sort()
+        f.write(b"".join(_URL_ENTRY.pack(*entry) for entry in url_entries))
+        f.write(_TRAILER.pack(blocks_offset, len(blocks), urls_offset, len(url_entries), TRAILER_MAGIC))
+    return len(url_entries)
+
+
+class ArchiveReader:
+    """
+    Чтение архива через mmap: файл не читается целиком, распаковываются
+    только нужные блоки (последние cache_blocks распакованных блоков кэшируются).
+    """
+
+    def __init__(self, path: str, cache_blocks: int = 8):
+        self.path = path
+        self._file = open(path, 'rb')
+        try:
+            self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            self._file.close()
+            raise ValueError(f"{path}: пустой файл не является архивом вакансий")
+        if len(self._map) < _HEADER.size + _TRAILER.size:
+            self.close()
+            raise ValueError(f"{path}: не является архивом вакансий")
+        magic, version, codec_id = _HEADER.unpack_from(self._map, 0)
+        blocks_offset, block_count, urls_offset, url_count, trailer = _TRAILER.unpack_from(
+            self._map, len(self._map) - _TRAILER.size
+        )
+        if magic != MAGIC or trailer != TRAILER_MAGIC:
+            self.close()
+            raise ValueError(f"{path}: не является архивом вакансий")
+        if version != VERSION:
+            self.close()
+            raise ValueError(f"{path}: неподдерживаемая версия архива {version}")
+        self.codec = {value: key for key, value in _CODEC_IDS.items()}[codec_id]
+        self._blocks = [
+            _BLOCK_ENTRY.unpack_from(self._map, blocks_offset + i * _BLOCK_ENTRY.size)
+            for i in range(block_count)
+        ]
+        self._urls_offset = urls_offset
+        self._url_count = url_count
+        self._cache: "OrderedDict[int, List[dict]]" = OrderedDict()
+        self._cache_blocks = max(1, cache_blocks)
+
+    def __enter__(self) -> "ArchiveReader":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        if not self._map.closed:
+            self._map.close()
+        self._file.close()
+
+    def __len__(self) -> int:
+        return self._url_count
+
+    @property
+    def block_count(self) -> int:
+        return len(self._blocks)
+
+    def _read_block(self, index: int) -> Tuple[List[dict], List[int]]:
+        offset, length = self._blocks[index][:2]
+        return _decode_block(_decompress(self.codec, self._map[offset:offset + length]))
+
+    def _block(self, index: int) -> Tuple[List[dict], List[int]]:
+        block = self._cache.get(index)
+        if block is not None:
+            self._cache.move_to_end(index)
+            return block
+        block = self._cache[index] = self._read_block(index)
+        if len(self._cache) > self._cache_blocks:
+            self._cache.popitem(last=False)
+        return block
+
+    def _url_entry(self, position: int) -> Tuple[int, int, int]:
+        return _URL_ENTRY.unpack_from(self._map, self._urls_offset + position * _URL_ENTRY.size)
+
+    def get_by_url(self, vacancy_url: str) -> Optional[dict]:
+        """Найти вакансию по URL, распаковав не больше одного блока (кроме коллизий хэша)."""
+        target = _url_hash(vacancy_url)
+        low, high = 0, self._url_count
+        while low < high:
+            middle = (low + high) // 2
+            if self._url_entry(middle)[0] < target:
+                low = middle + 1
+            else:
+                high = middle
+        while low < self._url_count:
+            url_hash, block, slot = self._url_entry(low)
+            if url_hash != target:
+                break
+            record = self._block(block)[0][slot]
+            if record["url"] == vacancy_url:
+                return dict(record)
+            low += 1
+        return None
+
+    def exists(self, vacancy_url: str) -> bool:
+        return self.get_by_url(vacancy_url) is not None
+
+    def get_by_salary_range(self, salary_min: Optional[int] = None,
+                            salary_max: Optional[int] = None) -> List[dict]:
+        """
+        Вакансии с зарплатой в [salary_min, salary_max], по возрастанию зарплаты.
+
+        Зарплата — нижняя граница, а для «до N» — верхняя (как Vacancy.get_salary_value).
+
+        Блоки, чей диапазон зарплат не пересекается с запрошенным, не распаковываются.
+        """
+        # Зарплаты неотрицательны, MISSING (-1) отсекается нижней границей
+        low = max(salary_min, 0) if salary_min is not None else 0
+        found: List[Tuple[int, dict]] = []
+        for index, (_, _, _, block_min, block_max) in enumerate(self._blocks):
+            if block_max == MISSING or block_max < low or (salary_max is not None and block_min > salary_max):
+                continue
+            records, salaries = self._block(index)
+            for record, salary_from in zip(records, salaries):
+                if salary_from < low:
+                    continue
+                if salary_max is not None and salary_from > salary_max:
+                    continue
+                found.append((salary_from, dict(record)))
+        found.sort(key=lambda item: item[0])
+        return [record for _, record in found]
+
+    def __iter__(self) -> Iterator[dict]:
+        """Все вакансии в порядке записи (блоки распаковываются по одному)."""
+        for index in range(len(self._blocks)):
+            yield from self._read_block(index)[0]
+
+    def get_vacancies(self) -> List[dict]:
+        return list(self)
+
+
+def json_to_archive(json_path: str, archive_path: str, codec: Optional[str] = None,
+                    block_size: int = 1024) -> int:
+    """Перенести вакансии из JSON-файла ConcreteJSONSaver в архив. Возвращает число записей."""
+    records = ConcreteJSONSaver(json_path).get_vacancies(copy=False)
+    return write_archive(archive_path, records, codec=codec, block_size=block_size)
+
+
+def archive_to_json(archive_path: str, json_path: str) -> int:
+    """
+    Выгрузить архив в JSON-файл ConcreteJSONSaver (существующие записи с теми же URL заменяются).
+
+    Returns:
+        Количество выгруженных вакансий
+    """
+    with ArchiveReader(archive_path) as reader:
+        vacancies = Vacancy.from_dicts(reader, validate=False)
+    return ConcreteJSONSaver(json_path).upsert_vacancies(vacancies)
@@ -0,0 +1,108 @@
+import os
+import tempfile
+from contextlib import contextmanager
+from typing import BinaryIO, Iterator
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    try:
+        import msvcrt
+    except ImportError:
+        msvcrt = None
+
+
+def _current_umask() -> int:
+    # Узнать umask можно только установив новый; читаем один раз при импорте
+    mask = os.umask(0)
+    os.umask(mask)
+    return mask
+
+
+_UMASK = _current_umask()
+
+
+def _target_mode(path: str) -> int:
+    """Права для нового содержимого path: как у существующего файла, иначе как у open() (0666 & ~umask)."""
+    try:
+        return os.stat(path).st_mode & 0o7777
+    except FileNotFoundError:
+        return 0o666 & ~_UMASK
+
+
+def _fsync_directory(directory: str) -> None:
+    """Сбросить на диск запись каталога, чтобы переименование пережило сбой питания."""
+    if not hasattr(os, "O_DIRECTORY"):
+        return  # Windows: каталог нельзя открыть на чтение
+    fd = os.open(directory, os.O_RDONLY | os.O_DIRECTORY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+@contextmanager
+def atomic_open(path: str, durable: bool = True) -> Iterator[BinaryIO]:
+    """
+    Открыть временный файл рядом с path на запись; при успешном выходе он заменяет path.
+
+    Подходит для потоковой записи больших файлов, которые не нужно
+    собирать в памяти целиком. При исключении path остаётся прежним.
+    Права доступа сохраняются от прежнего файла (для нового — 0666 с учётом umask).
+
+    Args:
+        path: путь к файлу
+        durable: вызвать fsync для файла и каталога; после сбоя на диске
+            окажется либо старая, либо новая версия файла целиком
+    """
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".tmp-")
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            yield f
+            if hasattr(os, "fchmod"):
+                # mkstemp создаёт файл с правами 0600, а os.replace их сохранил бы
+                os.fchmod(f.fileno(), _target_mode(path))
+            if durable:
+                f.flush()
+                os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+    if durable:
+        _fsync_directory(directory)
+
+
+def atomic_write(path: str, payload: bytes, durable: bool = True) -> None:
+    """Записать файл атомарно: во временный файл в том же каталоге и затем os.replace (см. atomic_open)."""
+    with atomic_open(path, durable=durable) as f:
+        f.write(payload)
+
+
+@contextmanager
+def file_lock(path: str) -> Iterator[None]:
+    """
+    Эксклюзивная рекомендательная блокировка на файле path (создаётся при необходимости).
+
+    Блокирует и другие процессы, и другие потоки этого процесса, открывшие
+    тот же файл блокировки. Лочится отдельный файл, а не сами данные:
+    данные заменяются через os.replace, и блокировка на старом inode
+    ничего бы не защищала.
+    """
+    with open(path, 'a+b') as f:
+        if fcntl is not None:
+            fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+        elif msvcrt is not None:
+            f.seek(0)
+            msvcrt.locking(f.fileno(), msvcrt.LK_LOCK, 1)
+        try:
+            yield
+        finally:
+            if fcntl is not None:
+                fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+            elif msvcrt is not None:
+                f.seek(0)
+                msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
@@ -0,0 +1,79 @@
+import json
+from itertools import chain
+from typing import Callable, Dict, Iterable, Iterator, Optional
+
+from api.hh_converter import iter_normalized_chunks, vacancies_from_rows
+from storage.json_saver import JSONSaver
+
+
+def _items_from(data) -> Iterator[Dict]:
+    if isinstance(data, list):
+        for element in data:
+            yield from _items_from(element)
+    elif isinstance(data, dict):
+        if "items" in data:
+            yield from data["items"] or []
+        else:
+            yield data
+
+
+def iter_raw_items(path: str) -> Iterator[Dict]:
+    """
+    Прочитать элементы вакансий из архива сырых ответов hh.ru.
+
+    Поддерживаются JSON-файл с одной страницей ответа ({"items": [...]})
+    или списком страниц/элементов, а также JSON Lines — по странице
+    или элементу в строке (повреждённые строки пропускаются, в том числе
+    первая). JSON Lines читается построчно, обычный JSON — целиком
+    (по одному файлу за раз).
+    """
+    with open(path, 'r', encoding='utf-8') as f:
+        first = f.readline()
+        while first and not first.strip():
+            first = f.readline()
+        try:
+            data = json.loads(first)
+        except json.JSONDecodeError:
+            # Первая строка — не законченный JSON: либо файл с отступами,
+            # либо JSON Lines с повреждённой первой строкой
+            rest = f.tell()
+            try:
+                document = json.loads(first + f.read())
+            except json.JSONDecodeError:
+                f.seek(rest)  # JSON Lines: пропускаем повреждённую строку и читаем дальше
+            else:
+                yield from _items_from(document)
+                return
+        else:
+            yield from _items_from(data)
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                data = json.loads(line)
+            except json.JSONDecodeError:
+                continue
+            yield from _items_from(data)
+
+
+def import_raw_files(paths: Iterable[str], saver: JSONSaver, workers: Optional[int] = None,
+                     chunk_size: int = 5000,
+                     on_error: Optional[Callable[[Dict, Exception], None]] = None) -> int:
+    """
+    Загрузить архивы сырых ответов hh.ru в хранилище.
+
+    Файлы читаются по одному, элементы нормализуются пачками в пуле
+    процессов (api.hh_converter.iter_normalized_chunks), и каждая готовая
+    пачка сразу сохраняется через upsert_vacancies. В памяти одновременно
+    находится не больше нескольких пачек, порядок элементов сохраняется.
+
+    Returns:
+        Количество сохранённых вакансий
+    """
+    items = chain.from_iterable(iter_raw_items(path) for path in paths)
+    saved = 0
+    for rows in iter_normalized_chunks(items, workers=workers, chunk_size=chunk_size, on_error=on_error):
+        if rows:
+            saved += saver.upsert_vacancies(vacancies_from_rows(rows))
+    return saved
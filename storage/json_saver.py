@@ -1,6 +1,37 @@
 import json
+import os
+import threading
+import time
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from functools import partial
+from types import MappingProxyType
+from typing import Callable, Dict, Iterable, List, Mapping, Optional, Tuple
+
+from metrics.registry import METRICS
+from storage.file_utils import atomic_write, file_lock
+from storage.text_index import InvertedIndex
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _loads(data: bytes):
+    """Разобрать JSON, через orjson, если он установлен (в несколько раз быстрее)."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data.decode('utf-8'))
+
+
+def _dumps_pretty(item: dict) -> bytes:
+    """То же, что json.dumps(item, ensure_ascii=False, indent=2), в UTF-8."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(item, option=orjson.OPT_INDENT_2)
+        except TypeError:
+            pass  # orjson не принимает, например, одиночные суррогаты — их пишет json
+    return json.dumps(item, ensure_ascii=False, indent=2).encode('utf-8')
 
 
 class JSONSaver(ABC):
@@ -12,43 +43,387 @@ class JSONSaver(ABC):
     def delete_vacancy(self, vacancy_url: str) -> bool:
         pass  # Только объявление — реализация в наследнике
 
+    def add_vacancies(self, vacancies: Iterable) -> int:
+        """Добавить несколько вакансий. Возвращает количество добавленных."""
+        count = 0
+        for vacancy in vacancies:
+            self.add_vacancy(vacancy)
+            count += 1
+        return count
+
+    def delete_vacancies(self, vacancy_urls: Iterable[str]) -> int:
+        """Удалить вакансии по набору URL. Возвращает количество удалённых URL."""
+        return sum(1 for url in set(vacancy_urls) if self.delete_vacancy(url))
+
+    def upsert_vacancies(self, vacancies: Iterable) -> int:
+        """Добавить вакансии, заменив уже сохранённые с теми же URL."""
+        vacancies = list(vacancies)
+        self.delete_vacancies(v.url for v in vacancies)
+        return self.add_vacancies(vacancies)
+
+
+class _PendingWrite:
+    """Изменение, ожидающее групповой записи."""
+
+    __slots__ = ("change", "result", "error", "done")
+
+    def __init__(self, change: Callable[[Dict[str, dict]], int]):
+        self.change = change
+        self.result = 0
+        self.error: Optional[BaseException] = None
+        self.done = False
+
 
 class ConcreteJSONSaver(JSONSaver):
-    def __init__(self, filepath: str):
+    """
+    Хранилище вакансий в JSON-файле с индексом по URL.
+
+    В памяти данные хранятся как упорядоченный словарь URL → запись, поэтому
+    поиск, проверка наличия и удаление выполняются за O(1), а повторное
+    добавление той же вакансии отклоняется. Рядом с файлом данных
+    сохраняется индекс (<файл>.idx) со смещениями записей: по нему
+    get_by_url и exists работают, не разбирая весь JSON.
+
+    Поиск по ключевым словам идёт через инвертированный индекс по названию
+    и описанию, который строится при первом поиске и далее обновляется
+    при каждом добавлении и удалении.
+
+    Файл переписывается атомарно (временный файл, fsync, os.replace), а
+    чтение-изменение-запись выполняется под файловой блокировкой
+    (<файл>.lock), так что несколько потоков и процессов могут писать
+    в один файл, не теряя изменений друг друга.
+    """
+
+    def __init__(self, filepath: str, group_commit: bool = False, commit_delay: float = 0.0):
+        """
+        Args:
+            filepath: путь к JSON-файлу
+            group_commit: объединять изменения из нескольких потоков в одну запись файла
+            commit_delay: сколько секунд «лидер» группы ждёт перед записью,
+                собирая изменения других потоков (только при group_commit)
+        """
         self.filepath = filepath
+        self.index_path = f"{filepath}.idx"
+        self.lock_path = f"{filepath}.lock"
+        self.group_commit = group_commit
+        self.commit_delay = commit_delay
+        self._records: Optional[Dict[str, dict]] = None
+        self._stamp: Optional[Tuple[int, int, int]] = None
+        self._text_index: Optional[InvertedIndex] = None
+        # Защищает состояние в памяти от потоков этого процесса;
+        # от других процессов защищает файловая блокировка lock_path
+        self._lock = threading.Lock()
+        self._pending: List[_PendingWrite] = []
+        # Очередь group_commit; лидер ждёт commit_delay без self._lock, чтобы не блокировать чтение
+        self._pending_cond = threading.Condition()
+        self._flushing = False
 
-    def add_vacancy(self, vacancy) -> None:
-        data = self._load_data()
-        data.append(vacancy.to_dict())
-        self._save_data(data)
+    def add_vacancy(self, vacancy) -> bool:
+        """Добавить вакансию. Возвращает False, если вакансия с таким URL уже сохранена."""
+        return self._write(partial(self._add_records, [vacancy.to_dict()])) > 0
+
+    def add_vacancies(self, vacancies: Iterable) -> int:
+        """Добавить несколько вакансий за одно чтение и одну запись файла, пропуская дубликаты."""
+        return self._write(partial(self._add_records, [vacancy.to_dict() for vacancy in vacancies]))
 
     def delete_vacancy(self, vacancy_url: str) -> bool:
         """Удалить вакансию по URL. Возвращает True, если вакансия была найдена и удалена."""
-        data = self._load_data()
-        filtered_data = [item for item in data if item["url"] != vacancy_url]
-
-        if len(filtered_data) < len(data):
-            self._save_data(filtered_data)
-            return True  # Явно возвращаем True при успешном удалении
-        return False  # Вакансия не найдена
-
-    def get_vacancies(self, keyword: Optional[str] = None) -> List[dict]:
-        data = self._load_data()
-        if not keyword:
-            return data
-        filtered = []
+        return self._write(partial(self._delete_urls, {vacancy_url})) > 0
+
+    def delete_vacancies(self, vacancy_urls: Iterable[str]) -> int:
+        """Удалить все вакансии с URL из набора. Возвращает количество найденных URL."""
+        return self._write(partial(self._delete_urls, set(vacancy_urls)))
+
+    def upsert_vacancies(self, vacancies: Iterable) -> int:
+        """
+        Добавить или обновить вакансии за одно чтение и одну запись файла.
+
+        Запись с совпадающим URL заменяется на месте, новые вакансии
+        дописываются в конец в исходном порядке.
+        """
+        return self._write(partial(self._upsert_records, [vacancy.to_dict() for vacancy in vacancies]))
+
+    def _add_records(self, new_records: List[dict], records: Dict[str, dict]) -> int:
+        added = 0
+        for record in new_records:
+            if record["url"] not in records:
+                records[record["url"]] = record
+                self._index_record(record)
+                added += 1
+        return added
+
+    def _delete_urls(self, urls: Iterable[str], records: Dict[str, dict]) -> int:
+        deleted = 0
+        for url in urls:
+            if records.pop(url, None) is not None:
+                self._unindex(url)
+                deleted += 1
+        return deleted
+
+    def _upsert_records(self, new_records: List[dict], records: Dict[str, dict]) -> int:
+        for record in new_records:
+            records[record["url"]] = record
+            self._index_record(record)
+        return len(new_records)
+
+    def _write(self, change: Callable[[Dict[str, dict]], int]) -> int:
+        """
+        Применить изменение под блокировками и сохранить файл, если что-то изменилось.
+
+        Файл перечитывается под файловой блокировкой, поэтому изменения,
+        сделанные другим процессом между нашими вызовами, не теряются.
+        В режиме group_commit изменение ставится в очередь; первый поток
+        становится лидером: ждёт commit_delay (не держа self._lock, так что
+        чтение не блокируется), затем применяет всю очередь и пишет файл
+        один раз. Остальные потоки ждут на условной переменной.
+
+        Args:
+            change: функция, изменяющая словарь URL → запись и возвращающая
+                число затронутых записей (0 — файл не переписывается)
+        """
+        if not self.group_commit:
+            with self._lock, file_lock(self.lock_path):
+                try:
+                    changed = change(self._load_records())
+                    if changed:
+                        METRICS.incr("storage.records_changed", changed)
+                        self._commit()
+                except BaseException:
+                    self._records = None  # Состояние в памяти могло разойтись с файлом
+                    raise
+                return changed
+
+        pending = _PendingWrite(change)
+        with self._pending_cond:
+            self._pending.append(pending)
+            while self._flushing and not pending.done:
+                self._pending_cond.wait()
+            if pending.done:
+                return self._pending_result(pending)
+            self._flushing = True
+        try:
+            if self.commit_delay > 0:
+                # Собираем изменения других потоков, не держа self._lock
+                time.sleep(self.commit_delay)
+            with self._pending_cond:
+                batch, self._pending = self._pending, []
+            with self._lock:
+                self._flush_batch(batch)
+        finally:
+            with self._pending_cond:
+                # Изменения, пришедшие во время записи, запишет следующий лидер из ожидающих
+                self._flushing = False
+                self._pending_cond.notify_all()
+        return self._pending_result(pending)
+
+    @staticmethod
+    def _pending_result(pending: _PendingWrite) -> int:
+        if pending.error is not None:
+            raise pending.error
+        return pending.result
+
+    def _flush_batch(self, batch: List[_PendingWrite]) -> None:
+        """Применить пачку изменений и записать файл один раз (вызывается под self._lock)."""
+        try:
+            with file_lock(self.lock_path):
+                records = self._load_records()
+                changed = 0
+                for pending in batch:
+                    try:
+                        pending.result = pending.change(records)
+                        changed += pending.result
+                    except Exception as e:
+                        pending.error = e
+                if changed:
+                    METRICS.incr("storage.records_changed", changed)
+                    METRICS.incr("storage.group_commits")
+                    self._commit()
+        except BaseException as e:
+            self._records = None
+            for pending in batch:
+                if pending.error is None:
+                    pending.error = e
+        finally:
+            for pending in batch:
+                pending.done = True
+
+    def exists(self, vacancy_url: str) -> bool:
+        """Проверить, сохранена ли вакансия с данным URL."""
+        with self._lock:
+            if not self._is_fresh():
+                offsets = self._load_index(self._file_stamp())
+                if offsets is not None:
+                    return vacancy_url in offsets
+            return vacancy_url in self._load_records()
+
+    def get_by_url(self, vacancy_url: str, copy: bool = True) -> Optional[Mapping]:
+        """Получить сохранённую вакансию по URL или None (copy — см. get_vacancies)."""
+        with self._lock:
+            if not self._is_fresh():
+                found, record = self._lookup_by_index(vacancy_url)
+                if found:
+                    return self._export(record, copy) if record is not None else None
+            record = self._load_records().get(vacancy_url)
+            return self._export(record, copy) if record is not None else None
+
+    def get_vacancies(self, keyword: Optional[str] = None, mode: str = InvertedIndex.AND,
+                      prefix: bool = True, copy: bool = True) -> List[Mapping]:
+        """
+        Получить сохранённые вакансии, при необходимости отфильтровав по словам.
+
+        Данные разбираются при первом обращении и держатся в памяти;
+        файл перечитывается, только если у него изменились inode, mtime или размер.
+
+        Args:
+            keyword: слова для поиска в названии и описании (без учёта регистра)
+            mode: "and" — все слова, "or" — хотя бы одно
+            prefix: слово запроса может быть началом слова («djang» найдёт «Django»)
+            copy: True — вернуть независимые копии словарей; False — представления
+                только для чтения (MappingProxyType) без копирования
+        """
+        with self._lock:
+            records = self._load_records()
+            if not keyword:
+                return [self._export(item, copy) for item in records.values()]
+            urls = self._get_text_index().search(keyword, mode=mode, prefix=prefix)
+            return [self._export(records[url], copy) for url in urls]
+
+    @staticmethod
+    def _export(record: dict, copy: bool) -> Mapping:
+        # Записи в памяти не изменяются на месте (обновление заменяет словарь целиком),
+        # поэтому представление остаётся согласованным снимком записи
+        return dict(record) if copy else MappingProxyType(record)
+
+    @staticmethod
+    def _stat_stamp(stat: os.stat_result) -> Tuple[int, int, int]:
+        # inode меняется при каждой атомарной замене файла, даже если
+        # mtime и размер совпали (грубые отметки времени на части ФС)
+        return stat.st_ino, stat.st_mtime_ns, stat.st_size
+
+    def _file_stamp(self) -> Optional[Tuple[int, int, int]]:
+        try:
+            stat = os.stat(self.filepath)
+        except FileNotFoundError:
+            return None
+        return self._stat_stamp(stat)
+
+    def _is_fresh(self) -> bool:
+        """Совпадает ли загруженное в память состояние с файлом на диске."""
+        return self._records is not None and self._stamp == self._file_stamp()
+
+    def _load_records(self) -> Dict[str, dict]:
+        """Вернуть индекс URL → запись, перечитав файл, если он изменился."""
+        if self._is_fresh():
+            return self._records
+        stamp = self._file_stamp()
+        records: Dict[str, dict] = {}
+        METRICS.incr("storage.loads")
+        with METRICS.timer("storage.load"):
+            data = self._load_data()
         for item in data:
-            if (keyword.lower() in item["title"].lower() or keyword.lower() in item["description"].lower()):
-                filtered.append(item)
-        return filtered
+            # Повторы из старых файлов схлопываются: остаётся первая запись
+            records.setdefault(item["url"], item)
+        self._records = records
+        self._stamp = stamp
+        self._text_index = None
+        return records
+
+    def _get_text_index(self) -> InvertedIndex:
+        if self._text_index is None:
+            index = InvertedIndex()
+            for url, item in self._records.items():
+                index.add(url, item["title"], item.get("description") or "")
+            self._text_index = index
+        return self._text_index
+
+    def _index_record(self, record: dict) -> None:
+        if self._text_index is not None:
+            self._text_index.add(record["url"], record["title"], record.get("description") or "")
+
+    def _unindex(self, vacancy_url: str) -> None:
+        if self._text_index is not None:
+            self._text_index.remove(vacancy_url)
+
+    def _commit(self) -> None:
+        self._save_data(list(self._records.values()))
+
+    def _load_index(self, stamp: Optional[Tuple[int, int, int]]) -> Optional[Dict[str, List[int]]]:
+        """Прочитать индекс смещений, если он построен для версии файла данных со штампом stamp."""
+        if stamp is None:
+            return None
+        try:
+            with open(self.index_path, 'rb') as f:
+                index = _loads(f.read())
+        except (FileNotFoundError, ValueError):
+            return None
+        if tuple(index.get("stamp", ())) != stamp:
+            return None
+        return index.get("offsets")
+
+    def _lookup_by_index(self, vacancy_url: str) -> Tuple[bool, Optional[dict]]:
+        """
+        Найти запись по индексу смещений, не разбирая весь файл.
+
+        Файл данных открывается один раз: индекс сверяется со штампом именно
+        этого дескриптора (os.fstat), и запись читается из него же. Если другой
+        процесс тем временем заменит файл, мы дочитаем старую версию целиком,
+        а не возьмём смещения от одной версии и байты из другой.
+
+        Returns:
+            (индекс подошёл, запись или None); при (False, None) нужно
+            загрузить файл полностью
+        """
+        try:
+            with open(self.filepath, 'rb') as f:
+                offsets = self._load_index(self._stat_stamp(os.fstat(f.fileno())))
+                if offsets is None:
+                    return False, None
+                position = offsets.get(vacancy_url)
+                if position is None:
+                    return True, None
+                start, length = position
+                f.seek(start)
+                return True, _loads(f.read(length))
+        except FileNotFoundError:
+            return False, None
 
     def _load_data(self) -> List[dict]:
         try:
-            with open(self.filepath, 'r', encoding='utf-8') as f:
-                return json.load(f)
-        except (FileNotFoundError, json.JSONDecodeError):
+            with open(self.filepath, 'rb') as f:
+                return _loads(f.read())
+        except (FileNotFoundError, ValueError):
             return []
 
+    def _serialize(self, data: List[dict]) -> Tuple[bytes, Dict[str, List[int]]]:
+        """
+        Сериализовать список так же, как json.dump(..., indent=2),
+        попутно запоминая байтовые смещения каждой записи.
+        """
+        if not data:
+            return b"[]", {}
+        parts = [b"[\n"]
+        offsets: Dict[str, List[int]] = {}
+        position = len(parts[0])
+        for i, item in enumerate(data):
+            chunk = b"  " + _dumps_pretty(item).replace(b"\n", b"\n  ")
+            # Смещение указывает на открывающую скобку объекта, без отступа
+            offsets[item["url"]] = [position + 2, len(chunk) - 2]
+            separator = b",\n" if i < len(data) - 1 else b"\n]"
+            parts.append(chunk)
+            parts.append(separator)
+            position += len(chunk) + len(separator)
+        return b"".join(parts), offsets
+
     def _save_data(self, data: List[dict]) -> None:
-        with open(self.filepath, 'w', encoding='utf-8') as f:
-            json.dump(data, f, ensure_ascii=False, indent=2)
+        """Записать данные атомарно и надёжно: временный файл, fsync и os.replace."""
+        with METRICS.timer("storage.save"):
+            payload, offsets = self._serialize(data)
+            atomic_write(self.filepath, payload)
+            self._stamp = self._file_stamp()
+            # Индекс — производные данные, сверяемые со штампом файла: fsync ему не нужен
+            index = json.dumps({"stamp": list(self._stamp), "offsets": offsets}, ensure_ascii=False).encode('utf-8')
+            atomic_write(self.index_path, index, durable=False)
+        if METRICS.enabled:
+            METRICS.incr("storage.saves")
+            METRICS.incr("storage.records_written", len(data))
+            METRICS.incr("storage.bytes_written", len(payload) + len(index))
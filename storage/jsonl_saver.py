@@ -0,0 +1,197 @@
+import json
+import threading
+from collections import Counter
+from typing import Iterable, Iterator, List, Optional
+
+from storage.file_utils import atomic_open
+from storage.json_saver import JSONSaver
+from storage.text_index import InvertedIndex
+
+TOMBSTONE_KEY = "_deleted"
+
+
+class JSONLinesSaver(JSONSaver):
+    """
+    Хранилище вакансий в формате JSON Lines с дозаписью в конец файла.
+
+    Каждая вакансия — одна строка JSON. Удаление дописывает «надгробие»
+    {"url": ..., "_deleted": true}, которое скрывает все предыдущие записи
+    с этим URL. Файл периодически уплотняется (compact): живые записи
+    переписываются в новый файл, надгробия и удалённые записи отбрасываются.
+    """
+
+    def __init__(self, filepath: str, compact_ratio: float = 0.5, compact_min_lines: int = 1000):
+        self.filepath = filepath
+        self._compact_ratio = compact_ratio
+        self._compact_min_lines = compact_min_lines
+        self._lock = threading.RLock()
+        self._compaction: Optional[threading.Thread] = None
+        # Заполняются при первом полном чтении файла и далее ведутся инкрементально
+        self._live: Optional[Counter] = None
+        self._lines = 0
+
+    def _append(self, records: List[dict]) -> None:
+        if not records:
+            return
+        payload = "".join(json.dumps(record, ensure_ascii=False) + "\n" for record in records)
+        with self._lock:
+            with open(self.filepath, 'a', encoding='utf-8') as f:
+                f.write(payload)
+            if self._live is not None:
+                self._lines += len(records)
+                for record in records:
+                    if record.get(TOMBSTONE_KEY):
+                        self._live.pop(record["url"], None)
+                    else:
+                        self._live[record["url"]] += 1
+
+    def _read_log(self) -> Iterator[dict]:
+        """Прочитать журнал построчно, пропуская пустые и недописанные строки."""
+        try:
+            with open(self.filepath, 'r', encoding='utf-8') as f:
+                for line in f:
+                    line = line.strip()
+                    if not line:
+                        continue
+                    try:
+                        yield json.loads(line)
+                    except json.JSONDecodeError:
+                        continue
+        except FileNotFoundError:
+            return
+
+    def _replay(self) -> List[dict]:
+        """Восстановить список живых записей по журналу (с учётом надгробий)."""
+        records: List[Optional[dict]] = []
+        positions = {}
+        lines = 0
+        for record in self._read_log():
+            lines += 1
+            url = record.get("url")
+            if record.get(TOMBSTONE_KEY):
+                for pos in positions.pop(url, ()):
+                    records[pos] = None
+                continue
+            positions.setdefault(url, []).append(len(records))
+            records.append(record)
+        live = [record for record in records if record is not None]
+        self._lines = lines
+        self._live = Counter(record["url"] for record in live)
+        return live
+
+    def add_vacancy(self, vacancy) -> None:
+        """Дописать вакансию в конец файла за O(1)."""
+        self._append([vacancy.to_dict()])
+
+    def add_vacancies(self, vacancies: Iterable) -> int:
+        """Дописать несколько вакансий одной операцией записи."""
+        records = [vacancy.to_dict() for vacancy in vacancies]
+        self._append(records)
+        return len(records)
+
+    def upsert_vacancies(self, vacancies: Iterable) -> int:
+        """
+        Заменить вакансии с совпадающими URL: надгробие и новая запись в одной дозаписи.
+
+        Надгробие пишется только для уже сохранённых URL; как и удаление,
+        upsert запускает фоновое уплотнение, когда мёртвых строк становится много.
+        """
+        incoming = {}
+        for vacancy in vacancies:
+            record = vacancy.to_dict()
+            incoming[record["url"]] = record
+        with self._lock:
+            if self._live is None:
+                self._replay()
+            batch = []
+            for url, record in incoming.items():
+                if self._live.get(url):
+                    batch.append({"url": url, TOMBSTONE_KEY: True})
+                batch.append(record)
+            self._append(batch)
+            if self._needs_compaction():
+                self.compact(background=True)
+        return len(incoming)
+
+    def delete_vacancy(self, vacancy_url: str) -> bool:
+        """Удалить вакансию по URL. Возвращает True, если вакансия была найдена и удалена."""
+        with self._lock:
+            if self._live is None:
+                self._replay()
+            if not self._live.get(vacancy_url):
+                return False
+            self._append([{"url": vacancy_url, TOMBSTONE_KEY: True}])
+            if self._needs_compaction():
+                self.compact(background=True)
+            return True
+
+    def delete_vacancies(self, vacancy_urls: Iterable[str]) -> int:
+        """Удалить вакансии по набору URL одной дозаписью надгробий."""
+        with self._lock:
+            if self._live is None:
+                self._replay()
+            found = [url for url in set(vacancy_urls) if self._live.get(url)]
+            self._append([{"url": url, TOMBSTONE_KEY: True} for url in found])
+            if found and self._needs_compaction():
+                self.compact(background=True)
+            return len(found)
+
+    def get_vacancies(self, keyword: Optional[str] = None, mode: str = InvertedIndex.AND,
+                      prefix: bool = True) -> List[dict]:
+        """
+        Получить живые вакансии, при необходимости отфильтровав по словам.
+
+        Поиск — как в ConcreteJSONSaver (storage.text_index): по словам
+        названия и описания, без учёта регистра и с «ё» = «е».
+
+        Args:
+            keyword: слова для поиска в названии и описании
+            mode: "and" — все слова, "or" — хотя бы одно
+            prefix: слово запроса может быть началом слова («djang» найдёт «Django»)
+        """
+        with self._lock:
+            data = self._replay()
+        if not keyword:
+            return data
+        # Журнал перечитывается при каждом вызове, поэтому индекс строится
+        # на один запрос; ключ — позиция записи (URL в журнале может повторяться)
+        index = InvertedIndex()
+        for position, item in enumerate(data):
+            index.add(position, item["title"], item.get("description") or "")
+        return [data[position] for position in index.search(keyword, mode=mode, prefix=prefix)]
+
+    def _needs_compaction(self) -> bool:
+        if self._live is None or self._lines < self._compact_min_lines:
+            return False
+        dead = self._lines - sum(self._live.values())
+        return dead / self._lines >= self._compact_ratio
+
+    def compact(self, background: bool = False) -> None:
+        """
+        Уплотнить журнал: переписать только живые записи.
+
+        Новый файл пишется через storage.file_utils.atomic_open (fsync и
+        os.replace), так что после сбоя остаётся либо старый, либо новый журнал.
+
+        Args:
+            background: выполнить в фоновом потоке; дозаписи на это время
+                ожидают завершения уплотнения
+        """
+        if background:
+            if self._compaction is not None and self._compaction.is_alive():
+                return
+            self._compaction = threading.Thread(target=self.compact, daemon=True)
+            self._compaction.start()
+            return
+
+        with self._lock:
+            live = self._replay()
+            with atomic_open(self.filepath) as f:
+                for record in live:
+                    f.write((json.dumps(record, ensure_ascii=False) + "\n").encode('utf-8'))
+            self._lines = len(live)
+
+    def wait_for_compaction(self, timeout: Optional[float] = None) -> None:
+        """Дождаться завершения фонового уплотнения, если оно идёт."""
+        if self._compaction is not None:
+            self._compaction.join(timeout)
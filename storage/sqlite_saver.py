@@ -0,0 +1,200 @@
+import sqlite3
+import threading
+from typing import Iterable, List, Optional
+
+from storage.json_saver import JSONSaver
+from storage.text_index import InvertedIndex, tokenize
+
+_COLUMNS = "title, url, salary, description"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS vacancies (
+    id INTEGER PRIMARY KEY,
+    url TEXT NOT NULL UNIQUE,
+    title TEXT NOT NULL,
+    salary TEXT,
+    description TEXT NOT NULL DEFAULT '',
+    salary_value INTEGER
+);
+CREATE INDEX IF NOT EXISTS idx_vacancies_salary ON vacancies (salary_value);
+"""
+
+# unicode61 не приравнивает «ё» к «е», поэтому текст нормализуется в триггерах
+# так же, как в storage.text_index.tokenize
+_FOLD = "replace(replace({0}, 'ё', 'е'), 'Ё', 'Е')"
+_FTS_VALUES = "{0}.id, " + _FOLD.format("{0}.title") + ", " + _FOLD.format("{0}.description")
+
+_FTS_SCHEMA = f"""
+CREATE VIRTUAL TABLE IF NOT EXISTS vacancies_fts USING fts5(
+    title, description, content='vacancies', content_rowid='id',
+    tokenize='unicode61 remove_diacritics 2'
+);
+CREATE TRIGGER IF NOT EXISTS vacancies_ai AFTER INSERT ON vacancies BEGIN
+    INSERT INTO vacancies_fts (rowid, title, description) VALUES ({_FTS_VALUES.format("new")});
+END;
+CREATE TRIGGER IF NOT EXISTS vacancies_ad AFTER DELETE ON vacancies BEGIN
+    INSERT INTO vacancies_fts (vacancies_fts, rowid, title, description)
+    VALUES ('delete', {_FTS_VALUES.format("old")});
+END;
+CREATE TRIGGER IF NOT EXISTS vacancies_au AFTER UPDATE ON vacancies BEGIN
+    INSERT INTO vacancies_fts (vacancies_fts, rowid, title, description)
+    VALUES ('delete', {_FTS_VALUES.format("old")});
+    INSERT INTO vacancies_fts (rowid, title, description) VALUES ({_FTS_VALUES.format("new")});
+END;
+"""
+
+# Все запросы — константные строки с параметрами: sqlite3 кэширует
+# подготовленные выражения и не компилирует их заново при каждом вызове.
+_INSERT = (
+    "INSERT OR IGNORE INTO vacancies (title, url, salary, description, salary_value) "
+    "VALUES (?, ?, ?, ?, ?)"
+)
+_UPSERT = (
+    "INSERT INTO vacancies (title, url, salary, description, salary_value) VALUES (?, ?, ?, ?, ?) "
+    "ON CONFLICT (url) DO UPDATE SET title = excluded.title, salary = excluded.salary, "
+    "description = excluded.description, salary_value = excluded.salary_value"
+)
+_DELETE = "DELETE FROM vacancies WHERE url = ?"
+
+
+def _fold(text: Optional[str]) -> str:
+    """Регистр и «ё» как в storage.text_index.tokenize: lower() в SQLite понимает только ASCII."""
+    return text.casefold().replace("ё", "е") if text else ""
+
+
+def _has_fts5(conn: sqlite3.Connection) -> bool:
+    try:
+        conn.execute("CREATE VIRTUAL TABLE IF NOT EXISTS temp._fts5_probe USING fts5(x)")
+        conn.execute("DROP TABLE temp._fts5_probe")
+        return True
+    except sqlite3.OperationalError:
+        return False
+
+
+class SQLiteSaver(JSONSaver):
+    """
+    Хранилище вакансий в базе SQLite с тем же интерфейсом, что и ConcreteJSONSaver.
+
+    База работает в режиме WAL, пакетные операции выполняются одной
+    транзакцией. Есть индексы по URL и по числовой зарплате (Vacancy.get_salary_value),
+    а поиск по названию и описанию идёт через FTS5, если SQLite собран
+    с его поддержкой (иначе — через LIKE).
+    """
+
+    def __init__(self, filepath: str):
+        self.filepath = filepath
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(filepath, check_same_thread=False, timeout=30)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.create_function("fold", 1, _fold, deterministic=True)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+        self.has_fts = _has_fts5(self._conn)
+        if self.has_fts:
+            self._conn.executescript(_FTS_SCHEMA)
+        self._conn.commit()
+
+    def __enter__(self) -> "SQLiteSaver":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    @staticmethod
+    def _row(vacancy) -> tuple:
+        return vacancy.title, vacancy.url, vacancy.salary, vacancy.description, vacancy.get_salary_value()
+
+    def _write(self, sql: str, rows: List[tuple]) -> int:
+        """Выполнить пакет изменений в одной транзакции."""
+        if not rows:
+            return 0
+        with self._lock, self._conn:
+            return self._conn.executemany(sql, rows).rowcount
+
+    def _query(self, sql: str, params: tuple = ()) -> List[dict]:
+        with self._lock:
+            return [dict(row) for row in self._conn.execute(sql, params)]
+
+    def add_vacancy(self, vacancy) -> bool:
+        """Добавить вакансию. Возвращает False, если вакансия с таким URL уже сохранена."""
+        return self._write(_INSERT, [self._row(vacancy)]) > 0
+
+    def add_vacancies(self, vacancies: Iterable) -> int:
+        return self._write(_INSERT, [self._row(v) for v in vacancies])
+
+    def upsert_vacancies(self, vacancies: Iterable) -> int:
+        return self._write(_UPSERT, [self._row(v) for v in vacancies])
+
+    def delete_vacancy(self, vacancy_url: str) -> bool:
+        """Удалить вакансию по URL. Возвращает True, если вакансия была найдена и удалена."""
+        return self._write(_DELETE, [(vacancy_url,)]) > 0
+
+    def delete_vacancies(self, vacancy_urls: Iterable[str]) -> int:
+        return self._write(_DELETE, [(url,) for url in set(vacancy_urls)])
+
+    def exists(self, vacancy_url: str) -> bool:
+        return bool(self._query("SELECT 1 FROM vacancies WHERE url = ?", (vacancy_url,)))
+
+    def get_by_url(self, vacancy_url: str) -> Optional[dict]:
+        rows = self._query(f"SELECT {_COLUMNS} FROM vacancies WHERE url = ?", (vacancy_url,))
+        return rows[0] if rows else None
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM vacancies").fetchone()[0]
+
+    def _keyword_filter(self, keyword: str, mode: str, prefix: bool):
+        """Условие WHERE и параметры для поиска по словам."""
+        terms = tokenize(keyword)
+        if not terms:
+            return None, ()
+        operator = " OR " if mode == InvertedIndex.OR else " AND "
+        if self.has_fts:
+            match = operator.join(f'"{term}"' + ("*" if prefix else "") for term in terms)
+            return "id IN (SELECT rowid FROM vacancies_fts WHERE vacancies_fts MATCH ?)", (match,)
+        condition = "(fold(title) LIKE ? ESCAPE '\\' OR fold(description) LIKE ? ESCAPE '\\')"
+        params = []
+        for term in terms:
+            params.extend(["%" + term.replace("_", "\\_") + "%"] * 2)
+        return "(" + operator.join([condition] * len(terms)) + ")", tuple(params)
+
+    def get_vacancies(self, keyword: Optional[str] = None, mode: str = InvertedIndex.AND,
+                      prefix: bool = True) -> List[dict]:
+        """Получить вакансии; keyword — слова для полнотекстового поиска."""
+        where, params = self._keyword_filter(keyword, mode, prefix) if keyword else (None, ())
+        sql = f"SELECT {_COLUMNS} FROM vacancies"
+        if where:
+            sql += f" WHERE {where}"
+        return self._query(sql + " ORDER BY id", params)
+
+    def get_by_salary_range(self, salary_min: Optional[int] = None, salary_max: Optional[int] = None,
+                            keyword: Optional[str] = None) -> List[dict]:
+        """Вакансии с зарплатой (Vacancy.get_salary_value) в диапазоне [salary_min, salary_max]."""
+        conditions = ["salary_value IS NOT NULL"]
+        params: list = []
+        if salary_min is not None:
+            conditions.append("salary_value >= ?")
+            params.append(salary_min)
+        if salary_max is not None:
+            conditions.append("salary_value <= ?")
+            params.append(salary_max)
+        if keyword:
+            where, keyword_params = self._keyword_filter(keyword, InvertedIndex.AND, True)
+            if where:
+                conditions.append(where)
+                params.extend(keyword_params)
+        sql = f"SELECT {_COLUMNS} FROM vacancies WHERE {' AND '.join(conditions)} ORDER BY salary_value"
+        return self._query(sql, tuple(params))
+
+    def top_by_salary(self, n: int, keyword: Optional[str] = None) -> List[dict]:
+        """N вакансий с наибольшей зарплатой (по индексу, без полной сортировки)."""
+        where, params = self._keyword_filter(keyword, InvertedIndex.AND, True) if keyword else (None, ())
+        sql = f"SELECT {_COLUMNS} FROM vacancies WHERE salary_value IS NOT NULL"
+        if where:
+            sql += f" AND {where}"
+        return self._query(sql + " ORDER BY salary_value DESC LIMIT ?", params + (n,))
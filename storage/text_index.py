@@ -0,0 +1,121 @@
+import re
+from bisect import bisect_left
+from typing import Dict, Iterable, List, Optional, Set
+
+_TOKEN_RE = re.compile(r"\w+")
+
+
+def tokenize(text: str) -> List[str]:
+    """
+    Разбить текст на токены без учёта регистра.
+
+    \\w в Python охватывает и кириллицу, и латиницу; «ё» приводится к «е»,
+    чтобы «опыт работы с объёмом» находился по запросу «объем».
+    """
+    if not text:
+        return []
+    return _TOKEN_RE.findall(text.casefold().replace("ё", "е"))
+
+
+class InvertedIndex:
+    """
+    Инвертированный индекс: токен → множество идентификаторов документов.
+
+    Обновляется инкрементально (add/remove), поддерживает запросы
+    из нескольких слов в режимах AND/OR и поиск по префиксу.
+    """
+
+    AND = "and"
+    OR = "or"
+
+    def __init__(self):
+        self._postings: Dict[str, Set[str]] = {}
+        self._doc_terms: Dict[str, Set[str]] = {}
+        self._doc_order: Dict[str, int] = {}
+        self._next_order = 0
+        self._sorted_terms: Optional[List[str]] = None
+
+    def __len__(self) -> int:
+        return len(self._doc_terms)
+
+    def __contains__(self, doc_id: str) -> bool:
+        return doc_id in self._doc_terms
+
+    def add(self, doc_id: str, *texts: str) -> None:
+        """Проиндексировать документ; повторное добавление заменяет его термы."""
+        terms = set()
+        for text in texts:
+            terms.update(tokenize(text))
+        old_terms = self._doc_terms.get(doc_id)
+        if old_terms is not None:
+            self._unlink(doc_id, old_terms - terms)
+            new_terms = terms - old_terms
+        else:
+            self._doc_order[doc_id] = self._next_order
+            self._next_order += 1
+            new_terms = terms
+        for term in new_terms:
+            postings = self._postings.get(term)
+            if postings is None:
+                postings = self._postings[term] = set()
+                self._sorted_terms = None
+            postings.add(doc_id)
+        self._doc_terms[doc_id] = terms
+
+    def remove(self, doc_id: str) -> bool:
+        terms = self._doc_terms.pop(doc_id, None)
+        if terms is None:
+            return False
+        self._unlink(doc_id, terms)
+        del self._doc_order[doc_id]
+        return True
+
+    def _unlink(self, doc_id: str, terms: Iterable[str]) -> None:
+        for term in terms:
+            postings = self._postings.get(term)
+            if postings is None:
+                continue
+            postings.discard(doc_id)
+            if not postings:
+                del self._postings[term]
+                self._sorted_terms = None
+
+    def _lookup(self, term: str, prefix: bool) -> Set[str]:
+        if not prefix:
+            return self._postings.get(term, set())
+        if self._sorted_terms is None:
+            self._sorted_terms = sorted(self._postings)
+        result: Set[str] = set()
+        terms = self._sorted_terms
+        i = bisect_left(terms, term)
+        while i < len(terms) and terms[i].startswith(term):
+            result |= self._postings[terms[i]]
+            i += 1
+        return result
+
+    def search(self, query: str, mode: str = AND, prefix: bool = False) -> List[str]:
+        """
+        Найти документы по запросу.
+
+        Args:
+            query: одно или несколько слов
+            mode: "and" — документ содержит все слова, "or" — хотя бы одно
+            prefix: слово запроса может быть началом слова документа
+
+        Returns:
+            Идентификаторы документов в порядке их добавления
+        """
+        terms = tokenize(query)
+        if not terms:
+            return []
+        # Для AND начинаем с самого редкого терма: пересечения дешевле
+        matches = sorted((self._lookup(term, prefix) for term in set(terms)), key=len)
+        if mode == self.OR:
+            found = set().union(*matches)
+        else:
+            found = set(matches[0])
+            for postings in matches[1:]:
+                if not found:
+                    break
+                found &= postings
+        return sorted(found, key=self._doc_order.__getitem__)
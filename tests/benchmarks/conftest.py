@@ -0,0 +1,61 @@
+"""
+Бенчмарки горячих путей (pytest-benchmark).
+
+По умолчанию пропускаются, чтобы не замедлять обычный прогон тестов.
+Нужен pytest-benchmark (есть в requirements.txt). Базовые линии хранятся
+в репозитории, в tests/benchmarks/baselines/<машина>/ (каталог машины,
+например Linux-CPython-3.11-64bit, pytest-benchmark выбирает сам).
+Сравнивать имеет смысл только с базовой линией той же машины: на CI —
+с линией, сохранённой на том же раннере.
+
+Сохранение базовой линии (файл затем коммитится):
+    HH_BENCH=1 pytest tests/benchmarks --benchmark-only \\
+        --benchmark-storage=tests/benchmarks/baselines --benchmark-save=baseline
+
+Сравнение с последней сохранённой линией; падение, если медиана времени
+любого бенчмарка выросла больше чем на 15% (на общих виртуальных машинах
+шум больше — порог придётся поднять или запускать на выделенной машине):
+    HH_BENCH=1 pytest tests/benchmarks --benchmark-only \\
+        --benchmark-storage=tests/benchmarks/baselines \\
+        --benchmark-compare --benchmark-compare-fail=median:15%
+
+Масштабы данных задаются переменной HH_BENCH_SCALES (по умолчанию 1k):
+    HH_BENCH_SCALES=1k,100k,1m HH_BENCH=1 pytest tests/benchmarks --benchmark-only
+Без --benchmark-storage результаты пишутся в .benchmarks/ (в .gitignore) —
+для локальных экспериментов.
+"""
+import os
+from pathlib import Path
+
+import pytest
+
+from tests.benchmarks.data import SCALES
+
+try:
+    import pytest_benchmark  # noqa: F401
+except ImportError:
+    collect_ignore_glob = ["test_*.py"]
+
+_HERE = Path(__file__).parent
+
+
+def selected_scales():
+    names = [name.strip().lower() for name in os.environ.get("HH_BENCH_SCALES", "1k").split(",") if name.strip()]
+    unknown = [name for name in names if name not in SCALES]
+    if unknown:
+        raise pytest.UsageError(f"HH_BENCH_SCALES: неизвестные масштабы {unknown}, доступны {list(SCALES)}")
+    return names
+
+
+def pytest_collection_modifyitems(config, items):
+    if os.environ.get("HH_BENCH") or config.getoption("benchmark_only", False):
+        return
+    skip = pytest.mark.skip(reason="бенчмарк: запустите с HH_BENCH=1 или --benchmark-only")
+    for item in items:
+        if _HERE in item.path.parents:
+            item.add_marker(skip)
+
+
+def pytest_generate_tests(metafunc):
+    if "scale" in metafunc.fixturenames:
+        metafunc.parametrize("scale", [SCALES[name] for name in selected_scales()], ids=selected_scales())
@@ -0,0 +1,46 @@
+"""Детерминированные генераторы синтетических вакансий для бенчмарков."""
+import random
+from typing import Dict, List
+
+from api.hh_converter import vacancies_from_hh_items
+from models.vacancy import Vacancy
+
+SCALES = {"1k": 1_000, "100k": 100_000, "1m": 1_000_000}
+
+_TITLES = ["Python разработчик", "Backend Developer", "Data Engineer", "QA Engineer",
+           "Аналитик данных", "DevOps инженер", "Frontend разработчик", "Team Lead"]
+_SKILLS = ["Python", "Django", "FastAPI", "PostgreSQL", "Git", "Docker", "Kubernetes",
+           "Linux", "Redis", "Kafka", "React", "SQL", "pandas", "CI/CD", "английский"]
+_CURRENCIES = ["RUR", "RUR", "RUR", "USD", "EUR", "KZT"]
+
+
+def make_raw_items(count: int, seed: int = 42, start: int = 0) -> List[Dict]:
+    """Элементы в формате ответа hh.ru /vacancies (примерно треть — без зарплаты)."""
+    rng = random.Random(seed)
+    items = []
+    for i in range(start, start + count):
+        lower = rng.choice([None, rng.randrange(30, 400) * 1000])
+        upper = rng.choice([None, (lower or 50000) + rng.randrange(0, 200) * 1000])
+        salary = None if lower is None and upper is None else {
+            "from": lower, "to": upper, "currency": rng.choice(_CURRENCIES)
+        }
+        skills = rng.sample(_SKILLS, 4)
+        items.append({
+            "id": str(10_000_000 + i),
+            "name": f"{rng.choice(_TITLES)} {i}",
+            "salary": salary,
+            "snippet": {
+                "requirement": f"Опыт с <highlighttext>{skills[0]}</highlighttext>, {', '.join(skills[1:])}.",
+                "responsibility": None,
+            },
+        })
+    return items
+
+
+def make_vacancies(count: int, seed: int = 42, start: int = 0) -> List[Vacancy]:
+    return list(vacancies_from_hh_items(make_raw_items(count, seed=seed, start=start)))
+
+
+def make_records(count: int, seed: int = 42, start: int = 0) -> List[Dict]:
+    """Словари в формате Vacancy.to_dict(), как в файлах хранилища."""
+    return [vacancy.to_dict() for vacancy in make_vacancies(count, seed=seed, start=start)]
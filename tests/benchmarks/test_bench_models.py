@@ -0,0 +1,45 @@
+from api.hh_converter import normalize_hh_items, vacancies_from_hh_items
+from models.query import top_n
+from models.vacancy import Vacancy
+from tests.benchmarks.data import make_raw_items, make_records, make_vacancies
+
+
+def test_bench_vacancy_construction(benchmark, scale):
+    records = make_records(scale)
+    result = benchmark(Vacancy.from_dicts, records)
+    assert len(result) == scale
+
+
+def test_bench_vacancy_trusted_construction(benchmark, scale):
+    records = make_records(scale)
+    result = benchmark(Vacancy.from_dicts, records, validate=False)
+    assert len(result) == scale
+
+
+def test_bench_hh_item_conversion(benchmark, scale):
+    items = make_raw_items(scale)
+    result = benchmark(lambda: list(vacancies_from_hh_items(items)))
+    assert len(result) == scale
+
+
+def test_bench_get_salary_value(benchmark, scale):
+    vacancies = make_vacancies(scale)
+    benchmark(lambda: [v.get_salary_value() for v in vacancies])
+
+
+def test_bench_sort_by_salary(benchmark, scale):
+    vacancies = make_vacancies(scale)
+    result = benchmark(sorted, vacancies, reverse=True)
+    assert len(result) == scale
+
+
+def test_bench_top_n_by_salary(benchmark, scale):
+    vacancies = make_vacancies(scale)
+    result = benchmark(top_n, vacancies, 10)
+    assert len(result) == 10
+
+
+def test_bench_hh_item_normalization_process_pool(benchmark, scale):
+    items = make_raw_items(scale)
+    rows = benchmark.pedantic(normalize_hh_items, args=(items,), kwargs={"chunk_size": 5000}, rounds=3)
+    assert len(rows) == scale
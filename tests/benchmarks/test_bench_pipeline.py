@@ -0,0 +1,15 @@
+from api.hh_api import HeadHunterAPI
+from models.query import search
+
+
+def test_bench_fetch_filter_top_n(benchmark, hh_stub_server):
+    """Полный путь: загрузка 2000 вакансий с локального сервера → фильтр → топ 10."""
+    hh_stub_server.total_items = 2000
+
+    def pipeline():
+        api = HeadHunterAPI(base_url=hh_stub_server.url, rate_limit=1000.0)
+        vacancies = api.iter_vacancies("Python", max_items=2000, per_page=100)
+        return search(vacancies, ["python", "опыт"], n=10)
+
+    result = benchmark.pedantic(pipeline, rounds=3)
+    assert len(result) == 10
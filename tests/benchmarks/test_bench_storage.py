@@ -0,0 +1,56 @@
+import shutil
+
+import pytest
+
+from models.vacancy import Vacancy
+from storage.json_saver import ConcreteJSONSaver
+from tests.benchmarks.data import make_vacancies
+
+
+@pytest.fixture
+def saved_file(tmp_path, scale):
+    """Файл хранилища с scale вакансиями и путь для рабочих копий."""
+    template = str(tmp_path / "template.json")
+    ConcreteJSONSaver(template).add_vacancies(make_vacancies(scale))
+    return template, str(tmp_path / "work.json")
+
+
+def _warm_saver(template, work):
+    """Свежая копия файла и экземпляр с уже загруженными данными (не входит в замер)."""
+    shutil.copyfile(template, work)
+    saver = ConcreteJSONSaver(work)
+    saver.get_vacancies(copy=False)
+    return saver
+
+
+def test_bench_json_saver_add_vacancy(benchmark, saved_file):
+    new = Vacancy("Новая вакансия", "https://hh.ru/vacancy/1", "от 100000 RUR", "Python")
+
+    def setup():
+        return (_warm_saver(*saved_file), new), {}
+
+    benchmark.pedantic(lambda saver, vacancy: saver.add_vacancy(vacancy), setup=setup, rounds=5)
+
+
+def test_bench_json_saver_delete_vacancy(benchmark, saved_file):
+    def setup():
+        return (_warm_saver(*saved_file), "https://hh.ru/vacancy/10000000"), {}
+
+    benchmark.pedantic(lambda saver, url: saver.delete_vacancy(url), setup=setup, rounds=5)
+
+
+def test_bench_json_saver_cold_load(benchmark, saved_file, scale):
+    template, _ = saved_file
+    result = benchmark(lambda: ConcreteJSONSaver(template).get_vacancies(copy=False))
+    assert len(result) == scale
+
+
+def test_bench_json_saver_keyword_search(benchmark, saved_file):
+    saver = ConcreteJSONSaver(saved_file[0])
+    saver.get_vacancies("python django")  # строит инвертированный индекс
+    benchmark(saver.get_vacancies, "python django", copy=False)
+
+
+def test_bench_json_saver_get_by_url(benchmark, saved_file):
+    template, _ = saved_file
+    benchmark(lambda: ConcreteJSONSaver(template).get_by_url("https://hh.ru/vacancy/10000000"))
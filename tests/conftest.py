@@ -1,6 +1,11 @@
+import json
 import os
 import pytest
+import requests
+import threading
 import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
 from api.hh_api import HeadHunterAPI
 from models.vacancy import Vacancy
 from storage.json_saver import ConcreteJSONSaver
@@ -49,3 +54,87 @@ def sample_vacancies():
         Vacancy("JS Developer", "https://...", "80 000 руб.", "React"),
         Vacancy("QA Engineer", "https://...", None, "Тестирование")
     ]
+
+
+class FakeClock:
+    """Управляемые часы для компонентов с параметром clock: время меняется присваиванием now."""
+
+    def __init__(self, now: float = 0.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+@pytest.fixture
+def make_response(mocker):
+    """Фабрика поддельных ответов requests: make_response(status_code, payload, headers)."""
+    def make(status_code=200, payload=None, headers=None):
+        response = mocker.Mock()
+        response.status_code = status_code
+        response.headers = headers or {}
+        body = json.dumps(payload or {"items": []}).encode()
+        response.content = body
+        response.json = lambda: json.loads(body)
+        if status_code >= 400:
+            response.raise_for_status.side_effect = requests.HTTPError(response=response)
+        return response
+    return make
+
+
+class StubHHHandler(BaseHTTPRequestHandler):
+    """Локальная подмена hh.ru: отдаёт синтетические вакансии по /vacancies."""
+
+    def do_GET(self):
+        parsed = urlsplit(self.path)
+        params = {key: values[0] for key, values in parse_qs(parsed.query).items()}
+        self.server.requests.append(params)
+        if parsed.path != "/vacancies" or params.get("text") == "fail":
+            self.send_error(404 if parsed.path != "/vacancies" else 500)
+            return
+
+        text = params.get("text", "")
+        per_page = int(params.get("per_page", 20))
+        page = int(params.get("page", 0))
+        total = self.server.total_items
+        items = [
+            {
+                "id": f"{text}-{i}",
+                "name": f"{text or 'Vacancy'} {i}",
+                "salary": {"from": 50000 + i * 1000, "to": None, "currency": "RUR"} if i % 3 else None,
+                "snippet": {"requirement": f"Опыт <highlighttext>{text}</highlighttext>", "responsibility": None},
+            }
+            for i in range(page * per_page, min((page + 1) * per_page, total))
+        ]
+        body = json.dumps({
+            "items": items, "found": total, "page": page, "per_page": per_page,
+            "pages": -(-total // per_page),
+        }, ensure_ascii=False).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def hh_stub_server():
+    """Запустить локальный HTTP-сервер, имитирующий API hh.ru."""
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StubHHHandler)
+    server.daemon_threads = True
+    server.requests = []
+    server.total_items = 50
+    server.url = f"http://127.0.0.1:{server.server_address[1]}"
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
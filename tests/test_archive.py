@@ -0,0 +1,97 @@
+import json
+import os
+
+import pytest
+
+from models.vacancy import Vacancy
+from storage import archive
+from storage.archive import ArchiveReader, archive_to_json, json_to_archive, write_archive
+from storage.json_saver import ConcreteJSONSaver
+
+
+def make_records(count):
+    return [
+        Vacancy(
+            f"Разработчик {i}",
+            f"https://hh.ru/vacancy/{i}",
+            f"от {1000 * i} руб." if i % 3 else None,
+            f"Описание вакансии {i}: Python, Django, Git"
+        ).to_dict()
+        for i in range(count)
+    ]
+
+
+@pytest.mark.parametrize("codec", [archive.CODEC_NONE, archive.CODEC_GZIP, archive.CODEC_ZSTD])
+def test_archive_round_trip(tmp_path, codec):
+    if codec == archive.CODEC_ZSTD and archive.zstandard is None:
+        pytest.skip("zstandard не установлен")
+    records = make_records(25) + [{"title": "Старая", "url": "https://old", "salary": None, "description": None}]
+    path = str(tmp_path / "vacancies.hhva")
+
+    assert write_archive(path, records + records[:3], codec=codec, block_size=10) == 26
+
+    with ArchiveReader(path) as reader:
+        assert reader.codec == codec
+        assert len(reader) == 26
+        assert reader.block_count == 3
+        assert list(reader) == records
+
+
+def test_archive_lookup_decodes_single_block(tmp_path, mocker):
+    path = str(tmp_path / "vacancies.hhva")
+    records = make_records(100)
+    write_archive(path, records, block_size=10)
+
+    decode = mocker.spy(archive, "_decode_block")
+    with ArchiveReader(path) as reader:
+        assert reader.get_by_url("https://hh.ru/vacancy/57") == records[57]
+        assert reader.get_by_url("https://hh.ru/vacancy/58") == records[58]
+        assert reader.exists("https://hh.ru/vacancy/1000") is False
+    assert decode.call_count == 1
+
+
+def test_archive_salary_range_skips_blocks(tmp_path, mocker):
+    path = str(tmp_path / "vacancies.hhva")
+    write_archive(path, reversed(make_records(100)), block_size=10)
+
+    decode = mocker.spy(archive, "_decode_block")
+    with ArchiveReader(path) as reader:
+        found = reader.get_by_salary_range(20000, 35000)
+        assert [v["url"] for v in found] == [
+            f"https://hh.ru/vacancy/{i}" for i in range(20, 36) if i % 3
+        ]
+        assert reader.get_by_salary_range(10 ** 9) == []
+    assert decode.call_count == 2
+
+
+def test_archive_json_conversion(tmp_path):
+    json_path = str(tmp_path / "vacancies.json")
+    archive_path = str(tmp_path / "vacancies.hhva")
+    saver = ConcreteJSONSaver(json_path)
+    saver.add_vacancies(Vacancy.from_dicts(make_records(200)))
+
+    assert json_to_archive(json_path, archive_path) == 200
+    assert os.path.getsize(archive_path) < os.path.getsize(json_path) / 4
+
+    restored = str(tmp_path / "restored.json")
+    assert archive_to_json(archive_path, restored) == 200
+    with open(json_path, encoding="utf-8") as f, open(restored, encoding="utf-8") as g:
+        assert json.load(f) == json.load(g)
+
+
+def test_archive_rejects_other_files(tmp_path):
+    path = tmp_path / "vacancies.json"
+    path.write_text("[]" + " " * 40, encoding="utf-8")
+    with pytest.raises(ValueError):
+        ArchiveReader(str(path))
+
+
+def test_archive_salary_range_uses_upper_bound_without_lower(tmp_path):
+    path = str(tmp_path / "vacancies.hhva")
+    write_archive(path, [
+        Vacancy("A", "https://hh.ru/vacancy/1", "от 30000 руб.").to_dict(),
+        Vacancy("B", "https://hh.ru/vacancy/2", "до 300000 руб.").to_dict(),
+    ], block_size=1)
+    with ArchiveReader(path) as reader:
+        assert [v["title"] for v in reader.get_by_salary_range(100000)] == ["B"]
+        assert [v["title"] for v in reader.get_by_salary_range()] == ["A", "B"]
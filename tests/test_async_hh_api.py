@@ -0,0 +1,92 @@
+import asyncio
+
+import httpx
+import pytest
+
+from api.async_hh_api import AsyncHeadHunterAPI
+
+
+def run(coro):
+    return asyncio.run(coro)
+
+
+def test_async_connect(hh_stub_server):
+    async def scenario():
+        async with AsyncHeadHunterAPI(base_url=hh_stub_server.url) as api:
+            return await api.connect()
+
+    assert run(scenario()) is True
+
+
+def test_async_get_vacancies_all_pages_in_order(hh_stub_server):
+    async def scenario():
+        async with AsyncHeadHunterAPI(base_url=hh_stub_server.url) as api:
+            return await api.get_vacancies("python", per_page=20, pages=None)
+
+    items = run(scenario())
+    assert [item["id"] for item in items] == [f"python-{i}" for i in range(50)]
+
+
+def test_async_gather_queries_isolates_errors(hh_stub_server):
+    async def scenario():
+        async with AsyncHeadHunterAPI(base_url=hh_stub_server.url, max_concurrent_queries=2) as api:
+            return await api.gather_queries(["python", "fail", "java"], per_page=10)
+
+    python, failed, java = run(scenario())
+    assert len(python) == 10 and python[0]["id"] == "python-0"
+    assert isinstance(failed, ConnectionError)
+    assert java[0]["id"] == "java-0"
+
+
+def test_async_timeout_raises_connection_error():
+    async def scenario():
+        async def slow_handler(request):
+            await asyncio.sleep(1)
+
+        client = httpx.AsyncClient(transport=httpx.MockTransport(slow_handler))
+        async with AsyncHeadHunterAPI(base_url="http://hh.test", timeout=0.05, client=client) as api:
+            await api.get_vacancies("python")
+
+    with pytest.raises(ConnectionError):
+        run(scenario())
+
+
+def test_async_cancellation(hh_stub_server):
+    async def scenario():
+        async with AsyncHeadHunterAPI(base_url=hh_stub_server.url) as api:
+            task = asyncio.ensure_future(api.get_vacancies("python", pages=None))
+            task.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await task
+            return await api.get_vacancies("python", per_page=5)
+
+    assert len(run(scenario())) == 5
+
+
+def test_async_page_error_cancels_other_pages():
+    cancelled = []
+
+    async def handler(request):
+        page = int(request.url.params["page"])
+        if page == 0:
+            return httpx.Response(200, json={"items": [], "pages": 5})
+        if page == 1:
+            return httpx.Response(500)
+        try:
+            await asyncio.sleep(5)
+        except asyncio.CancelledError:
+            cancelled.append(page)
+            raise
+        return httpx.Response(200, json={"items": []})
+
+    async def scenario():
+        client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        async with AsyncHeadHunterAPI(base_url="http://hh.test", client=client) as api:
+            loop = asyncio.get_running_loop()
+            started = loop.time()
+            with pytest.raises(ConnectionError):
+                await api.get_vacancies("python", pages=None)
+            assert loop.time() - started < 1
+
+    run(scenario())
+    assert sorted(cancelled) == [2, 3, 4]
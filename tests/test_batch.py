@@ -0,0 +1,92 @@
+import logging
+
+from api.hh_api import HeadHunterAPI
+from crawler.batch import CrawlStats, QuerySpec, main, parse_query_file, run_batch
+from storage.json_saver import ConcreteJSONSaver
+from storage.jsonl_saver import JSONLinesSaver
+from storage.sqlite_saver import SQLiteSaver
+
+
+def test_parse_query_file():
+    lines = ["# комментарий", "", "Python разработчик | django git | 30", "Java", "Go |  | abc"]
+    assert parse_query_file(lines, default_max_items=10) == [
+        QuerySpec("Python разработчик", ["django", "git"], 30),
+        QuerySpec("Java", [], 10),
+        QuerySpec("Go", [], 10),
+    ]
+
+
+def test_run_batch_against_stub_server(hh_stub_server, tmp_path):
+    api = HeadHunterAPI(base_url=hh_stub_server.url, rate_limit=1000)
+    specs = [QuerySpec("python", [], 30), QuerySpec("fail", [], 10), QuerySpec("java", ["java"], None)]
+
+    with SQLiteSaver(str(tmp_path / "vacancies.db")) as saver:
+        stats = run_batch(specs, api, saver, concurrency=3, log=lambda message: None)
+        assert len(saver) == 80
+
+    summary = stats.summary()
+    assert summary["queries"] == 3
+    assert summary["errors"] == 1
+    assert summary["vacancies"] == 80
+    assert summary["bytes"] > 0
+    assert summary["requests"] >= 4
+    assert not api._session.hooks["response"]
+
+
+def test_batch_cli(hh_stub_server, tmp_path, capsys):
+    queries = tmp_path / "queries.txt"
+    queries.write_text("python | | 5\n", encoding="utf-8")
+    output = tmp_path / "vacancies.jsonl"
+
+    code = main([str(queries), "--storage", "jsonl", "--output", str(output), "--base-url", hh_stub_server.url])
+    assert code == 0
+    assert "Вакансий: 5" in capsys.readouterr().out
+    assert len(JSONLinesSaver(str(output)).get_vacancies()) == 5
+
+
+def test_crawl_stats_counts_responses():
+    stats = CrawlStats()
+    stats.on_response(type("Response", (), {"content": b"12345"}))
+    assert (stats.requests, stats.bytes) == (1, 5)
+
+
+def test_batch_cli_import_raw(tmp_path, capsys):
+    dump = tmp_path / "dump.json"
+    dump.write_text(
+        '{"items": [{"id": "1", "name": "Python Dev", "salary": null, "snippet": {}},'
+        ' {"id": "2", "name": "", "salary": null, "snippet": {}}]}',
+        encoding="utf-8"
+    )
+    output = tmp_path / "vacancies.jsonl"
+
+    code = main(["--import-raw", str(dump), "--storage", "jsonl", "--output", str(output), "--workers", "1"])
+    assert code == 0
+    assert "Сохранено вакансий: 1, пропущено некорректных: 1" in capsys.readouterr().out
+    assert [v["url"] for v in JSONLinesSaver(str(output)).get_vacancies()] == ["https://hh.ru/vacancy/1"]
+
+
+def test_run_batch_high_concurrency_keeps_connections_alive(hh_stub_server, tmp_path, caplog):
+    hh_stub_server.total_items = 500
+    api = HeadHunterAPI(base_url=hh_stub_server.url, rate_limit=10000)
+    specs = [QuerySpec(f"query{i}", [], None) for i in range(32)]
+
+    with caplog.at_level(logging.WARNING, logger="urllib3"):
+        with SQLiteSaver(str(tmp_path / "vacancies.db")) as saver:
+            stats = run_batch(specs, api, saver, concurrency=32, log=lambda message: None)
+
+    assert stats.errors == 0
+    assert stats.requests == 32 * 5
+    assert "Connection pool is full" not in caplog.text
+
+
+def test_run_batch_buffers_saves(hh_stub_server, tmp_path, mocker):
+    api = HeadHunterAPI(base_url=hh_stub_server.url, rate_limit=1000)
+    specs = [QuerySpec(f"q{i}", [], 5) for i in range(10)]
+    saver = ConcreteJSONSaver(str(tmp_path / "vacancies.json"))
+    save = mocker.spy(saver, "_save_data")
+
+    stats = run_batch(specs, api, saver, concurrency=4, log=lambda message: None, flush_every=4)
+
+    assert save.call_count == 3
+    assert stats.saved == 50
+    assert len(saver.get_vacancies()) == 50
@@ -0,0 +1,67 @@
+from api.cache import CacheEntry, MemoryCache, ResponseCache
+from api.hh_api import HeadHunterAPI
+
+
+def test_make_key_ignores_param_order():
+    """Ключ кэша не зависит от порядка параметров."""
+    key1 = ResponseCache.make_key("https://api.hh.ru/vacancies/", {"text": "Python", "page": 0})
+    key2 = ResponseCache.make_key("https://api.hh.ru/vacancies", {"page": "0", "text": "Python"})
+    assert key1 == key2
+
+
+def test_memory_cache_evicts_least_recently_used_by_size():
+    cache = MemoryCache(max_bytes=10)
+    cache.set("a", CacheEntry(b"12345", None, 0))
+    cache.set("b", CacheEntry(b"12345", None, 0))
+    cache.get("a")
+    cache.set("c", CacheEntry(b"12345", None, 0))
+
+    assert cache.get("b") is None
+    assert cache.get("a") is not None
+    assert cache.evictions == 1
+    assert cache.size == 10
+
+
+def test_disk_tier_shared_between_instances(tmp_path):
+    """Запись, сохранённая одним экземпляром, видна другому через SQLite."""
+    path = str(tmp_path / "cache.sqlite")
+    ResponseCache(disk_path=path).store("key", b"{}", etag=None, ttl=60)
+
+    entry, fresh = ResponseCache(disk_path=path).lookup("key")
+    assert entry.body == b"{}"
+    assert fresh is True
+
+
+def test_stale_memory_entry_is_refreshed_from_disk_tier(tmp_path):
+    path = str(tmp_path / "cache.sqlite")
+    worker = ResponseCache(disk_path=path)
+    worker.store("key", b"old", etag='"v1"', ttl=0)
+
+    ResponseCache(disk_path=path).store("key", b"new", etag=None, ttl=60)
+
+    entry, fresh = worker.lookup("key")
+    assert (entry.body, fresh) == (b"new", True)
+    assert worker.stats()["hits"] == 1
+
+
+def test_hh_api_serves_repeated_query_from_cache(mocker, make_response):
+    api = HeadHunterAPI(cache=ResponseCache(ttl=60))
+    get = mocker.patch.object(api._session, 'get',
+                              return_value=make_response(payload={"items": [{"id": "1"}]}))
+
+    assert api.get_vacancies("Python") == [{"id": "1"}]
+    assert api.get_vacancies("Python") == [{"id": "1"}]
+    assert get.call_count == 1
+    assert api.cache.stats()["hits"] == 1
+
+
+def test_hh_api_revalidates_stale_entry_with_etag(mocker, make_response):
+    api = HeadHunterAPI(cache=ResponseCache(ttl=0))
+    mocker.patch.object(api._session, 'get', return_value=make_response(
+        payload={"items": [{"id": "1"}]}, headers={"ETag": '"v1"'}))
+    api.get_vacancies("Python")
+
+    get = mocker.patch.object(api._session, 'get', return_value=make_response(status_code=304))
+    assert api.get_vacancies("Python") == [{"id": "1"}]
+    assert get.call_args.kwargs["headers"] == {"If-None-Match": '"v1"'}
+    assert api.cache.stats()["revalidations"] == 1
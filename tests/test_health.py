@@ -0,0 +1,53 @@
+from api.health import CircuitBreaker, HealthMonitor
+
+
+def test_circuit_breaker_opens_after_threshold(clock):
+    """Цепь размыкается после заданного числа ошибок подряд."""
+    breaker = CircuitBreaker(failure_threshold=2, reset_timeout=10, clock=clock)
+    breaker.record_failure()
+    assert breaker.allow_request() is True
+    breaker.record_failure()
+    assert breaker.state == CircuitBreaker.OPEN
+    assert breaker.allow_request() is False
+
+
+def test_circuit_breaker_half_open_allows_single_trial(clock):
+    """После таймаута пропускается ровно один пробный запрос."""
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=10, clock=clock)
+    breaker.record_failure()
+
+    clock.now = 10
+    assert breaker.state == CircuitBreaker.HALF_OPEN
+    assert breaker.allow_request() is True
+    assert breaker.allow_request() is False
+
+    breaker.record_success()
+    assert breaker.state == CircuitBreaker.CLOSED
+
+
+def test_circuit_breaker_half_open_failure_reopens(clock):
+    breaker = CircuitBreaker(failure_threshold=3, reset_timeout=10, clock=clock)
+    for _ in range(3):
+        breaker.record_failure()
+    clock.now = 10
+    assert breaker.allow_request() is True
+    breaker.record_failure()
+    assert breaker.state == CircuitBreaker.OPEN
+
+
+def test_health_monitor_caches_probe_result(clock):
+    """Пробный запрос повторяется только после истечения TTL."""
+    calls = []
+
+    def probe():
+        calls.append(clock.now)
+        return True
+
+    monitor = HealthMonitor(probe, ttl=5, clock=clock)
+    assert monitor.is_healthy() is True
+    assert monitor.is_healthy() is True
+    assert len(calls) == 1
+
+    clock.now = 5
+    assert monitor.is_healthy() is True
+    assert len(calls) == 2
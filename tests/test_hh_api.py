@@ -32,3 +32,99 @@ def test_get_vacancies_connection_error(hh_api, mocker):
     mocker.patch.object(hh_api._session, 'get', side_effect=RequestException)
     with pytest.raises(ConnectionError):
         hh_api.get_vacancies("Python")
+
+
+def test_get_vacancies_multiple_pages_keep_order(hh_api, mocker):
+    def fake_get(url, params=None, **kwargs):
+        response = mocker.Mock()
+        response.status_code = 200
+        page = params["page"] if params else 0
+        response.json = lambda: {"items": [{"id": str(page)}], "pages": 5}
+        return response
+
+    mocker.patch.object(hh_api._session, 'get', side_effect=fake_get)
+
+    vacancies = hh_api.get_vacancies("Python", per_page=1, pages=3)
+    assert [v["id"] for v in vacancies] == ["0", "1", "2"]
+
+
+def test_get_vacancies_all_pages_respects_depth_limit(hh_api, mocker):
+    requested = []
+
+    def fake_get(url, params=None, **kwargs):
+        response = mocker.Mock()
+        response.status_code = 200
+        if params:
+            requested.append(params["page"])
+        response.json = lambda: {"items": [], "pages": 100}
+        return response
+
+    mocker.patch.object(hh_api._session, 'get', side_effect=fake_get)
+
+    hh_api.get_vacancies("Python", per_page=100, pages=None)
+    assert sorted(requested) == list(range(20))
+
+
+def test_get_vacancies_does_not_probe_before_search(hh_api, mocker):
+    mock_response = mocker.Mock()
+    mock_response.status_code = 200
+    mock_response.json = lambda: {"items": [{"id": "1"}]}
+    get = mocker.patch.object(hh_api._session, 'get', return_value=mock_response)
+
+    hh_api.get_vacancies("Python")
+    assert get.call_count == 1
+
+
+def test_get_vacancies_rejected_when_circuit_open(hh_api, mocker):
+    get = mocker.patch.object(hh_api._session, 'get', side_effect=RequestException)
+    for _ in range(3):
+        with pytest.raises(ConnectionError):
+            hh_api.get_vacancies("Python")
+
+    with pytest.raises(ConnectionError):
+        hh_api.get_vacancies("Python")
+    assert get.call_count == 3
+    assert hh_api.connect() is False
+
+
+def test_iter_vacancies_streams_pages(hh_api, mocker):
+    requested = []
+
+    def fake_get(url, params=None, **kwargs):
+        requested.append(params["page"])
+        response = mocker.Mock()
+        response.status_code = 200
+        page = params["page"]
+        response.json = lambda: {
+            "items": [{"id": f"{page}-{i}", "name": "Dev"} for i in range(2)],
+            "pages": 10,
+        }
+        return response
+
+    mocker.patch.object(hh_api._session, 'get', side_effect=fake_get)
+
+    stream = hh_api.iter_vacancies("Python", max_items=5, per_page=2)
+    first = next(stream)
+    assert first.url == "https://hh.ru/vacancy/0-0"
+    assert max(requested) <= 1
+
+    rest = list(stream)
+    assert [v.url[-3:] for v in rest] == ["0-1", "1-0", "1-1", "2-0"]
+    assert sorted(requested) == [0, 1, 2]
+
+
+def test_get_vacancy_returns_none_when_removed(hh_api, mocker):
+    missing = mocker.Mock()
+    missing.status_code = 404
+    mocker.patch.object(hh_api._session, 'get', return_value=missing)
+    assert hh_api.get_vacancy("123") is None
+
+
+def test_iter_pages_passes_search_filters(hh_api, mocker):
+    mock_response = mocker.Mock()
+    mock_response.status_code = 200
+    mock_response.json = lambda: {"items": [], "pages": 1}
+    get = mocker.patch.object(hh_api._session, 'get', return_value=mock_response)
+
+    list(hh_api.iter_pages("Python", filters={"date_from": "2024-01-15T10:00:00+0300"}))
+    assert get.call_args.kwargs["params"]["date_from"] == "2024-01-15T10:00:00+0300"
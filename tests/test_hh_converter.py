@@ -0,0 +1,87 @@
+import pytest
+
+from api.hh_converter import (clean_snippet, format_salary, iter_normalized_chunks, normalize_hh_items,
+                              vacancies_from_hh_items, vacancies_from_rows, vacancy_from_hh_item)
+
+
+def test_format_salary_skips_missing_bounds():
+    assert format_salary({"from": 100000, "to": 150000, "currency": "RUR"}) == "100000–150000 RUR"
+    assert format_salary({"from": None, "to": 150000, "currency": "RUR"}) == "до 150000 RUR"
+    assert format_salary({"from": 100000, "to": None, "currency": "RUR"}) == "от 100000 RUR"
+    assert format_salary({"from": None, "to": None, "currency": "RUR"}) is None
+    assert format_salary(None) is None
+
+
+def test_clean_snippet_removes_highlight_tags():
+    assert clean_snippet("Опыт работы с <highlighttext>Python</highlighttext>  от 3 лет") == \
+        "Опыт работы с Python от 3 лет"
+    assert clean_snippet(None) == ""
+
+
+def test_vacancy_from_hh_item():
+    vacancy = vacancy_from_hh_item({
+        "id": "42",
+        "name": "Python Developer",
+        "salary": {"from": 100000, "to": None, "currency": "RUR"},
+        "snippet": {"requirement": "Знание <highlighttext>Django</highlighttext>", "responsibility": None},
+    })
+    assert vacancy.url == "https://hh.ru/vacancy/42"
+    assert vacancy.salary_from == 100000
+    assert vacancy.description == "Знание Django"
+
+
+def test_vacancy_from_hh_item_without_snippet():
+    vacancy = vacancy_from_hh_item({"id": "1", "name": "QA", "snippet": None})
+    assert vacancy.salary == "Зарплата не указана"
+    assert vacancy.description == ""
+
+
+def test_vacancies_from_hh_items_reports_invalid():
+    errors = []
+    items = [{"id": "1", "name": "Dev"}, {"id": "2", "name": ""}, {"name": "No id"}]
+
+    vacancies = list(vacancies_from_hh_items(items, on_error=lambda item, e: errors.append(item)))
+    assert [v.url for v in vacancies] == ["https://hh.ru/vacancy/1"]
+    assert errors == items[1:]
+
+    with pytest.raises(StopIteration):
+        next(vacancies_from_hh_items([{"name": "No id"}]))
+
+
+def make_items(count):
+    return [
+        {"id": str(i), "name": f"Dev {i}" if i % 7 else "  ", "salary": {"from": 1000 * i, "currency": "RUR"},
+         "snippet": {"requirement": f"<highlighttext>Python</highlighttext> {i}"}}
+        for i in range(count)
+    ]
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_normalize_hh_items_keeps_order_and_reports_errors(workers):
+    items = make_items(50)
+    skipped = []
+
+    rows = normalize_hh_items(items, workers=workers, chunk_size=8, on_error=lambda item, e: skipped.append(item))
+
+    expected = [v for v in vacancies_from_hh_items(items)]
+    assert rows == [(v.title, v.url, v.salary, v.description) for v in expected]
+    assert [item["id"] for item in skipped] == [str(i) for i in range(0, 50, 7)]
+    assert [v.to_dict() for v in vacancies_from_rows(rows)] == [v.to_dict() for v in expected]
+    assert normalize_hh_items([], workers=workers) == []
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_iter_normalized_chunks_streams_with_bounded_read_ahead(workers):
+    consumed = []
+
+    def stream():
+        for item in make_items(100):
+            consumed.append(item)
+            yield item
+
+    chunks = iter_normalized_chunks(stream(), workers=workers, chunk_size=10, max_pending=2)
+    first = next(chunks)
+    assert [row[1] for row in first] == [f"https://hh.ru/vacancy/{i}" for i in range(10) if i % 7]
+    assert len(consumed) <= 30
+    rest = [row for rows in chunks for row in rows]
+    assert len(first) + len(rest) == 100 - len(range(0, 100, 7))
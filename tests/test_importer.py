@@ -0,0 +1,59 @@
+import json
+
+from storage.importer import import_raw_files, iter_raw_items
+from storage.json_saver import ConcreteJSONSaver
+
+
+def make_page(ids):
+    return {"items": [{"id": str(i), "name": f"Dev {i}", "salary": None, "snippet": {}} for i in ids]}
+
+
+def test_iter_raw_items_formats(tmp_path):
+    page = tmp_path / "page.json"
+    page.write_text(json.dumps(make_page([1, 2])), encoding="utf-8")
+    pages = tmp_path / "pages.json"
+    pages.write_text(json.dumps([make_page([3]), make_page([4])]), encoding="utf-8")
+    lines = tmp_path / "pages.jsonl"
+    lines.write_text(
+        json.dumps(make_page([5])) + "\n{обрыв\n\n" + json.dumps(make_page([6])["items"][0]) + "\n",
+        encoding="utf-8"
+    )
+
+    assert [item["id"] for item in iter_raw_items(str(page))] == ["1", "2"]
+    assert [item["id"] for item in iter_raw_items(str(pages))] == ["3", "4"]
+    assert [item["id"] for item in iter_raw_items(str(lines))] == ["5", "6"]
+
+
+def test_iter_raw_items_pretty_printed_json(tmp_path):
+    page = tmp_path / "page.json"
+    page.write_text(json.dumps(make_page([1, 2]), indent=2), encoding="utf-8")
+    assert [item["id"] for item in iter_raw_items(str(page))] == ["1", "2"]
+
+
+def test_iter_raw_items_skips_damaged_first_line(tmp_path):
+    lines = tmp_path / "pages.jsonl"
+    lines.write_text(
+        json.dumps(make_page([1]))[:20] + "\n" + json.dumps(make_page([2, 3])) + "\n",
+        encoding="utf-8"
+    )
+    assert [item["id"] for item in iter_raw_items(str(lines))] == ["2", "3"]
+
+
+def test_import_raw_files_into_json_saver(tmp_path, mocker):
+    first = tmp_path / "first.json"
+    first.write_text(json.dumps(make_page(range(10))), encoding="utf-8")
+    second = tmp_path / "second.json"
+    broken = make_page(range(10, 15))
+    broken["items"].append({"name": "Без id"})
+    second.write_text(json.dumps(broken), encoding="utf-8")
+    saver = ConcreteJSONSaver(str(tmp_path / "vacancies.json"))
+    skipped = []
+    upsert = mocker.spy(saver, "upsert_vacancies")
+
+    saved = import_raw_files([str(first), str(second)], saver, workers=2, chunk_size=4,
+                             on_error=lambda item, e: skipped.append(item))
+
+    assert saved == 15
+    assert upsert.call_count == 4  # пачки по 4 сохраняются по мере готовности
+    assert skipped == [{"name": "Без id"}]
+    assert [v["url"] for v in saver.get_vacancies()] == [f"https://hh.ru/vacancy/{i}" for i in range(15)]
@@ -0,0 +1,153 @@
+import pytest
+
+from crawler.incremental import IncrementalCrawler
+from storage.json_saver import ConcreteJSONSaver
+
+
+def make_item(vacancy_id, published_at, name="Python Dev", archived=False):
+    return {
+        "id": vacancy_id,
+        "name": name,
+        "published_at": published_at,
+        "archived": archived,
+        "salary": None,
+        "snippet": {"requirement": "Django"},
+    }
+
+
+class FakeAPI:
+    def __init__(self):
+        self.pages = []
+        self.filters = []
+        self.deleted = set()
+        self.checked = []
+
+    def iter_pages(self, query, per_page=100, filters=None):
+        self.filters.append(filters)
+        yield from self.pages
+
+    def get_vacancy(self, vacancy_id):
+        self.checked.append(vacancy_id)
+        return None if vacancy_id in self.deleted else {"id": vacancy_id}
+
+
+def make_crawler(tmp_path, api, clock):
+    saver = ConcreteJSONSaver(str(tmp_path / "vacancies.json"))
+    crawler = IncrementalCrawler(api, saver, str(tmp_path / "state.json"), recheck_limit=5, clock=clock)
+    return crawler, saver
+
+
+def test_first_sync_saves_everything_and_sets_watermark(tmp_path, clock):
+    api = FakeAPI()
+    api.pages = [[make_item("1", "2024-01-15T10:00:00+0300"), make_item("2", "2024-01-15T11:00:00+0300")]]
+    crawler, saver = make_crawler(tmp_path, api, clock)
+
+    stats = crawler.sync("python")
+    assert stats["new"] == 2
+    assert api.filters[0] == {"order_by": "publication_time"}
+    assert len(saver.get_vacancies()) == 2
+
+
+def test_second_sync_requests_only_newer_and_writes_only_changes(tmp_path, mocker, clock):
+    api = FakeAPI()
+    api.pages = [[make_item("1", "2024-01-15T10:00:00+0300"), make_item("2", "2024-01-15T11:00:00+0300")]]
+    crawler, saver = make_crawler(tmp_path, api, clock)
+    crawler.sync("python")
+
+    # Новый запуск с сохранённым состоянием
+    clock.now += 3600
+    crawler, saver = make_crawler(tmp_path, api, clock)
+    upsert = mocker.spy(saver, "upsert_vacancies")
+    api.pages = [[
+        make_item("3", "2024-01-15T12:00:00+0300"),
+        make_item("2", "2024-01-15T11:00:00+0300", name="Senior Python Dev"),
+        make_item("1", "2024-01-15T10:00:00+0300"),
+    ]]
+
+    stats = crawler.sync("python")
+    assert api.filters[-1]["date_from"] == "2024-01-15T10:50:00+0300"
+    assert (stats["new"], stats["changed"], stats["unchanged"]) == (1, 1, 1)
+    saved = upsert.call_args.args[0]
+    assert sorted(v.url for v in saved) == ["https://hh.ru/vacancy/2", "https://hh.ru/vacancy/3"]
+
+
+def test_sync_detects_removed_vacancies_lazily(tmp_path, clock):
+    api = FakeAPI()
+    api.pages = [[make_item("1", "2024-01-15T10:00:00+0300"), make_item("2", "2024-01-15T11:00:00+0300")]]
+    crawler, saver = make_crawler(tmp_path, api, clock)
+    crawler.sync("python")
+
+    clock.now += 3600
+    api.pages = [[make_item("3", "2024-01-15T12:00:00+0300", archived=True)]]
+    api.deleted = {"1"}
+    stats = crawler.sync("python")
+
+    assert stats["removed"] == 1
+    assert sorted(api.checked) == ["1", "2"]
+    assert [v["url"] for v in saver.get_vacancies()] == ["https://hh.ru/vacancy/2"]
+
+
+class FailingAPI(FakeAPI):
+    """Отдаёт первую страницу и падает на второй, как при обрыве соединения."""
+
+    def iter_pages(self, query, per_page=100, filters=None):
+        self.filters.append(filters)
+        yield self.pages[0]
+        raise ConnectionError("Ошибка подключения к API")
+
+
+def test_failed_sync_does_not_remember_unsaved_vacancies(tmp_path, clock):
+    api = FailingAPI()
+    api.pages = [[make_item("1", "2024-01-15T10:00:00+0300")]]
+    crawler, saver = make_crawler(tmp_path, api, clock)
+    with pytest.raises(ConnectionError):
+        crawler.sync("A")
+
+    crawler._api = FakeAPI()
+    crawler._api.pages = [[make_item("2", "2024-01-15T11:00:00+0300", name="Java Dev")]]
+    crawler.sync("B")  # Сохраняет состояние на диск
+
+    api = FakeAPI()
+    api.pages = [[make_item("1", "2024-01-15T10:00:00+0300")]]
+    crawler, saver = make_crawler(tmp_path, api, clock)
+    stats = crawler.sync("A")
+
+    assert (stats["new"], stats["unchanged"]) == (1, 0)
+    assert saver.exists("https://hh.ru/vacancy/1")
+
+
+class DepthLimitedAPI(FakeAPI):
+    """Как hh.ru: свежие публикации первыми, date_from/date_to включительно, не больше 2000 результатов."""
+
+    def __init__(self, items):
+        super().__init__()
+        self.items = sorted(items, key=lambda item: item["published_at"], reverse=True)
+
+    def iter_pages(self, query, per_page=100, filters=None):
+        self.filters.append(filters)
+        date_from, date_to = filters.get("date_from"), filters.get("date_to")
+        matching = [
+            item for item in self.items
+            if (date_from is None or item["published_at"] >= date_from)
+            and (date_to is None or item["published_at"] <= date_to)
+        ][:2000]
+        for start in range(0, len(matching), per_page):
+            yield matching[start:start + per_page]
+
+
+def test_sync_reads_past_hh_depth_limit_in_date_windows(tmp_path, clock):
+    items = [
+        make_item(str(i), f"2024-01-15T{10 + i // 3600:02}:{i // 60 % 60:02}:{i % 60:02}+0300")
+        for i in range(4500)
+    ]
+    api = DepthLimitedAPI(items)
+    crawler, saver = make_crawler(tmp_path, api, clock)
+
+    stats = crawler.sync("python")
+
+    assert stats["new"] == 4500
+    assert len(saver.get_vacancies()) == 4500
+    assert [f.get("date_to") for f in api.filters] == [
+        None, "2024-01-15T10:41:40+0300", "2024-01-15T10:08:21+0300"
+    ]
+    assert crawler.state.query("python")["watermark"] == "2024-01-15T11:14:59+0300"
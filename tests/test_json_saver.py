@@ -1,4 +1,13 @@
+import json
+import multiprocessing
 import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from models.vacancy import Vacancy
+from storage.json_saver import ConcreteJSONSaver
 
 
 def test_json_saver_add_vacancy(json_saver, sample_vacancy):
@@ -22,3 +31,249 @@ def test_json_saver_delete_vacancy(json_saver, sample_vacancy):
 
     # 3. Проверяем, что метод вернул True
     assert deleted is True
+
+
+def test_json_saver_add_vacancies_single_write(json_saver, sample_vacancy, mocker):
+    save = mocker.spy(json_saver, "_save_data")
+    other = Vacancy("QA", "https://hh.ru/vacancy/456")
+    added = json_saver.add_vacancies([sample_vacancy, other])
+
+    assert added == 2
+    assert save.call_count == 1
+    assert len(json_saver.get_vacancies()) == 2
+
+
+def test_json_saver_delete_vacancies(json_saver):
+    vacancies = [Vacancy(f"Dev {i}", f"https://hh.ru/vacancy/{i}") for i in range(4)]
+    json_saver.add_vacancies(vacancies)
+
+    deleted = json_saver.delete_vacancies({"https://hh.ru/vacancy/1", "https://hh.ru/vacancy/3", "https://x"})
+    assert deleted == 2
+    assert [v["url"] for v in json_saver.get_vacancies()] == ["https://hh.ru/vacancy/0", "https://hh.ru/vacancy/2"]
+
+
+def test_json_saver_upsert_vacancies(json_saver):
+    json_saver.add_vacancies([
+        Vacancy("Dev", "https://hh.ru/vacancy/1", "100 руб."),
+        Vacancy("QA", "https://hh.ru/vacancy/2"),
+    ])
+    json_saver.upsert_vacancies([
+        Vacancy("Senior Dev", "https://hh.ru/vacancy/1", "200 руб."),
+        Vacancy("PM", "https://hh.ru/vacancy/3"),
+    ])
+
+    data = json_saver.get_vacancies()
+    assert [v["title"] for v in data] == ["Senior Dev", "QA", "PM"]
+
+
+def test_json_saver_save_leaves_no_temp_files(json_saver, sample_vacancy):
+    json_saver.add_vacancies([sample_vacancy])
+    directory = os.path.dirname(os.path.abspath(json_saver.filepath))
+    assert not [name for name in os.listdir(directory) if name.startswith(".tmp-")]
+
+
+def test_json_saver_rejects_duplicate_url(json_saver, sample_vacancy, mocker):
+    assert json_saver.add_vacancy(sample_vacancy) is True
+    save = mocker.spy(json_saver, "_save_data")
+
+    assert json_saver.add_vacancy(sample_vacancy) is False
+    assert json_saver.add_vacancies([sample_vacancy, sample_vacancy]) == 0
+    assert save.call_count == 0
+    assert len(json_saver.get_vacancies()) == 1
+
+
+def test_json_saver_get_by_url_and_exists(json_saver, sample_vacancy):
+    json_saver.add_vacancy(sample_vacancy)
+
+    assert json_saver.exists(sample_vacancy.url) is True
+    assert json_saver.exists("https://hh.ru/vacancy/0") is False
+    assert json_saver.get_by_url(sample_vacancy.url) == sample_vacancy.to_dict()
+    assert json_saver.get_by_url("https://hh.ru/vacancy/0") is None
+
+
+def test_json_saver_lookup_uses_persisted_index(json_saver, sample_vacancy, mocker):
+    """Новый экземпляр находит вакансию по индексу, не разбирая весь файл."""
+    json_saver.add_vacancies([Vacancy("QA", "https://hh.ru/vacancy/1"), sample_vacancy])
+
+    fresh = type(json_saver)(json_saver.filepath)
+    load = mocker.spy(fresh, "_load_data")
+    assert fresh.get_by_url(sample_vacancy.url) == sample_vacancy.to_dict()
+    assert fresh.exists("https://hh.ru/vacancy/1") is True
+    assert load.call_count == 0
+
+
+def test_json_saver_collapses_duplicates_from_old_files(json_saver):
+    with open(json_saver.filepath, "w", encoding="utf-8") as f:
+        f.write('[{"title": "A", "url": "https://a", "salary": null, "description": ""},'
+                ' {"title": "B", "url": "https://a", "salary": null, "description": ""}]')
+
+    assert [v["title"] for v in json_saver.get_vacancies()] == ["A"]
+
+
+def test_json_saver_keyword_search_modes(json_saver):
+    json_saver.add_vacancies([
+        Vacancy("Python разработчик", "https://hh.ru/vacancy/1", description="Django, Git"),
+        Vacancy("Java разработчик", "https://hh.ru/vacancy/2", description="Spring, Git"),
+    ])
+
+    assert [v["url"] for v in json_saver.get_vacancies("разработчик git")] == [
+        "https://hh.ru/vacancy/1", "https://hh.ru/vacancy/2"
+    ]
+    assert [v["url"] for v in json_saver.get_vacancies("django spring", mode="or")] == [
+        "https://hh.ru/vacancy/1", "https://hh.ru/vacancy/2"
+    ]
+    assert [v["url"] for v in json_saver.get_vacancies("djan")] == ["https://hh.ru/vacancy/1"]
+
+    json_saver.delete_vacancy("https://hh.ru/vacancy/1")
+    json_saver.add_vacancy(Vacancy("Go разработчик", "https://hh.ru/vacancy/3", description="Django"))
+    assert [v["url"] for v in json_saver.get_vacancies("django")] == ["https://hh.ru/vacancy/3"]
+
+
+def _add_range(filepath, start, count):
+    saver = ConcreteJSONSaver(filepath)
+    for i in range(start, start + count):
+        saver.add_vacancy(Vacancy(f"Dev {i}", f"https://hh.ru/vacancy/{i}"))
+
+
+@pytest.mark.skipif("fork" not in multiprocessing.get_all_start_methods(), reason="нужен fork")
+def test_json_saver_concurrent_processes_do_not_lose_updates(tmp_path):
+    filepath = str(tmp_path / "vacancies.json")
+    context = multiprocessing.get_context("fork")
+    workers = [context.Process(target=_add_range, args=(filepath, n * 20, 20)) for n in range(4)]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+
+    urls = {v["url"] for v in ConcreteJSONSaver(filepath).get_vacancies()}
+    assert urls == {f"https://hh.ru/vacancy/{i}" for i in range(80)}
+
+
+def test_json_saver_group_commit_batches_threads(tmp_path, mocker):
+    saver = ConcreteJSONSaver(str(tmp_path / "vacancies.json"), group_commit=True, commit_delay=0.01)
+    save = mocker.spy(saver, "_save_data")
+    vacancies = [Vacancy(f"Dev {i}", f"https://hh.ru/vacancy/{i}") for i in range(40)]
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        results = list(executor.map(saver.add_vacancy, vacancies + vacancies[:5]))
+
+    assert results == [True] * 40 + [False] * 5
+    assert save.call_count < 40
+    assert len(ConcreteJSONSaver(saver.filepath).get_vacancies()) == 40
+
+
+def test_json_saver_group_commit_delay_does_not_block_readers(tmp_path, sample_vacancy):
+    saver = ConcreteJSONSaver(str(tmp_path / "vacancies.json"), group_commit=True, commit_delay=1.0)
+    saver.add_vacancy(Vacancy("QA", "https://hh.ru/vacancy/1"))
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        future = executor.submit(saver.add_vacancy, sample_vacancy)
+        time.sleep(0.1)  # Лидер группы ждёт commit_delay
+        started = time.monotonic()
+        assert saver.exists("https://hh.ru/vacancy/1")
+        assert not saver.exists(sample_vacancy.url)
+        assert time.monotonic() - started < 0.5
+        assert future.result() is True
+
+    assert saver.exists(sample_vacancy.url)
+
+
+def test_json_saver_failed_write_keeps_previous_file(tmp_path, mocker, sample_vacancy):
+    saver = ConcreteJSONSaver(str(tmp_path / "vacancies.json"))
+    saver.add_vacancy(sample_vacancy)
+    mocker.patch("storage.file_utils.os.replace", side_effect=OSError("disk full"))
+
+    with pytest.raises(OSError):
+        saver.add_vacancy(Vacancy("QA", "https://hh.ru/vacancy/1"))
+    mocker.stopall()
+
+    assert [v["url"] for v in saver.get_vacancies()] == [sample_vacancy.url]
+    assert not [name for name in os.listdir(tmp_path) if name.startswith(".tmp-")]
+
+
+def test_json_saver_caches_parsed_data_until_file_changes(json_saver, sample_vacancy, mocker):
+    json_saver.add_vacancy(sample_vacancy)
+    reader = ConcreteJSONSaver(json_saver.filepath)
+    load = mocker.spy(reader, "_load_data")
+
+    for _ in range(3):
+        reader.get_vacancies()
+        reader.get_vacancies("python")
+    assert load.call_count == 1
+
+    # Другой экземпляр заменяет файл записью того же размера
+    json_saver.upsert_vacancies([Vacancy("Javaист", sample_vacancy.url)])
+    assert [v["title"] for v in reader.get_vacancies()] == ["Javaист"]
+    assert load.call_count == 2
+
+
+def test_json_saver_read_only_views(json_saver, sample_vacancy):
+    json_saver.add_vacancy(sample_vacancy)
+
+    view = json_saver.get_vacancies(copy=False)[0]
+    assert view["url"] == sample_vacancy.url
+    with pytest.raises(TypeError):
+        view["title"] = "Другое"
+    assert json_saver.get_by_url(sample_vacancy.url, copy=False)["title"] == sample_vacancy.title
+
+    copy = json_saver.get_vacancies()[0]
+    copy["title"] = "Другое"
+    assert json_saver.get_vacancies()[0]["title"] == sample_vacancy.title
+
+
+def test_json_saver_output_does_not_depend_on_codec(tmp_path, monkeypatch):
+    vacancies = [
+        Vacancy("Python разработчик", "https://hh.ru/vacancy/1", "от 100 000 руб.", "Django «ORM»\n\tGit"),
+        Vacancy("QA", "https://hh.ru/vacancy/2"),
+    ]
+    fast = ConcreteJSONSaver(str(tmp_path / "fast.json"))
+    fast.add_vacancies(vacancies)
+    monkeypatch.setattr("storage.json_saver.orjson", None)
+    plain = ConcreteJSONSaver(str(tmp_path / "plain.json"))
+    plain.add_vacancies(vacancies)
+
+    with open(fast.filepath, "rb") as f, open(plain.filepath, "rb") as g:
+        assert f.read() == g.read()
+    with open(plain.filepath, encoding="utf-8") as f:
+        assert json.load(f) == [v.to_dict() for v in vacancies]
+
+
+def test_json_saver_index_lookup_survives_concurrent_replace(tmp_path, mocker):
+    filepath = str(tmp_path / "vacancies.json")
+    vacancies = [Vacancy(f"Dev {i:03}", f"https://hh.ru/vacancy/{i:03}") for i in range(5)]
+    ConcreteJSONSaver(filepath).add_vacancies(vacancies)
+    reader = ConcreteJSONSaver(filepath)
+    load_index = reader._load_index
+
+    def replace_after_open(stamp):
+        # Другой процесс удаляет вакансию между открытием файла и чтением записи
+        ConcreteJSONSaver(filepath).delete_vacancy("https://hh.ru/vacancy/000")
+        return load_index(stamp)
+
+    mocker.patch.object(reader, "_load_index", side_effect=replace_after_open)
+    assert reader.get_by_url("https://hh.ru/vacancy/002") == vacancies[2].to_dict()
+
+
+def test_json_saver_index_lookup_returns_read_only_view(json_saver, sample_vacancy):
+    json_saver.add_vacancy(sample_vacancy)
+    fresh = ConcreteJSONSaver(json_saver.filepath)
+
+    view = fresh.get_by_url(sample_vacancy.url, copy=False)
+    assert view == sample_vacancy.to_dict()
+    with pytest.raises(TypeError):
+        view["title"] = "Другое"
+
+
+@pytest.mark.skipif(os.name == "nt", reason="права POSIX")
+def test_json_saver_keeps_file_permissions(tmp_path, sample_vacancy):
+    """Атомарная замена не превращает файл в 0600 (права временного файла mkstemp)."""
+    saver = ConcreteJSONSaver(str(tmp_path / "vacancies.json"))
+    saver.add_vacancy(Vacancy("QA", "https://hh.ru/vacancy/1"))
+    umask = os.umask(0)
+    os.umask(umask)
+    assert os.stat(saver.filepath).st_mode & 0o777 == 0o666 & ~umask
+    assert os.stat(saver.index_path).st_mode & 0o777 == 0o666 & ~umask
+
+    os.chmod(saver.filepath, 0o640)
+    saver.add_vacancy(sample_vacancy)
+    assert os.stat(saver.filepath).st_mode & 0o777 == 0o640
@@ -0,0 +1,136 @@
+import os
+
+import pytest
+
+from models.vacancy import Vacancy
+from storage.jsonl_saver import JSONLinesSaver
+
+
+def make_vacancy(i, description="Django"):
+    return Vacancy(f"Dev {i}", f"https://hh.ru/vacancy/{i}", f"{i}000 руб.", description)
+
+
+def test_add_vacancy_appends_single_line(tmp_path):
+    """Добавление дописывает ровно одну строку, не переписывая файл."""
+    saver = JSONLinesSaver(str(tmp_path / "vacancies.jsonl"))
+    saver.add_vacancy(make_vacancy(1))
+    saver.add_vacancy(make_vacancy(2))
+
+    with open(saver.filepath, encoding="utf-8") as f:
+        assert len(f.readlines()) == 2
+    assert [v["url"] for v in saver.get_vacancies()] == [
+        "https://hh.ru/vacancy/1", "https://hh.ru/vacancy/2"
+    ]
+
+
+def test_delete_vacancy_writes_tombstone(tmp_path):
+    saver = JSONLinesSaver(str(tmp_path / "vacancies.jsonl"))
+    saver.add_vacancy(make_vacancy(1))
+    saver.add_vacancy(make_vacancy(2))
+
+    assert saver.delete_vacancy("https://hh.ru/vacancy/1") is True
+    assert saver.delete_vacancy("https://hh.ru/vacancy/1") is False
+    assert [v["url"] for v in saver.get_vacancies()] == ["https://hh.ru/vacancy/2"]
+
+
+def test_readd_after_delete_is_visible(tmp_path):
+    saver = JSONLinesSaver(str(tmp_path / "vacancies.jsonl"))
+    saver.add_vacancy(make_vacancy(1))
+    saver.delete_vacancy("https://hh.ru/vacancy/1")
+    saver.add_vacancy(make_vacancy(1))
+    assert len(saver.get_vacancies()) == 1
+
+
+def test_compact_drops_dead_records(tmp_path):
+    saver = JSONLinesSaver(str(tmp_path / "vacancies.jsonl"))
+    for i in range(5):
+        saver.add_vacancy(make_vacancy(i))
+    for i in range(3):
+        saver.delete_vacancy(f"https://hh.ru/vacancy/{i}")
+
+    saver.compact()
+    with open(saver.filepath, encoding="utf-8") as f:
+        assert len(f.readlines()) == 2
+    assert len(saver.get_vacancies()) == 2
+    assert os.listdir(tmp_path) == ["vacancies.jsonl"]
+
+
+def test_failed_compaction_keeps_previous_log(tmp_path, mocker):
+    saver = JSONLinesSaver(str(tmp_path / "vacancies.jsonl"))
+    saver.add_vacancies([make_vacancy(1), make_vacancy(2)])
+    saver.delete_vacancy("https://hh.ru/vacancy/1")
+    mocker.patch("storage.file_utils.os.replace", side_effect=OSError("disk full"))
+
+    with pytest.raises(OSError):
+        saver.compact()
+    mocker.stopall()
+
+    with open(saver.filepath, encoding="utf-8") as f:
+        assert len(f.readlines()) == 3
+    assert os.listdir(tmp_path) == ["vacancies.jsonl"]
+
+
+def test_automatic_background_compaction(tmp_path):
+    saver = JSONLinesSaver(str(tmp_path / "vacancies.jsonl"), compact_ratio=0.5, compact_min_lines=4)
+    for i in range(4):
+        saver.add_vacancy(make_vacancy(i))
+    saver.delete_vacancy("https://hh.ru/vacancy/0")
+    saver.delete_vacancy("https://hh.ru/vacancy/1")
+    saver.wait_for_compaction()
+
+    with open(saver.filepath, encoding="utf-8") as f:
+        assert len(f.readlines()) == 2
+
+
+def test_get_vacancies_by_keyword(tmp_path):
+    saver = JSONLinesSaver(str(tmp_path / "vacancies.jsonl"))
+    saver.add_vacancy(make_vacancy(1, "Django"))
+    saver.add_vacancy(make_vacancy(2, "React"))
+    assert [v["url"] for v in saver.get_vacancies("django")] == ["https://hh.ru/vacancy/1"]
+
+
+def test_get_vacancies_matches_words_like_json_saver(tmp_path):
+    saver = JSONLinesSaver(str(tmp_path / "vacancies.jsonl"))
+    saver.add_vacancies([
+        make_vacancy(1, "Django, объём данных"),
+        make_vacancy(2, "React"),
+        make_vacancy(3, "Django REST"),
+    ])
+
+    def urls(rows):
+        return [row["url"][-1] for row in rows]
+
+    assert urls(saver.get_vacancies("djang")) == ["1", "3"]
+    assert urls(saver.get_vacancies("djang", prefix=False)) == []
+    assert urls(saver.get_vacancies("jango")) == []
+    assert urls(saver.get_vacancies("DJANGO объем")) == ["1"]
+    assert urls(saver.get_vacancies("rest react", mode="or")) == ["2", "3"]
+
+
+def test_batch_methods_append_once(tmp_path):
+    saver = JSONLinesSaver(str(tmp_path / "vacancies.jsonl"))
+    saver.add_vacancies([make_vacancy(i) for i in range(3)])
+    assert saver.delete_vacancies(["https://hh.ru/vacancy/0", "https://hh.ru/vacancy/9"]) == 1
+
+    saver.upsert_vacancies([make_vacancy(1, "Flask"), make_vacancy(5)])
+    data = {v["url"]: v["description"] for v in saver.get_vacancies()}
+    assert data == {
+        "https://hh.ru/vacancy/2": "Django",
+        "https://hh.ru/vacancy/1": "Flask",
+        "https://hh.ru/vacancy/5": "Django",
+    }
+
+
+def test_upsert_tombstones_only_stored_urls_and_compacts(tmp_path):
+    saver = JSONLinesSaver(str(tmp_path / "vacancies.jsonl"), compact_ratio=0.5, compact_min_lines=10)
+    saver.upsert_vacancies([make_vacancy(i) for i in range(10)])
+    with open(saver.filepath, encoding="utf-8") as f:
+        assert len(f.readlines()) == 10
+
+    for _ in range(20):
+        saver.upsert_vacancies([make_vacancy(i) for i in range(10)])
+        saver.wait_for_compaction()
+
+    with open(saver.filepath, encoding="utf-8") as f:
+        assert len(f.readlines()) < 40
+    assert len(saver.get_vacancies()) == 10
@@ -0,0 +1,124 @@
+import io
+import logging
+import os
+
+import pytest
+
+from api.cache import ResponseCache
+from api.hh_api import HeadHunterAPI
+from crawler.batch import main
+from metrics import registry
+from metrics.exporters import LogExporter, PrometheusTextfileExporter, SnapshotExporter, format_prometheus
+from metrics.profiling import profile
+from metrics.registry import METRICS, Metrics
+from storage.json_saver import ConcreteJSONSaver
+
+
+@pytest.fixture
+def metrics():
+    METRICS.reset()
+    METRICS.enabled = True
+    yield METRICS
+    METRICS.enabled = False
+    METRICS.reset()
+
+
+def test_disabled_metrics_record_nothing():
+    metrics = Metrics()
+    metrics.incr("hh.requests")
+    with metrics.timer("storage.save"):
+        pass
+    assert metrics.snapshot() == {"counters": {}, "timers": {}}
+
+
+def test_counters_and_timers():
+    metrics = Metrics(enabled=True)
+    metrics.incr("hh.requests")
+    metrics.incr("hh.response_bytes", 512)
+    metrics.observe("storage.save", 0.5)
+    metrics.observe("storage.save", 0.25)
+
+    @metrics.timed("parse")
+    def parse():
+        return 42
+
+    assert parse() == 42
+    snapshot = metrics.snapshot()
+    assert snapshot["counters"] == {"hh.requests": 1, "hh.response_bytes": 512}
+    assert snapshot["timers"]["storage.save"] == {"count": 2, "total": 0.75, "max": 0.5}
+    assert snapshot["timers"]["parse"]["count"] == 1
+
+
+def test_exporters(tmp_path, caplog):
+    metrics = Metrics()
+    snapshots = SnapshotExporter()
+    textfile = PrometheusTextfileExporter(str(tmp_path / "hh.prom"))
+    registry.enable(snapshots, textfile, LogExporter(), registry=metrics)
+    metrics.incr("hh.requests", 3)
+    metrics.observe("storage.save", 0.5)
+
+    with caplog.at_level(logging.INFO, logger="metrics"):
+        metrics.export()
+
+    assert snapshots.last["counters"] == {"hh.requests": 3}
+    assert "metric hh.requests=3" in caplog.text
+    text = (tmp_path / "hh.prom").read_text(encoding="utf-8")
+    assert "hh_requests_total 3" in text
+    assert "storage_save_seconds_count 1" in text
+    assert "storage_save_seconds_sum 0.500000" in text
+    assert format_prometheus({"counters": {}, "timers": {}}) == "\n"
+
+
+@pytest.mark.skipif(os.name == "nt", reason="права POSIX")
+def test_prometheus_textfile_is_readable_by_collector(tmp_path):
+    """node_exporter обычно работает под другим пользователем: файл не должен быть 0600."""
+    path = tmp_path / "hh.prom"
+    path.write_text("", encoding="utf-8")
+    path.chmod(0o644)
+    PrometheusTextfileExporter(str(path)).export({"counters": {"hh.requests": 1}, "timers": {}})
+
+    assert path.stat().st_mode & 0o777 == 0o644
+    assert "hh_requests_total 1" in path.read_text(encoding="utf-8")
+
+
+def test_fetch_and_save_are_instrumented(metrics, hh_stub_server, tmp_path):
+    api = HeadHunterAPI(base_url=hh_stub_server.url, rate_limit=1000, cache=ResponseCache(ttl=60))
+    vacancies = list(api.iter_vacancies("python", max_items=20, per_page=10))
+    list(api.iter_vacancies("python", max_items=10, per_page=10))
+    ConcreteJSONSaver(str(tmp_path / "vacancies.json")).add_vacancies(vacancies)
+
+    snapshot = metrics.snapshot()
+    counters = snapshot["counters"]
+    assert counters["hh.requests"] == 2
+    assert counters["hh.cache_misses"] == 2
+    assert counters["hh.cache_hits"] == 1
+    assert counters["hh.response_bytes"] > 0
+    assert counters["vacancy.created"] == 30
+    assert counters["storage.saves"] == 1
+    assert counters["storage.records_changed"] == 20
+    assert counters["storage.bytes_written"] > 0
+    assert snapshot["timers"]["hh.request"]["count"] == 2
+    assert snapshot["timers"]["storage.save"]["count"] == 1
+
+
+def test_batch_cli_writes_metrics_file(hh_stub_server, tmp_path):
+    queries = tmp_path / "queries.txt"
+    queries.write_text("python | | 5\n", encoding="utf-8")
+    metrics_file = tmp_path / "hh.prom"
+
+    code = main([str(queries), "--output", str(tmp_path / "vacancies.json"), "--base-url", hh_stub_server.url,
+                 "--metrics-file", str(metrics_file)])
+
+    assert code == 0
+    assert "hh_requests_total 1" in metrics_file.read_text(encoding="utf-8")
+    assert METRICS.enabled is False
+    METRICS.reset()
+
+
+def test_profile_reports_functions_and_memory():
+    stream = io.StringIO()
+    with profile(memory=True, top=5, stream=stream):
+        sorted(str(i) for i in range(10000))
+    report = stream.getvalue()
+    assert "function calls" in report
+    assert "Пик памяти" in report
@@ -0,0 +1,55 @@
+from models.query import KeywordMatcher, filter_vacancies, search, top_n
+from models.vacancy import Vacancy
+
+
+def make_vacancies():
+    return [
+        Vacancy("A", "https://hh.ru/vacancy/1", "100 000 руб.", "Опыт работы с Git"),
+        Vacancy("B", "https://hh.ru/vacancy/2", None, "Django, PostgreSQL"),
+        Vacancy("C", "https://hh.ru/vacancy/3", "150 000 руб.", "Знание DJANGO"),
+        Vacancy("D", "https://hh.ru/vacancy/4", "100 000 руб.", "Docker"),
+    ]
+
+
+def test_keyword_matcher_is_case_insensitive_substring():
+    matcher = KeywordMatcher(["django", "GIT", ""])
+    assert matcher("Знание DJANGO") is True
+    assert matcher("опыт работы с gitlab") is True
+    assert matcher("Docker") is False
+    assert KeywordMatcher([])("что угодно") is True
+    assert KeywordMatcher(["c++"])("Знание C++") is True
+    assert KeywordMatcher(["Straße"])("Straße") is True
+    assert KeywordMatcher(["ПИТОН"])("питон") is True
+
+
+def test_filter_vacancies_is_lazy():
+    def stream():
+        yield from make_vacancies()
+        raise AssertionError("поток прочитан дальше, чем нужно")
+
+    filtered = filter_vacancies(stream(), ["django"])
+    assert next(filtered).title == "B"
+
+
+def test_top_n_matches_full_sort():
+    vacancies = make_vacancies()
+    expected = sorted(vacancies, key=lambda v: v.get_salary_value() or 0, reverse=True)[:3]
+    assert top_n(iter(vacancies), 3) == expected
+    assert [v.title for v in top_n(vacancies, 3)] == ["C", "A", "D"]
+    assert top_n(vacancies, 0) == []
+
+
+def test_search_combines_filter_and_top_n():
+    assert [v.title for v in search(make_vacancies(), ["django", "git"], n=2)] == ["C", "A"]
+    assert [v.title for v in search(make_vacancies(), ["django"])] == ["C", "B"]
+
+
+def test_top_n_ranks_upper_only_salary_by_its_bound():
+    """«до N» сортируется по N, а не как вакансия без зарплаты."""
+    vacancies = [
+        Vacancy("A", "https://hh.ru/vacancy/1", "от 30000 RUR"),
+        Vacancy("B", "https://hh.ru/vacancy/2", "до 300000 RUR"),
+        Vacancy("C", "https://hh.ru/vacancy/3"),
+    ]
+    assert [v.title for v in top_n(vacancies, 3)] == ["B", "A", "C"]
+    assert sorted(vacancies)[-1].title == "B"
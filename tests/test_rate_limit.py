@@ -0,0 +1,75 @@
+import pytest
+import requests
+
+from api.hh_api import HeadHunterAPI
+from api.rate_limit import RetryPolicy, TokenBucket, parse_retry_after, shared_bucket
+
+
+def test_token_bucket_queues_requests(clock):
+    """При пустом ведре каждый следующий запрос ждёт дольше предыдущего."""
+    bucket = TokenBucket(rate=2, capacity=2, clock=clock)
+    assert bucket.reserve() == 0
+    assert bucket.reserve() == 0
+    assert bucket.reserve() == pytest.approx(0.5)
+    assert bucket.reserve() == pytest.approx(1.0)
+
+    clock.now = 10
+    assert bucket.reserve() == 0
+
+
+def test_token_bucket_adapts_rate(clock):
+    bucket = TokenBucket(rate=8, min_rate=1, increase_step=1, clock=clock)
+    bucket.on_throttled()
+    assert bucket.rate == 4
+    for _ in range(3):
+        bucket.on_throttled()
+    assert bucket.rate == 1
+    for _ in range(20):
+        bucket.on_success()
+    assert bucket.rate == 8
+
+
+def test_shared_bucket_is_process_wide():
+    assert shared_bucket("test-host") is shared_bucket("test-host")
+    assert shared_bucket("test-host") is not shared_bucket("other-host")
+
+
+def test_parse_retry_after():
+    assert parse_retry_after("5") == 5
+    assert parse_retry_after("Wed, 21 Oct 2015 07:28:10 GMT", now=1445412480) == 10
+    assert parse_retry_after("garbage") is None
+    assert parse_retry_after(None) is None
+
+
+def test_retry_policy_backoff_with_jitter():
+    policy = RetryPolicy(backoff_base=1, backoff_max=5, rng=lambda: 0.5)
+    assert policy.backoff(0) == 0.5
+    assert policy.backoff(2) == 2
+    assert policy.backoff(10) == 2.5
+    assert policy.backoff(0, retry_after="3") == 3
+
+
+def test_hh_api_retries_transient_errors(mocker, make_response):
+    api = HeadHunterAPI(retry=RetryPolicy(max_retries=3, rng=lambda: 1))
+    sleeps = []
+    api._sleep = sleeps.append
+    get = mocker.patch.object(api._session, 'get', side_effect=[
+        make_response(503),
+        make_response(429, headers={"Retry-After": "2"}),
+        make_response(200, payload={"items": [{"id": "1"}]}),
+    ])
+
+    assert api.get_vacancies("Python") == [{"id": "1"}]
+    assert get.call_count == 3
+    assert sleeps == [0.5, 2.0]
+    assert api.rate_limiter.rate < 10
+
+
+def test_hh_api_gives_up_after_max_retries(mocker):
+    api = HeadHunterAPI(retry=RetryPolicy(max_retries=2))
+    api._sleep = lambda delay: None
+    get = mocker.patch.object(api._session, 'get', side_effect=requests.Timeout)
+
+    with pytest.raises(ConnectionError):
+        api.get_vacancies("Python")
+    assert get.call_count == 3
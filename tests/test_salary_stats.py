@@ -0,0 +1,71 @@
+import numpy as np
+import pytest
+
+from analytics.salary_stats import SalaryArrays, filter_range, group_by_currency, histogram, percentiles, top_n
+from models.vacancy import Vacancy
+from models.vacancy_table import VacancyTable
+
+
+@pytest.fixture
+def vacancies():
+    return [
+        Vacancy("A", "https://hh.ru/vacancy/1", "100 000–150 000 RUR"),
+        Vacancy("B", "https://hh.ru/vacancy/2"),
+        Vacancy("C", "https://hh.ru/vacancy/3", "3000 USD"),
+        Vacancy("D", "https://hh.ru/vacancy/4", "200 000 RUR"),
+        Vacancy("E", "https://hh.ru/vacancy/5", "80 000–120 000 RUR"),
+    ]
+
+
+def test_salary_arrays_from_vacancies_and_table(vacancies):
+    """Массивы из списка вакансий и из VacancyTable совпадают."""
+    arrays = SalaryArrays.from_vacancies(vacancies)
+    assert arrays.missing.tolist() == [False, True, False, False, False]
+    assert arrays.currencies == [None, "RUR", "USD"]
+
+    from_table = SalaryArrays.from_table(VacancyTable(vacancies))
+    np.testing.assert_array_equal(from_table.salary_from, arrays.salary_from)
+    np.testing.assert_array_equal(from_table.currency_codes, arrays.currency_codes)
+
+
+def test_salary_arrays_from_hh_items():
+    items = [
+        {"salary": {"from": 100000, "to": None, "currency": "RUR"}},
+        {"salary": None},
+    ]
+    arrays = SalaryArrays.from_hh_items(items)
+    assert arrays.salary_from[0] == 100000
+    assert arrays.missing.tolist() == [False, True]
+
+
+def test_top_n_and_filter_range(vacancies):
+    arrays = SalaryArrays.from_vacancies(vacancies)
+    assert top_n(arrays, 2).tolist() == [3, 0]
+    assert top_n(arrays, 10, by="to").tolist() == [3, 0, 4, 2]
+    assert filter_range(arrays, 90000, 200000, currency="RUR").tolist() == [0, 3]
+    assert filter_range(arrays, by="mid", salary_min=125000).tolist() == [0, 3]
+
+
+def test_aggregates(vacancies):
+    arrays = SalaryArrays.from_vacancies(vacancies)
+    assert percentiles(arrays, q=(50,), currency="RUR") == {50: 100000.0}
+
+    counts, edges = histogram(arrays, bins=2, currency="RUR")
+    assert counts.tolist() == [2, 1]
+
+    stats = group_by_currency(arrays)
+    assert stats["RUR"]["count"] == 3
+    assert stats["RUR"]["mean"] == pytest.approx(380000 / 3)
+    assert stats["USD"]["max"] == 3000
+    assert None not in stats
+
+
+def test_salary_arrays_open_ranges_from_formatted_salaries():
+    vacancies = [
+        Vacancy("A", "https://hh.ru/vacancy/1", "от 100000 RUR"),
+        Vacancy("B", "https://hh.ru/vacancy/2", "до 150000 RUR"),
+    ]
+    arrays = SalaryArrays.from_vacancies(vacancies)
+    assert np.isnan(arrays.salary_to[0]) and np.isnan(arrays.salary_from[1])
+    assert arrays.values("mid").tolist() == [100000, 150000]
+    assert arrays.missing.tolist() == [False, False]
@@ -0,0 +1,82 @@
+import pytest
+
+from models.vacancy import Vacancy
+from storage.sqlite_saver import SQLiteSaver
+
+
+@pytest.fixture
+def sqlite_saver(tmp_path):
+    with SQLiteSaver(str(tmp_path / "vacancies.db")) as saver:
+        yield saver
+
+
+@pytest.fixture
+def filled_saver(sqlite_saver):
+    sqlite_saver.add_vacancies([
+        Vacancy("Python разработчик", "https://hh.ru/vacancy/1", "100 000 руб.", "Django, опыт от 3 лет"),
+        Vacancy("Java Developer", "https://hh.ru/vacancy/2", "200 000 руб.", "Spring"),
+        Vacancy("QA Engineer", "https://hh.ru/vacancy/3", None, "Тестирование"),
+        Vacancy("Backend-разработчик", "https://hh.ru/vacancy/4", "150 000 руб.", "Python, объём данных"),
+    ])
+    return sqlite_saver
+
+
+def test_sqlite_add_rejects_duplicates(sqlite_saver, sample_vacancy):
+    assert sqlite_saver.add_vacancy(sample_vacancy) is True
+    assert sqlite_saver.add_vacancy(sample_vacancy) is False
+    assert len(sqlite_saver) == 1
+    assert sqlite_saver.get_by_url(sample_vacancy.url) == sample_vacancy.to_dict()
+
+
+def test_sqlite_delete_and_upsert(filled_saver):
+    assert filled_saver.delete_vacancy("https://hh.ru/vacancy/1") is True
+    assert filled_saver.delete_vacancy("https://hh.ru/vacancy/1") is False
+    assert filled_saver.delete_vacancies(["https://hh.ru/vacancy/2", "https://x"]) == 1
+
+    filled_saver.upsert_vacancies([Vacancy("Senior QA", "https://hh.ru/vacancy/3", "90 000 руб.")])
+    assert filled_saver.get_by_url("https://hh.ru/vacancy/3")["title"] == "Senior QA"
+    assert filled_saver.exists("https://hh.ru/vacancy/2") is False
+    assert len(filled_saver) == 2
+
+
+def test_sqlite_keyword_search(filled_saver):
+    def urls(rows):
+        return [row["url"][-1] for row in rows]
+
+    assert urls(filled_saver.get_vacancies("разработчик")) == ["1", "4"]
+    assert urls(filled_saver.get_vacancies("python django")) == ["1"]
+    assert urls(filled_saver.get_vacancies("spring тестирование", mode="or")) == ["2", "3"]
+    assert urls(filled_saver.get_vacancies("объем")) == ["4"]
+
+    filled_saver.upsert_vacancies([Vacancy("Go Developer", "https://hh.ru/vacancy/1", description="gRPC")])
+    assert urls(filled_saver.get_vacancies("django")) == []
+
+
+def test_sqlite_like_fallback_folds_unicode_case(filled_saver):
+    filled_saver.has_fts = False  # Как при SQLite без FTS5
+
+    def urls(rows):
+        return [row["url"][-1] for row in rows]
+
+    assert urls(filled_saver.get_vacancies("РАЗРАБОТЧИК")) == ["1", "4"]
+    assert urls(filled_saver.get_vacancies("ОБЪЕМ")) == ["4"]
+    assert urls(filled_saver.get_vacancies("Тестирование QA")) == ["3"]
+    assert filled_saver.get_vacancies("python_dev") == []
+
+
+def test_sqlite_salary_queries(filled_saver):
+    in_range = filled_saver.get_by_salary_range(120000, 250000)
+    assert [row["url"][-1] for row in in_range] == ["4", "2"]
+
+    top = filled_saver.top_by_salary(2)
+    assert [row["url"][-1] for row in top] == ["2", "4"]
+    assert [row["url"][-1] for row in filled_saver.top_by_salary(5, keyword="python")] == ["4", "1"]
+
+
+def test_sqlite_upper_only_salary_is_indexed(sqlite_saver):
+    sqlite_saver.add_vacancies([
+        Vacancy("A", "https://hh.ru/vacancy/1", "от 30000 руб."),
+        Vacancy("B", "https://hh.ru/vacancy/2", "до 300000 руб."),
+    ])
+    assert [row["title"] for row in sqlite_saver.top_by_salary(2)] == ["B", "A"]
+    assert [row["title"] for row in sqlite_saver.get_by_salary_range(100000)] == ["B"]
@@ -0,0 +1,38 @@
+from storage.text_index import InvertedIndex, tokenize
+
+
+def make_index():
+    index = InvertedIndex()
+    index.add("1", "Python разработчик", "Опыт работы с Django и PostgreSQL")
+    index.add("2", "Java Developer", "Spring, опыт от 3 лет")
+    index.add("3", "Backend-разработчик", "Python, FastAPI")
+    return index
+
+
+def test_tokenize_casefolds_russian_and_english():
+    assert tokenize("Python-Разработчик, Ёлка") == ["python", "разработчик", "елка"]
+
+
+def test_search_and_or():
+    index = make_index()
+    assert index.search("python разработчик") == ["1", "3"]
+    assert index.search("django spring") == []
+    assert index.search("django spring", mode=InvertedIndex.OR) == ["1", "2"]
+
+
+def test_search_prefix():
+    index = make_index()
+    assert index.search("разраб") == []
+    assert index.search("разраб", prefix=True) == ["1", "3"]
+
+
+def test_incremental_update_and_remove():
+    index = make_index()
+    index.add("2", "Kotlin Developer", "Android")
+    assert index.search("spring") == []
+    assert index.search("kotlin") == ["2"]
+
+    assert index.remove("1") is True
+    assert index.remove("1") is False
+    assert index.search("python") == ["3"]
+    assert len(index) == 2
@@ -1,5 +1,6 @@
 import pytest
 
+from api.hh_converter import format_salary
 from models.vacancy import Vacancy
 
 
@@ -133,3 +134,87 @@ def test_vacancy_update_salary():
 
     vacancy.salary = None
     assert vacancy.salary == "Зарплата не указана"
+
+
+def test_vacancy_parsed_salary_fields():
+    """Проверка разбора зарплаты на границы и валюту."""
+    vacancy = Vacancy("Dev", "https://...", "от 80 000 до 120 000 руб.")
+    assert vacancy.salary_from == 80000
+    assert vacancy.salary_to == 120000
+    assert vacancy.currency == "руб."
+
+    single = Vacancy("Dev", "https://...", "100000 RUR")
+    assert (single.salary_from, single.salary_to, single.currency) == (100000, 100000, "RUR")
+
+    empty = Vacancy("Dev", "https://...")
+    assert (empty.salary_from, empty.salary_to, empty.currency) == (None, None, None)
+
+
+def test_vacancy_salary_setter_refreshes_parsed_fields():
+    """Кэш разобранной зарплаты сбрасывается при изменении зарплаты."""
+    vacancy = Vacancy("Dev", "https://...", "100000 руб.")
+    vacancy.salary = "150 000–200 000 USD"
+    assert vacancy.get_salary_value() == 150000
+    assert vacancy.salary_to == 200000
+    assert vacancy.currency == "USD"
+
+    vacancy.salary = None
+    assert vacancy.get_salary_value() is None
+
+
+def test_vacancy_sorting_uses_parsed_salary():
+    vacancies = [
+        Vacancy("A", "https://...", "80 000 руб."),
+        Vacancy("B", "https://..."),
+        Vacancy("C", "https://...", "120 000 руб."),
+    ]
+    assert [v.title for v in sorted(vacancies)] == ["B", "A", "C"]
+
+
+def test_vacancy_from_dicts_trusted_matches_validated():
+    """Доверенная загрузка даёт те же вакансии, что и загрузка с проверкой."""
+    records = [
+        Vacancy("Python Dev", "https://hh.ru/vacancy/1", "100 000–150 000 руб.", "Django").to_dict(),
+        Vacancy("QA", "https://hh.ru/vacancy/2").to_dict(),
+    ]
+    trusted = Vacancy.from_dicts(records, validate=False)
+    validated = Vacancy.from_dicts(records)
+
+    assert [v.to_dict() for v in trusted] == records
+    assert [v.to_dict() for v in validated] == records
+    assert [(v.salary_from, v.salary_to) for v in trusted] == [(100000, 150000), (None, None)]
+
+
+def test_vacancy_validate_records_collects_errors():
+    """Пакетная проверка сообщает об ошибках каждой записи, не прерываясь."""
+    records = [
+        {"title": "Dev", "url": "https://hh.ru/vacancy/1"},
+        {"title": "", "url": "https://hh.ru/vacancy/2"},
+        {"title": "Dev", "url": "ftp://example.com"},
+        {"url": "https://hh.ru/vacancy/4"},
+    ]
+    vacancies, errors = Vacancy.validate_records(records)
+
+    assert [v.url for v in vacancies] == ["https://hh.ru/vacancy/1"]
+    assert [index for index, _ in errors] == [1, 2, 3]
+    assert errors[1][1] == "Некорректный формат URL"
+
+
+@pytest.mark.parametrize("salary, bounds", [
+    ({"from": 100000, "to": 150000, "currency": "RUR"}, (100000, 150000)),
+    ({"from": 100000, "to": None, "currency": "RUR"}, (100000, None)),
+    ({"from": None, "to": 150000, "currency": "RUR"}, (None, 150000)),
+])
+def test_vacancy_parses_format_salary_output(salary, bounds):
+    """Строки от api.hh_converter.format_salary разбираются в те же границы."""
+    vacancy = Vacancy("Dev", "https://hh.ru/vacancy/1", format_salary(salary))
+    assert (vacancy.salary_from, vacancy.salary_to) == bounds
+    assert vacancy.currency == "RUR"
+    assert vacancy.get_salary_value() == (bounds[0] if bounds[0] is not None else bounds[1])
+
+
+def test_vacancy_open_salary_bounds_in_russian_text():
+    upper_only = Vacancy("Dev", "https://x.ru", "до 150 000 руб.")
+    assert (upper_only.salary_from, upper_only.salary_to) == (None, 150000)
+    assert Vacancy("Dev", "https://x.ru", "от 80 000 руб.").salary_to is None
+    assert Vacancy("Dev", "https://x.ru", "90 000 руб.").salary_to == 90000
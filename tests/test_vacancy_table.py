@@ -0,0 +1,45 @@
+import pytest
+
+from models.vacancy import Vacancy
+from models.vacancy_table import MISSING, PackedStrings, VacancyTable
+
+
+def test_packed_strings_roundtrip():
+    strings = PackedStrings()
+    for value in ["https://hh.ru/vacancy/1", "", "Разработчик"]:
+        strings.append(value)
+    assert [strings[i] for i in range(len(strings))] == ["https://hh.ru/vacancy/1", "", "Разработчик"]
+    assert strings[-1] == "Разработчик"
+    with pytest.raises(IndexError):
+        strings[3]
+
+
+def test_vacancy_table_returns_equal_vacancies(sample_vacancies):
+    """Таблица отдаёт вакансии с теми же данными, что были добавлены."""
+    table = VacancyTable(sample_vacancies)
+
+    assert len(table) == 3
+    assert [v.to_dict() for v in table] == [v.to_dict() for v in sample_vacancies]
+    assert table[-1].salary == "Зарплата не указана"
+
+
+def test_vacancy_table_columns():
+    table = VacancyTable([
+        Vacancy("Dev", "https://hh.ru/vacancy/1", "100 000–150 000 руб."),
+        Vacancy("Dev", "https://hh.ru/vacancy/2"),
+    ])
+    assert list(table.salary_from) == [100000, MISSING]
+    assert list(table.salary_to) == [150000, MISSING]
+    assert table.currency(0) == "руб."
+    assert table.currency(1) is None
+    assert table.title(0) is table.title(1)
+    assert table.url(1) == "https://hh.ru/vacancy/2"
+    assert table.currencies == (None, "руб.")
+    codes = table.currency_codes
+    assert codes.readonly and codes.tolist() == [1, 0]
+
+
+def test_vacancy_has_no_instance_dict():
+    vacancy = Vacancy("Dev", "https://hh.ru/vacancy/1")
+    with pytest.raises(AttributeError):
+        vacancy.extra = 1